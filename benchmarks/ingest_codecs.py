@@ -0,0 +1,148 @@
+"""
+Benchmark of the dataset ingestion throughput per compression codec.
+
+Builds an enlarged copy of a bundled dataset (its rows repeated),
+stores it uncompressed and with every supported codec, then times
+`utils.load` on each file:
+- cold: CSV decompression and parsing (the cache is ignored),
+- chunked: the same, streamed by chunks of rows,
+- cached: reloading from the parsed-data cache.
+
+The throughput is given in MB of uncompressed CSV per second.
+
+Usage:
+python3 benchmarks/ingest_codecs.py [--repeat N] [--chunk-size ROWS]
+"""
+
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+)
+
+from utils import load  # noqa: E402
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DATASET = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "data",
+    "population_total.csv"
+)
+
+CODECS = {
+    ".csv": None,
+    ".csv.gz": gzip.compress,
+    ".csv.bz2": bz2.compress,
+    ".csv.xz": lzma.compress,
+    ".csv.zst": None if zstandard is None else (
+        lambda data: zstandard.ZstdCompressor().compress(data)
+    ),
+}
+
+
+def build_csv(repeat: int) -> bytes:
+    """
+    Returns the bundled dataset with its data rows repeated,
+    each copy with its own entity names.
+
+    Args:
+        repeat (int): The number of copies of the data rows.
+
+    Returns:
+        bytes: The enlarged CSV content.
+    """
+
+    with open(DATASET, "rb") as file:
+        header, *rows = file.read().splitlines()
+
+    lines = [header]
+    for copy in range(repeat):
+        suffix = f" {copy}".encode()
+        for row in rows:
+            name, rest = row.split(b",", 1)
+            lines.append(name + suffix + b"," + rest)
+
+    return b"\n".join(lines) + b"\n"
+
+
+def best_time(
+    function,
+    runs: int
+) -> float:
+    """
+    Returns the best duration (in seconds) of several runs of `function`.
+    """
+
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main() -> None:
+    """Runs the benchmark and prints one line per codec."""
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    content = build_csv(args.repeat)
+    size_mb = len(content) / 1e6
+    print(
+        f"Dataset: {os.path.basename(DATASET)} x{args.repeat} "
+        f"({size_mb:.1f} MB uncompressed)\n"
+    )
+    print(
+        f"{'codec':<10}{'size (MB)':>11}{'cold (MB/s)':>13}"
+        f"{'chunked (MB/s)':>16}{'cached (MB/s)':>15}"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        for extension, compress in CODECS.items():
+            if compress is None and extension != ".csv":
+                print(f"{extension:<10}skipped (zstandard is not installed)")
+                continue
+
+            path = os.path.join(directory, f"dataset{extension}")
+            with open(path, "wb") as file:
+                file.write(content if compress is None else compress(content))
+
+            cold = best_time(lambda: load(path, use_cache=False), args.runs)
+            chunked = best_time(
+                lambda: load(
+                    path,
+                    use_cache=False,
+                    chunk_size=args.chunk_size
+                ),
+                args.runs
+            )
+            load(path)
+            cached = best_time(lambda: load(path), args.runs)
+
+            print(
+                f"{extension:<10}{os.path.getsize(path) / 1e6:>11.1f}"
+                f"{size_mb / cold:>13.1f}{size_mb / chunked:>16.1f}"
+                f"{size_mb / cached:>15.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
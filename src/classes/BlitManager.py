@@ -0,0 +1,174 @@
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import DrawEvent, FigureCanvasBase
+
+
+class BlitManager:
+    """
+    Redraws a set of animated artists over a cached background of the
+    figure, instead of redrawing the whole figure (blitting).
+
+    The animated artists are left out of the full draws of the figure
+    (but not of the saved figures): after each full draw, the figure
+    without them is cached as the background, then they are drawn over
+    it. An update then only restores the background, draws the animated
+    artists and blits the figure: the static artists (correlation graphs,
+    colorbar, labels, ticks, ...) are not redrawn.
+    An animated artist can be a whole Axes, e.g. one cleared and replotted
+    at each update: its ticks, labels and title are then animated too.
+
+    The cached background stays valid as long as the view limits of the
+    watched axes do not change (their ticks are part of it): an update
+    after any such change falls back to a full draw.
+
+    Attributes:
+        artists (list[Artist]):
+            The animated artists, in drawing order.
+        background (object | None):
+            The cached figure background (None: not drawn yet).
+        canvas (FigureCanvasBase):
+            The canvas of the figure.
+        draw_cid (int):
+            The id of the `draw_event` callback connection.
+        view_limits (list[tuple[float, ...]]):
+            The view limits of the watched axes at the last full draw.
+        watched_axes (list[Axes]):
+            The axes whose view limits are part of the background.
+    """
+
+    def __init__(
+        self,
+        canvas: FigureCanvasBase,
+        watched_axes: list[Axes] | None = None
+    ):
+        """
+        Initializes a BlitManager object, without any animated artist.
+
+        Parameters:
+            canvas (FigureCanvasBase):
+                The canvas of the figure, which must support blitting
+                (see `FigureCanvasBase.supports_blit`).
+            watched_axes (list[Axes] | None):
+                The axes whose view limits are part of the background.
+        """
+
+        self.artists: list[Artist] = []
+        self.background: object | None = None
+        self.canvas: FigureCanvasBase = canvas
+        self.view_limits: list[tuple[float, ...]] = []
+        self.watched_axes: list[Axes] = list(watched_axes or [])
+        self.draw_cid: int = canvas.mpl_connect("draw_event", self.on_draw)
+
+    def show(self) -> None:
+        """The class show method for a BlitManager class object"""
+
+        print("\n=== SHOW BlitManager class object (START) ===")
+
+        print(f"Animated Artists: {len(self.artists)}")
+        print(f"Watched Axes: {len(self.watched_axes)}")
+        print(f"Background Cached: {self.background is not None}")
+
+        print("\n=== SHOW BlitManager class object (END) ===")
+
+    def add_artist(self, artist: Artist) -> None:
+        """
+        Animates an artist: it is then only drawn by the blit manager.
+
+        Parameters:
+            artist (Artist):
+                An artist of the figure of the canvas.
+        """
+
+        artist.set_animated(True)
+        self.artists.append(artist)
+
+    def remove_artist(self, artist: Artist) -> None:
+        """
+        Stops animating an artist (e.g., before removing it).
+
+        Parameters:
+            artist (Artist): An animated artist.
+        """
+
+        if artist in self.artists:
+            self.artists.remove(artist)
+            artist.set_animated(False)
+
+    def watch_axes(self, ax: Axes) -> None:
+        """
+        Adds an axes whose view limits are part of the background:
+        changing them then invalidates it.
+
+        Parameters:
+            ax (Axes): An axes of the figure of the canvas.
+        """
+
+        if ax not in self.watched_axes:
+            self.watched_axes.append(ax)
+
+    def get_view_limits(self) -> list[tuple[float, ...]]:
+        """Returns the current view limits of the watched axes."""
+
+        return [tuple(ax.viewLim.bounds) for ax in self.watched_axes]
+
+    def on_draw(self, event: DrawEvent | None) -> None:
+        """
+        Caches the background after a full draw of the figure,
+        then draws the animated artists over it.
+
+        A saved figure is drawn with the animated artists of the axes,
+        but without the animated axes themselves (the figure leaves
+        its animated children out even when saving): those are drawn
+        on it here, with the renderer of the saved figure.
+
+        Args:
+            event (DrawEvent | None): The triggering draw event.
+        """
+
+        if self.canvas.is_saving():
+            children = self.canvas.figure.get_children()
+            for artist in self.artists:
+                if artist in children and artist.get_visible():
+                    artist.draw(event.renderer)
+            return
+
+        self.background = self.canvas.copy_from_bbox(
+            self.canvas.figure.bbox
+        )
+        self.view_limits = self.get_view_limits()
+        self.draw_artists()
+
+    def draw_artists(self) -> None:
+        """Draws the (visible) animated artists."""
+
+        figure = self.canvas.figure
+        for artist in self.artists:
+            if artist.get_visible():
+                figure.draw_artist(artist)
+
+    def update(
+        self,
+        full: bool = False
+    ) -> None:
+        """
+        Redraws the animated artists over the cached background,
+        or the whole figure if the background is not valid anymore.
+
+        Args:
+            full (bool):
+                True if a static artist changed (e.g., its visibility),
+                which requires a full draw.
+        """
+
+        if (
+            full
+            or self.background is None
+            or self.view_limits != self.get_view_limits()
+        ):
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self.background)
+        self.draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
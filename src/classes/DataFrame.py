@@ -1,34 +1,99 @@
+import numpy as np
 import pandas as pd
 from utils import (
-    cust_suffixed_string_to_float,
+    column_selection_key,
     get_data_name,
+    is_long_layout,
     load,
+    suffixed_strings_to_float,
     var_print_str,
 )
 
+# Below this share of non-missing values, a wide dataset is stored sparse
+SPARSE_FILL_RATIO = 0.25
+
 
 class DataFrame:
     """
     Represents a data structure to handle and process
     CSV or other tabular data.
 
+    Two dataset layouts are supported (see `utils.is_long_layout`):
+    - wide: one row per entity, one column per time division
+    (e.g., '1990'), stored as a dense (entity × time division) cube,
+    - long: one (entity, time division, value) observation per row,
+    stored sorted by time division with an offset index, so that
+    the observations of one time division are a contiguous slice.
+
+    A mostly-missing wide dataset (e.g., a Gini coefficient) is stored
+    sparse, as the long layout is: only its non-missing values are kept,
+    as observations (see `build_numeric_cube`).
+
     Attributes:
+        aligned_offsets (np.ndarray | None):
+            Long layout only: the slice of `aligned_values` and
+            `entity_codes` of the time division at position i
+            is [aligned_offsets[i], aligned_offsets[i + 1]).
+        aligned_values (np.ndarray | None):
+            Wide layout: the numeric cube reindexed on the shared
+            entity index (see `align_to_entities`), NaN for absent
+            entities. Long layout: the observation values,
+            one per entity code of `entity_codes`.
         data_cleaned (bool):
             Indicates if the data has been cleaned.
-        data_frame (pd.DataFrame):
-            The loaded pandas DataFrame containing the data.
+        data_frame (pd.DataFrame | None):
+            The loaded pandas DataFrame containing the data
+            (None until `load_data` is called, if the loading is deferred).
         data_name (str):
             The name of the data derived from the file path.
         data_type (str):
             The type of data (e.g., 'numerical', 'categorical').
+        entities (np.ndarray | None):
+            The entity names (e.g., countries), one per row of `values`
+            (one per observation, for the long layout).
+        entity_codes (np.ndarray | None):
+            The integer code of each entity of `entities` (of each
+            observation of `aligned_values`, for the long layout):
+            its position on the shared entity index
+            (see `align_to_entities`).
+        entity_present (np.ndarray | None):
+            Boolean mask over the shared entity index,
+            True for the entities having a row in this DataFrame.
         file_path (str):
             The path to the file containing the data.
+        fill_ratio (float | None):
+            The share of non-missing values of the dense cube
+            (None for the long layout).
+        label_columns (list[str] | None):
+            The non time division columns to load
+            (None: all of them, see `select_columns`).
+        listed_entities (np.ndarray | None):
+            Sparse wide layout only: the entity names of every row,
+            including the rows without any observation.
+        offsets (np.ndarray | None):
+            Long layout only: the slice of `values` and `entities`
+            of the time division at position i
+            is [offsets[i], offsets[i + 1]).
         first_column_name (int | float | None):
             The name of the first data column (used for time ranges).
         last_column_name (int | float | None):
             The name of the last data column (used for time ranges).
         short_name (str):
             A shorter, descriptive name for the data.
+        source_rows (np.ndarray | None):
+            For a sorted DataFrame (see `sort_rows`), the row position
+            in the source file of each row of `data_frame`.
+        timediv_positions (dict[int, int]):
+            Maps each time division (e.g., a year)
+            to its column position in `values`
+            (to its position in `offsets`, for the long layout).
+        timediv_range (range | None):
+            The time divisions to load
+            (None: all of them, see `select_columns`).
+        values (np.ndarray | None):
+            Dense numeric (entity × time division) cube, column-major
+            so that each time division is a contiguous column.
+            Long layout: the observation values, sorted by time division.
     """
 
     def __init__(
@@ -36,6 +101,7 @@ class DataFrame:
         data_type: str,
         file_path: str,
         short_name: str,
+        deferred: bool = False
     ):
         """
         Initializes a DataFrame object
@@ -48,6 +114,9 @@ class DataFrame:
                 The path to the file containing the data.
             short_name (str):
                 A shorter, descriptive name for the data.
+            deferred (bool):
+                True to defer the loading to a later `load_data` call
+                (e.g., to load several files concurrently).
 
         Raises:
             ValueError: If any parameter is not a string.
@@ -63,7 +132,11 @@ class DataFrame:
             self.file_path: str = file_path
             self.data_name: str = get_data_name(file_path)
             self.short_name: str = short_name
-            self.data_frame: pd.DataFrame = load(file_path)
+            self.data_frame: pd.DataFrame | None = None
+            self.label_columns: list[str] | None = None
+            self.timediv_range: range | None = None
+            if not deferred:
+                self.load_data()
         else:
             raise ValueError(
                 f"Both data_type and data_type must be str, not:\n"
@@ -75,6 +148,18 @@ class DataFrame:
         self.last_column_name: int | float | None = None
         self.data_cleaned: bool = False
 
+        self.aligned_offsets: np.ndarray | None = None
+        self.aligned_values: np.ndarray | None = None
+        self.entities: np.ndarray | None = None
+        self.entity_codes: np.ndarray | None = None
+        self.entity_present: np.ndarray | None = None
+        self.fill_ratio: float | None = None
+        self.listed_entities: np.ndarray | None = None
+        self.offsets: np.ndarray | None = None
+        self.source_rows: np.ndarray | None = None
+        self.timediv_positions: dict[int, int] = {}
+        self.values: np.ndarray | None = None
+
     def show(self) -> None:
         """The class show method for a DataFrame class object"""
 
@@ -93,6 +178,17 @@ class DataFrame:
         print("\n--- Data Cleaning Status ---")
         print(f"Data Cleaned: {self.data_cleaned}")
 
+        print("\n--- Numeric Cube ---")
+        if self.values is not None:
+            layout = "wide" if self.offsets is None else "long"
+            if self.listed_entities is not None:
+                layout = "wide, stored sparse"
+            print(f"Layout: {layout}")
+            print(f"Fill Ratio: {self.fill_ratio}")
+            print(f"Shape: {self.values.shape} ({self.values.dtype})")
+        else:
+            print("Numeric cube not built.")
+
         print("\n--- DataFrame Content ---")
         print(self.data_frame)
 
@@ -104,6 +200,30 @@ class DataFrame:
         """
         pass
 
+    class DataFrameLoadingException(DataFrameException):
+        """
+        Exception raised when one or several DataFrames failed to load.
+
+        Attributes:
+            errors (dict[str, Exception]):
+                The loading error of each failed DataFrame,
+                by `data_type`.
+        """
+
+        def __init__(self, errors: dict[str, Exception]):
+            """
+            Initializes an instance of a DataFrameLoadingException
+            class object, with the `errors` received as parameter.
+            """
+
+            self.errors: dict[str, Exception] = errors
+            super().__init__(
+                "Failed to load:\n" + "\n".join(
+                    f"- {data_type}: {type(error).__name__}: {error}"
+                    for data_type, error in errors.items()
+                )
+            )
+
     class DataFrameNotCleanedException(DataFrameException):
         """
         Exception raised when an operation requiring
@@ -127,43 +247,420 @@ class DataFrame:
 
             super().__init__(msg)
 
+    def select_columns(
+        self,
+        label_columns: list[str] | None,
+        timediv_range: range | None
+    ) -> None:
+        """
+        Restricts the columns to load, to be called before `load_data`.
+
+        Parameters:
+            label_columns (list[str] | None):
+                The non time division columns to load, if present
+                (e.g., the common column), None for all of them.
+            timediv_range (range | None):
+                The time divisions to load, None for all of them.
+        """
+
+        self.label_columns = label_columns
+        self.timediv_range = timediv_range
+
+    def column_selection(self) -> str | None:
+        """
+        Returns the key of the selected columns
+        (see `utils.column_selection_key`).
+        """
+
+        return column_selection_key(self.label_columns, self.timediv_range)
+
+    def load_data(self) -> None:
+        """
+        Loads the selected columns of `file_path` into `data_frame`
+        (see `utils.load`).
+        """
+
+        self.data_frame = load(
+            self.file_path,
+            label_columns=self.label_columns,
+            timediv_range=self.timediv_range
+        )
+
+    def sort_rows(self, column: str) -> None:
+        """
+        Sorts `data_frame` by a column (stable sort: duplicated values
+        keep their order) and resets its index, keeping the source
+        position of each row in `source_rows`.
+
+        Parameters:
+            column (str): The column to sort by (e.g., 'country').
+        """
+
+        sorted_frame = self.data_frame.sort_values(by=column, kind="stable")
+        self.source_rows = sorted_frame.index.to_numpy()
+        self.data_frame = sorted_frame.reset_index(drop=True)
+
+    def source_order_values(self, column: str) -> pd.Series:
+        """
+        Returns the values of a column in the source file row order,
+        even if `data_frame` has been sorted since (see `sort_rows`).
+
+        Parameters:
+            column (str): The column name.
+
+        Returns:
+            pd.Series: The column values.
+        """
+
+        values = self.data_frame[column]
+        if self.source_rows is None:
+            return values
+
+        return values.iloc[np.argsort(self.source_rows, kind="stable")]
+
+    def is_long_layout(self) -> bool:
+        """
+        Tells whether the loaded dataset is in the long layout
+        (see `utils.is_long_layout`).
+        """
+
+        return is_long_layout(list(self.data_frame.columns))
+
     def get_first_last_column_names(self) -> None:
         """
         Extracts and sets the first and last
-        column names as integer or float values.
+        column names as integer or float values
+        (the first and last time divisions, for the long layout).
         """
 
+        if self.is_long_layout():
+            times = self.data_frame.iloc[:, 1]
+            self.first_column_name = int(times.min())
+            self.last_column_name = int(times.max())
+            return
+
         self.first_column_name = int(self.data_frame.columns[1])
         self.last_column_name = int(self.data_frame.columns[-1])
 
-    def subset_timediv_extraction(
+    def build_numeric_cube(
         self,
-        timediv: int,
-        common_column: str
-    ) -> pd.DataFrame | None:
+        common_column: str,
+        dtype: type = np.float64,
+        sparse_fill_ratio: float = SPARSE_FILL_RATIO
+    ) -> None:
         """
-        Extracts a subset of the DataFrame for a specific time division.
+        Converts, once and for all, the cleaned DataFrame into a dense
+        numeric (entity × time division) cube.
+
+        - Parses every time division column
+        (k/M/B suffixed strings included) a single time.
+        - Stores the cube column-major, so that each time division
+        is a contiguous column of `values`.
+        - Indexes the column position of each time division
+        in `timediv_positions`.
+        - If less than `sparse_fill_ratio` of the cube is filled,
+        stores it sparse instead (see `sparsify_cube`).
 
         Parameters:
-            timediv (int):
-                The time division (year or other) to extract.
             common_column (str):
                 The name of the common column (e.g., 'country').
+            dtype (type):
+                The float type of the cube (np.float64 or np.float32).
+            sparse_fill_ratio (float):
+                The fill ratio below which the cube is stored sparse
+                (0 to always store it dense).
+
+        Raises:
+            DataFrameNotCleanedException:
+                If the DataFrame has not been cleaned before.
+        """
+
+        if not self.data_cleaned:
+            raise self.DataFrameNotCleanedException()
+
+        if self.is_long_layout():
+            self.build_observation_index(common_column, dtype)
+            return
+
+        timediv_columns = [
+            column for column in self.data_frame.columns
+            if str(column).isdigit()
+        ]
+
+        self.entities = self.data_frame[common_column].to_numpy()
+        self.values = np.asfortranarray(
+            suffixed_strings_to_float(
+                self.data_frame[timediv_columns].to_numpy()
+            ),
+            dtype=dtype
+        )
+        self.timediv_positions = {
+            int(column): position
+            for position, column in enumerate(timediv_columns)
+        }
+
+        self.fill_ratio = (
+            float(np.count_nonzero(~np.isnan(self.values)))
+            / self.values.size
+            if self.values.size else 1.0
+        )
+        if self.fill_ratio < sparse_fill_ratio:
+            self.sparsify_cube()
+
+    def sparsify_cube(self) -> None:
+        """
+        Converts the dense cube into its sparse form, the one of the long
+        layout: the non-missing values only, sorted by time division
+        (compressed by time division, over the entities), so that memory
+        and per time division work scale with the actual observations.
+
+        - Only the first row of each entity is kept, as the dense cube
+        alignment does (see `align_to_entities`).
+        - The entities of every row stay listed in `listed_entities`,
+        so that the entity presence is the same as with the dense cube.
+        """
+
+        first_rows = ~pd.Index(self.entities).duplicated(keep="first")
+        self.listed_entities = self.entities
+        values = self.values[first_rows]
+        entities = self.entities[first_rows]
+
+        # column-major traversal: time division first, then entity
+        columns, rows = np.nonzero(~np.isnan(values.T))
+        self.entities = entities[rows]
+        self.values = values[rows, columns]
+        self.offsets = np.concatenate((
+            [0],
+            np.cumsum(np.bincount(columns, minlength=values.shape[1]))
+        ))
+
+    def build_observation_index(
+        self,
+        common_column: str,
+        dtype: type = np.float64
+    ) -> None:
+        """
+        Long layout counterpart of `build_numeric_cube`: sorts the
+        observations by time division (stable sort: the observations
+        of a time division keep their order), and indexes the slice
+        of each time division in `offsets` and `timediv_positions`.
+
+        Parameters:
+            common_column (str):
+                The name of the common column (e.g., 'country').
+            dtype (type):
+                The float type of the values (np.float64 or np.float32).
+        """
+
+        times = self.data_frame.iloc[:, 1].to_numpy(dtype=np.int64)
+        order = np.argsort(times, kind="stable")
+        times = times[order]
+
+        self.entities = self.data_frame[common_column].to_numpy()[order]
+        self.values = suffixed_strings_to_float(
+            self.data_frame.iloc[:, 2].to_numpy()
+        ).astype(dtype)[order]
+
+        timedivs, counts = np.unique(times, return_counts=True)
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self.timediv_positions = {
+            int(timediv): position
+            for position, timediv in enumerate(timedivs)
+        }
+
+    def align_to_entities(
+        self,
+        entity_index: pd.Index
+    ) -> None:
+        """
+        Reindexes the numeric cube on the entity index shared by all
+        the DataFrames, so that row i of `aligned_values` is the same
+        entity in every DataFrame.
+
+        - Maps each row to its integer entity code (`entity_codes`),
+        once, so that no later step has to compare entity names.
+        - Entities absent from this DataFrame get a row of NaN,
+        and are flagged False in `entity_present`.
+        - If an entity appears several times, its first row is kept.
+
+        For the long layout (or a cube stored sparse), the observations
+        stay sorted by time division, then by entity code: they are only
+        mapped to their entity codes, with the first observation kept per
+        entity and time division. An entity is then present if it has any
+        observation (any row, for a cube stored sparse).
+
+        Parameters:
+            entity_index (pd.Index):
+                The shared entity index (e.g., sorted unique country names),
+                containing every entity of this DataFrame.
+
+        Raises:
+            DataFrameException:
+                If `build_numeric_cube` has not been called before,
+                or if an entity is missing from `entity_index`.
+        """
+
+        if self.values is None:
+            raise self.DataFrameException(
+                "Numeric cube not built. Did you call `build_numeric_cube()`?"
+            )
+
+        self.entity_codes = entity_index.get_indexer(
+            self.entities
+        ).astype(np.int32)
+        if (self.entity_codes < 0).any():
+            raise self.DataFrameException(
+                f"Entities of '{self.data_name}' missing from the shared "
+                f"entity index: "
+                f"{list(self.entities[self.entity_codes < 0][:5])}"
+            )
+
+        if self.offsets is not None:
+            self.align_observations(len(entity_index))
+            if self.listed_entities is not None:
+                self.entity_present[
+                    entity_index.get_indexer(self.listed_entities)
+                ] = True
+            return
+
+        first_rows = np.flatnonzero(
+            ~pd.Index(self.entity_codes).duplicated(keep="first")
+        )
+        first_codes = self.entity_codes[first_rows]
+
+        self.entity_present = np.zeros(len(entity_index), dtype=bool)
+        self.entity_present[first_codes] = True
+        self.aligned_values = np.full(
+            (len(entity_index), self.values.shape[1]),
+            np.nan,
+            dtype=self.values.dtype,
+            order="F"
+        )
+        self.aligned_values[first_codes] = self.values[first_rows]
+
+    def align_observations(
+        self,
+        nb_entities: int
+    ) -> None:
+        """
+        Long layout part of `align_to_entities`, once `entity_codes`
+        is set: keeps the first observation per entity and time division,
+        in `aligned_values`, `entity_codes` and `aligned_offsets`,
+        sorted by entity code within each time division (so that the
+        merges can intersect the codes, see `TimeDiv.valid_rows`).
+
+        Parameters:
+            nb_entities (int): The size of the shared entity index.
+        """
+
+        counts = np.diff(self.offsets)
+        positions = np.repeat(np.arange(len(counts)), counts)
+        # stable: the first observation of an entity stays first
+        order = np.lexsort((self.entity_codes, positions))
+        positions = positions[order]
+        codes = self.entity_codes[order]
+        first = np.ones(len(codes), dtype=bool)
+        first[1:] = (
+            (positions[1:] != positions[:-1]) | (codes[1:] != codes[:-1])
+        )
+
+        self.entity_codes = codes[first]
+        self.aligned_values = self.values[order[first]]
+        self.aligned_offsets = np.concatenate((
+            [0],
+            np.cumsum(np.bincount(positions[first], minlength=len(counts)))
+        ))
+        self.entity_present = np.zeros(nb_entities, dtype=bool)
+        self.entity_present[self.entity_codes] = True
+
+    def aligned_storage(self) -> tuple[np.ndarray, ...]:
+        """
+        Returns the arrays holding the aligned values
+        (see `storage_timediv_data`).
 
         Returns:
-            pd.DataFrame | None:
-                A subset DataFrame with the time division and common column,
-                or None if the time division is not within the valid range.
+            tuple[np.ndarray, ...]:
+                `(aligned_values,)` for the wide layout, and
+                `(entity_codes, aligned_values, aligned_offsets)`
+                for the long layout.
+
+        Raises:
+            DataFrameException:
+                If `align_to_entities` has not been called before.
         """
 
-        if timediv in range(self.first_column_name, self.last_column_name + 1):
-            df_timediv = self.data_frame[
-                    [common_column, str(timediv)]
-                ].rename(columns={str(timediv): self.data_name})
-            df_timediv[self.data_name] = df_timediv[self.data_name].apply(
-                cust_suffixed_string_to_float
+        if self.aligned_values is None:
+            raise self.DataFrameException(
+                "Numeric cube not aligned. "
+                "Did you call `align_to_entities()`?"
             )
 
-            return df_timediv
+        if self.aligned_offsets is None:
+            return (self.aligned_values,)
+
+        return self.entity_codes, self.aligned_values, self.aligned_offsets
+
+    @staticmethod
+    def storage_timediv_data(
+        storage: tuple[np.ndarray, ...],
+        position: int
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Returns the values of a time division from the arrays of
+        `aligned_storage`, as views (no copy): a column of the wide layout
+        cube, one value per entity of the shared entity index, or the
+        long layout slice of the time division, its observations only,
+        with their entity codes (sorted), never scattered on the entity
+        index: the per time division work then scales with the
+        observations (see `TimeDiv.valid_rows`).
+
+        Parameters:
+            storage (tuple[np.ndarray, ...]):
+                The arrays returned by `aligned_storage`.
+            position (int):
+                The time division position (see `timediv_positions`).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray | None]:
+                The values, and the entity code of each of them
+                (None for a wide layout column).
+        """
+
+        if len(storage) == 1:
+            return storage[0][:, position], None
+
+        codes, values, offsets = storage
+        start, stop = offsets[position], offsets[position + 1]
+
+        return values[start:stop], codes[start:stop]
+
+    def aligned_timediv_data(
+        self,
+        timediv: int
+    ) -> tuple[np.ndarray, np.ndarray | None] | None:
+        """
+        Returns the numeric values of a specific time division,
+        aligned on the shared entity index (see `storage_timediv_data`).
+
+        Parameters:
+            timediv (int):
+                The time division (year or other) to extract.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray | None] | None:
+                The values and their entity codes (None: one value per
+                entity of the shared entity index),
+                or None if the time division is not in the data.
+
+        Raises:
+            DataFrameException:
+                If `align_to_entities` has not been called before.
+        """
+
+        storage = self.aligned_storage()
+
+        position = self.timediv_positions.get(timediv)
+        if position is None:
+            return None
 
-        return None
+        return self.storage_timediv_data(storage, position)
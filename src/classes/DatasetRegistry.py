@@ -0,0 +1,261 @@
+import numpy as np
+
+from .DataFrame import DataFrame
+
+# The roles a dataset can be given (see `DatasetRegistry.assign_role`)
+ROLES = ("x", "y", "size", "color")
+# The roles without which no time division can be merged nor plotted
+ESSENTIAL_ROLES = ("x", "y", "size")
+
+
+class DatasetRegistry:
+    """
+    Ordered registry of the datasets (indicators) of a visualization,
+    by name, without any limit on their number.
+
+    Each role is given to a dataset by name: "x" and "y" (the axes),
+    "size" (the point sizes) and "color" (the point colors).
+    The datasets without a role are merged all the same: an entity
+    is only kept for a time division if it has a row in every dataset
+    covering that time division (see `joined_presence`).
+
+    The registry reads as a dictionary of the datasets by name
+    (e.g., `registry["data_x"]`, `items()`, `values()`),
+    an unknown name giving None.
+
+    Attributes:
+        data_frames (dict[str, DataFrame]):
+            The datasets, by name, in registration order.
+        matched_names (list[str]):
+            The names of the datasets whose entity names are matched
+            against those of the "x" dataset at cleaning time.
+        roles (dict[str, str]):
+            The dataset name of each assigned role.
+    """
+
+    def __init__(self):
+        """Initializes an empty DatasetRegistry object."""
+
+        self.data_frames: dict[str, DataFrame] = {}
+        self.matched_names: list[str] = []
+        self.roles: dict[str, str] = {}
+
+    def show(self) -> None:
+        """The class show method for a DatasetRegistry class object"""
+
+        print("\n=== SHOW DatasetRegistry class object (START) ===")
+
+        for name, data_frame in self.data_frames.items():
+            roles = [
+                role for role, role_name in self.roles.items()
+                if role_name == name
+            ]
+            print(
+                f"{name}: {data_frame.short_name} "
+                f"(roles: {roles or None}, "
+                f"entity matched: {name in self.matched_names})"
+            )
+
+        print("\n=== SHOW DatasetRegistry class object (END) ===")
+
+    def __getitem__(self, name: str) -> DataFrame | None:
+        """Returns the dataset of a name, or None."""
+
+        return self.data_frames.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        """Returns True if a dataset is registered under `name`."""
+
+        return name in self.data_frames
+
+    def __iter__(self):
+        """Iterates over the dataset names, in registration order."""
+
+        return iter(self.data_frames)
+
+    def __len__(self) -> int:
+        """Returns the number of registered datasets."""
+
+        return len(self.data_frames)
+
+    def get(self, name: str) -> DataFrame | None:
+        """Returns the dataset of a name, or None."""
+
+        return self.data_frames.get(name)
+
+    def keys(self):
+        """Returns the dataset names, in registration order."""
+
+        return self.data_frames.keys()
+
+    def values(self):
+        """Returns the datasets, in registration order."""
+
+        return self.data_frames.values()
+
+    def items(self):
+        """Returns the (name, dataset) pairs, in registration order."""
+
+        return self.data_frames.items()
+
+    def add(
+        self,
+        name: str,
+        data_frame: DataFrame,
+        role: str | None = None,
+        match_entities: bool = False
+    ) -> None:
+        """
+        Registers a dataset, replacing any dataset of the same name
+        (at the same position).
+
+        Parameters:
+            name (str):
+                The dataset name (e.g., "data_x" or "co2_emissions").
+            data_frame (DataFrame):
+                The dataset.
+            role (str | None):
+                The role to give it (see `ROLES`), if any.
+            match_entities (bool):
+                True to match its entity names against those of the "x"
+                dataset at cleaning time (e.g., for a World Bank dataset).
+
+        Raises:
+            ValueError: If `role` is not one of `ROLES`.
+        """
+
+        self.data_frames[name] = data_frame
+        if match_entities and name not in self.matched_names:
+            self.matched_names.append(name)
+        elif not match_entities and name in self.matched_names:
+            self.matched_names.remove(name)
+
+        if role is not None:
+            self.assign_role(role, name)
+
+    def assign_role(
+        self,
+        role: str,
+        name: str
+    ) -> None:
+        """
+        Gives a role to a registered dataset
+        (taking it from the dataset which had it, if any).
+
+        Parameters:
+            role (str): The role (see `ROLES`).
+            name (str): The dataset name.
+
+        Raises:
+            ValueError:
+                If `role` is not one of `ROLES`,
+                or if no dataset is registered under `name`.
+        """
+
+        if role not in ROLES:
+            raise ValueError(
+                f"'{role}' is not a dataset role ({', '.join(ROLES)})."
+            )
+        if name not in self.data_frames:
+            raise ValueError(f"No dataset is registered as '{name}'.")
+
+        self.roles[role] = name
+
+    def role_name(self, role: str) -> str | None:
+        """Returns the name of the dataset having a role, or None."""
+
+        return self.roles.get(role)
+
+    def by_role(self, role: str) -> DataFrame | None:
+        """Returns the dataset having a role, or None."""
+
+        return self.data_frames.get(self.roles.get(role))
+
+    def essential_names(self) -> list[str]:
+        """
+        Returns the names of the "x", "y" and "size" datasets.
+
+        Raises:
+            ValueError: If any of these roles is not assigned.
+        """
+
+        for role in ESSENTIAL_ROLES:
+            if role not in self.roles:
+                raise ValueError(
+                    f"Essential DataFrame of role '{role}' is missing."
+                )
+
+        return [self.roles[role] for role in ESSENTIAL_ROLES]
+
+    def ordered_names(self) -> list[str]:
+        """
+        Returns the dataset names in merged column order: the "x", "y"
+        and "size" datasets first, then the others in registration order.
+        """
+
+        essentials = self.essential_names()
+        return essentials + [
+            name for name in self.data_frames
+            if name not in essentials
+        ]
+
+    def joined_presence(
+        self,
+        divs: list[int]
+    ) -> tuple[np.ndarray, dict[int, int]]:
+        """
+        Joins, across all the datasets at once, the entity presence masks
+        of a list of time divisions: an entity is present for a time
+        division if it has a row in every dataset covering it (every
+        dataset having data for it, see `DataFrame.timediv_positions`).
+
+        The datasets cover the time divisions in a handful of distinct
+        ways, whatever the number of time divisions: the joined mask of
+        each distinct coverage is computed once, as a single vectorized
+        AND over the (dataset × entity) presence matrix. The merges of
+        the time divisions then only have to read the "x", "y" and "size"
+        datasets (see `TimeDiv.valid_rows`), however many datasets
+        are registered.
+
+        Parameters:
+            divs (list[int]): The time divisions.
+
+        Returns:
+            tuple[np.ndarray, dict[int, int]]:
+                The joined mask of each distinct coverage
+                (coverage × entity), and the coverage of each time division.
+
+        Raises:
+            DataFrameException:
+                If a dataset has not been aligned on the shared entity index
+                (see `DataFrame.align_to_entities`).
+        """
+
+        data_frames = list(self.data_frames.values())
+        for data_frame in data_frames:
+            if data_frame.entity_present is None:
+                raise DataFrame.DataFrameException(
+                    f"'{data_frame.data_name}' not aligned. "
+                    f"Did you call `align_to_entities()`?"
+                )
+
+        absent = ~np.stack(
+            [data_frame.entity_present for data_frame in data_frames]
+        )
+        coverage = np.array(
+            [
+                [div in data_frame.timediv_positions
+                 for data_frame in data_frames]
+                for div in divs
+            ],
+            dtype=bool
+        ).reshape(len(divs), len(data_frames))
+        coverages, div_coverages = np.unique(
+            coverage,
+            axis=0,
+            return_inverse=True
+        )
+
+        masks = ~(coverages[:, :, None] & absent[None]).any(axis=1)
+
+        return masks, dict(zip(divs, div_coverages.reshape(-1).tolist()))
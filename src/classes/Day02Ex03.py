@@ -15,30 +15,58 @@ After a ctr+clic on a function/method to see its definition,
 navigate back with the keyboard short cut: ctrl alt -
 """
 
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Callable
 
 import matplotlib.collections as mplcollec
 import matplotlib.pyplot as plt
+import matplotlib.transforms as mtransforms
 import mplcursors
 import numpy as np
 import pandas as pd
 import typeguard
-from fuzzywuzzy import process
-from matplotlib.animation import FuncAnimation
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
+from matplotlib.backend_bases import TimerBase
 from matplotlib.cm import ScalarMappable
 from matplotlib.collections import LineCollection, PathCollection
 from matplotlib.colorbar import Colorbar
-from matplotlib.colors import LinearSegmentedColormap, Normalize
+from matplotlib.colors import LinearSegmentedColormap, Normalize, to_rgba
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from matplotlib.ticker import FuncFormatter
 from matplotlib.widgets import Button, Slider, TextBox
 
-from utils import (dict_printer, put_kmb_suffix, tick_label_formatter,
-                   var_print_str)
-
-from .DataFrame import DataFrame
-from .TimeDiv import TimeDiv
+from utils import (attach_array, batch_linregress, dataset_content_hash,
+                   file_digest, is_dataset_cached, load,
+                   precompute_entry_dir, prune_precompute_entries,
+                   put_kmb_suffix, read_array_entry, share_array,
+                   tick_label_formatter, var_print_str, write_array_entry)
+
+from .BlitManager import BlitManager
+from .DataFrame import SPARSE_FILL_RATIO, DataFrame
+from .DatasetRegistry import DatasetRegistry
+from .EntityAliasStore import EntityAliasStore
+from .EntityMatcher import EntityMatcher
+from .LinReg import LinReg
+from .TimeDiv import AlignedData, TimeDiv
+from .TimeDivCache import TimeDivCache
+
+PRECOMPUTE_CACHE_VERSION = 5
+# Entity column of the World Bank datasets, renamed to the common column
+WORLD_BANK_ENTITY_COLUMN = "Country Name"
+REGRESSION_FIELDS = ("slope", "intercept", "rvalue", "pvalue", "stderr", "n")
+# How the scatter graphs are rendered at each slider tick
+# (see `Day02Ex03.set_render_mode`)
+RENDER_MODES = ("redraw", "retained")
+# Which precomputed limits the scatter graphs are drawn with
+# (see `Day02Ex03.set_view_limits`)
+VIEW_LIMITS_SCOPES = ("global", "division")
 
 
 class Day02Ex03:
@@ -46,14 +74,21 @@ class Day02Ex03:
     Main class to manage data visualization for Day02 Exercise 03.
 
     Attributes:
-        anim (FuncAnimation | None):
+        anim (TimerBase | None):
             Animation instance for the visual updates.
         ax_box_tracker (Axes | None):
             Axes object for the text box tracker.
         axes (dict[str, Axes] | None):
             Dictionary of Axes for different plots.
+        blit_manager (BlitManager | None):
+            The blitting of the artists changing at each slider tick
+            (None: not supported by the backend,
+            see `build_blit_manager`).
         cbar (Colorbar | None):
             Colorbar instance for the scatter plot.
+        cmap (LinearSegmentedColormap | None):
+            Colormap of the points colors, built once
+            (see `build_color_mapping`).
         cmap_colors (list[str]):
             Colors used for the colormap.
         common_column (str | None):
@@ -62,6 +97,9 @@ class Day02Ex03:
             Correlation coefficients for logarithmic scale.
         corr_lin (list | np.ndarray):
             Correlation coefficients for linear scale.
+        corr_vlines (dict[str, Line2D]):
+            The marker of the current time division on each correlation
+            graph, built once (see `build_corr_vlines`).
         correlation_cursor_container
         (dict[str, mplcursors.cursor.Cursor | None]):
             Cursors for interactive correlation plots.
@@ -69,16 +107,51 @@ class Day02Ex03:
             Current frame value during animation.
         cursor_container (dict[str, mplcursors.cursor.Cursor | None]):
             Cursors for the main scatter plots.
-        data_frames (dict[str, pd.DataFrame | None]):
-            Dictionary storing loaded data.
+        data_frames (DatasetRegistry):
+            The datasets, by name, any number of them,
+            with their roles ("x", "y", "size", "color").
         data_point_size_divider (int):
             Divider used to scale point sizes in scatter plots.
+        displayed_timediv (TimeDiv | None):
+            The time division currently plotted.
+        entity_aliases (dict[str, str | None]):
+            Manual entity name overrides of the extra datasets
+            (see `add_entity_alias`).
+        entity_alias_store_path (str | None):
+            The path of the entity alias store used at cleaning time
+            (see `EntityAliasStore`), if any dataset has been matched.
+        entity_index (pd.Index | None):
+            Sorted entity index (e.g., countries) shared by all the
+            datasets, established once at cleaning time: the position
+            of an entity is its integer code.
+        entity_match_chunk_size (int):
+            Number of entity names per task in the parallel matching mode.
+        entity_match_progress (bool):
+            Whether the entity matching progress and timings are printed.
+        entity_match_threshold (int):
+            Minimum fuzzy matching score for an extra dataset entity name
+            to be matched with a `data_x` one.
+        entity_match_workers (int | None):
+            Number of worker processes of the parallel entity matching mode
+            (None: serial matching).
         fig (Figure | None):
             Matplotlib figure instance.
         first_running (bool):
             Indicates whether the animation is running for the first time.
         init_value (int | None):
             Initial value for the slider.
+        load_chunk_size (int | None):
+            Number of rows per chunk when streaming the datasets
+            (None: each file is read at once).
+        loading_process_workers (int | None):
+            Number of worker processes parsing the datasets
+            not cached yet (None: every dataset is loaded in a thread).
+        loading_workers (int | None):
+            Number of threads loading the datasets
+            (None: one per dataset).
+        norm (Normalize | None):
+            Normalization of the "color" role values for the colormap,
+            built once (see `build_color_mapping`).
         pause_ax (Axes | None):
             Axes object for the pause button.
         pause_button (Button | None):
@@ -87,18 +160,52 @@ class Day02Ex03:
             Axes object for the play button.
         play_button (Button | None):
             Button widget for starting the animation.
-        precomputed_data (dict[int | float, TimeDiv]):
-            Precomputed data for each time division.
+        point_bounds (dict[str, np.ndarray]):
+            The data bounds of the merged points of each time division
+            (see `timediv_point_bounds`).
+        precompute_chunk_size (int):
+            Number of time divisions per task in the parallel mode.
+        precompute_workers (int | None):
+            Number of worker processes of the parallel mode
+            (None: serial precompute).
+        precomputed_data (dict[int | float, TimeDiv] | TimeDivCache):
+            Precomputed data for each time division
+            (a bounded LRU cache in lazy mode).
         pvalue_log (list | np.ndarray):
             P-values for logarithmic regression.
         pvalue_lin (list | np.ndarray):
             P-values for linear regression.
+        regression_results (dict[str, tuple[np.ndarray, ...]]):
+            For "log" and "lin", the `batch_linregress` results
+            (slope, intercept, rvalue, pvalue, stderr, n),
+            one value per time division.
+        render_mode (str):
+            How the scatter graphs are rendered at each slider tick
+            (see `set_render_mode`).
         running_mode (bool):
             Indicates if the animation is running.
+        scatter_artists (dict[str, dict[str, Artist]]):
+            In the retained render mode, for "log" and "lin",
+            the artists of the scatter graph, built once
+            (see `build_retained_artists`).
         slider (Slider | None):
             Slider widget for selecting time divisions.
+        sparse_fill_ratio (float):
+            The fill ratio below which a wide dataset is stored sparse
+            (see `set_sparse_storage`).
         slider_title_text (str | None):
             Title text for the slider.
+        use_precompute_cache (bool):
+            Whether the precompute outputs are stored on disk and
+            reloaded on the next run with the same configuration
+            (opt-in, see `set_precompute_cache`).
+        timediv_cache_capacity (int | None):
+            Capacity of the lazy mode LRU cache (None: eager mode).
+        timediv_prefetch_size (int):
+            In lazy mode, number of time divisions materialized ahead.
+        timediv_presence (tuple[np.ndarray, dict[int, int]] | None):
+            The entity presence of every dataset, joined once per time
+            division coverage (see `DatasetRegistry.joined_presence`).
         timediv_range (range | None):
             Range of time divisions available in the data.
         text_box_tracker (TextBox | None):
@@ -107,27 +214,48 @@ class Day02Ex03:
             Type of time division (e.g., "year").
         title (str | None):
             Title of the visualization.
+        tracked_codes (np.ndarray):
+            Entity codes matching the tracked element.
         tracked_element (str):
-            Name of the tracked element in the visualization.
+            Name of the tracked element in the visualization
+            (several comma-separated names or name prefixes).
+        tracked_mask (np.ndarray | None):
+            Whether each entity of `entity_index` is tracked,
+            gathered by the entity codes of each frame.
+        tracker_codes (np.ndarray | None):
+            The entity codes of `tracker_names`.
+        tracker_names (np.ndarray | None):
+            The lowercase entity names, sorted: the prefix search index
+            of the tracker (see `build_tracker_index`).
         x_label (str | None):
             Label for the x-axis.
         x_unit (str | None):
             Unit for the x-axis.
         y_label (str | None):
             Label for the y-axis.
+        view_limits (dict[str, np.ndarray]):
+            For "log" and "lin", the precomputed axis limits
+            (x min, x max, y min, y max) of each time division
+            (time division × 4, see `compute_view_limits`).
+        view_limits_global (dict[str, np.ndarray]):
+            For "log" and "lin", the precomputed axis limits
+            of all the time divisions together.
+        view_limits_scope (str):
+            Which precomputed limits the scatter graphs are drawn with
+            (see `set_view_limits`).
         y_unit (str | None):
             Unit for the y-axis.
-        colored_extra_data (str):
-            Name of the extra data column used for coloring points.
     """
 
     def __init__(self):
         """Initializes the Day02Ex03 object with default values."""
 
-        self.anim: FuncAnimation | None = None
+        self.anim: TimerBase | None = None
         self.ax_box_tracker: Axes | None = None
         self.axes: dict[str, Axes] | None = None
+        self.blit_manager: BlitManager | None = None
         self.cbar: Colorbar | None = None
+        self.cmap: LinearSegmentedColormap | None = None
         self.cmap_colors: list[str] = [
             "green",
             "limegreen",
@@ -141,6 +269,7 @@ class Day02Ex03:
         self.common_column: str | None = None
         self.corr_log: list | np.ndarray = []
         self.corr_lin: list | np.ndarray = []
+        self.corr_vlines: dict[str, Line2D] = {}
         self.correlation_cursor_container: dict[
             str, mplcursors.cursor.Cursor | None
         ] = {
@@ -156,41 +285,66 @@ class Day02Ex03:
             "log": None,
             "lin": None
         }
-        self.data_frames: dict[str, pd.DataFrame | None] = {
-            "data_x": None,
-            "data_y": None,
-            "data_point_size": None,
-            "extra_data_x": None,
-            "extra_data_y": None,
-        }
+        self.data_frames: DatasetRegistry = DatasetRegistry()
         self.data_point_size_divider: int = None
+        self.displayed_timediv: TimeDiv | None = None
+        self.entity_aliases: dict[str, str | None] = {}
+        self.entity_alias_store_path: str | None = None
+        self.entity_index: pd.Index | None = None
+        self.entity_match_chunk_size: int = 64
+        self.entity_match_progress: bool = False
+        self.entity_match_threshold: int = 80
+        self.entity_match_workers: int | None = None
         self.fig: Figure | None = None
         self.first_running: bool = False
         self.init_value: int | None = None
         self.interval_between_two_frames: int = 100
+        self.load_chunk_size: int | None = None
+        self.loading_process_workers: int | None = None
+        self.loading_workers: int | None = None
+        self.norm: Normalize | None = None
         self.pause_ax: Axes | None = None
         self.pause_button: Button | None = None
         self.play_ax: Axes | None = None
         self.play_button: Button | None = None
-        self.precomputed_data: dict[int | float, TimeDiv] = {}
+        self.point_bounds: dict[str, np.ndarray] = {}
+        self.precompute_chunk_size: int = 16
+        self.precompute_workers: int | None = None
+        self.precomputed_data: (
+            dict[int | float, TimeDiv] | TimeDivCache
+        ) = {}
         self.pvalue_log: list | np.ndarray = []
         self.pvalue_lin: list | np.ndarray = []
+        self.regression_results: dict[str, tuple[np.ndarray, ...]] = {}
+        self.render_mode: str = "redraw"
         self.running_mode: bool = False
+        self.scatter_artists: dict[str, dict[str, Artist]] = {}
         self.slider: Slider | None = None
         self.slider_title_text: str | None = None
+        self.sparse_fill_ratio: float = SPARSE_FILL_RATIO
+        self.timediv_cache_capacity: int | None = None
+        self.use_precompute_cache: bool = False
+        self.timediv_prefetch_size: int = 0
+        self.timediv_presence: tuple[np.ndarray, dict[int, int]] | None = (
+            None
+        )
         self.timediv_range: range | None = None
         self.text_box_tracker: TextBox | None = None
         self.timediv_type: str | None = None
         self.title: str | None = None
+        self.tracked_codes: np.ndarray = np.empty(0, dtype=np.int32)
         self.tracked_element: str = "None"
+        self.tracked_mask: np.ndarray | None = None
+        self.tracker_codes: np.ndarray | None = None
+        self.tracker_names: np.ndarray | None = None
         self.x_label: str | None = None
         self.x_unit: str | None = None
         self.y_label: str | None = None
+        self.view_limits: dict[str, np.ndarray] = {}
+        self.view_limits_global: dict[str, np.ndarray] = {}
+        self.view_limits_scope: str = "global"
         self.y_unit: str | None = None
 
-        # permanently set that way (adjustable in future versions)
-        self.colored_extra_data: str = "extra_data_x"
-
     def show(self):
         """The class show method for a Day02Ex03 class object"""
 
@@ -203,6 +357,20 @@ class Day02Ex03:
         print(f"Initial Value: {self.init_value}")
         print(f"Running Mode: {self.running_mode}")
         print(f"First Running: {self.first_running}")
+        print(f"Loading Workers: {self.loading_workers}")
+        print(f"Load Chunk Size: {self.load_chunk_size}")
+        print(f"Loading Process Workers: {self.loading_process_workers}")
+        print(f"Precompute Cache: {self.use_precompute_cache}")
+        print(f"Precompute Workers: {self.precompute_workers}")
+        print(f"Precompute Chunk Size: {self.precompute_chunk_size}")
+        print(f"Sparse Fill Ratio: {self.sparse_fill_ratio}")
+        print(f"Render Mode: {self.render_mode}")
+        print(f"View Limits Scope: {self.view_limits_scope}")
+        print(f"Lazy Cache Capacity: {self.timediv_cache_capacity}")
+        print(f"Lazy Prefetch Size: {self.timediv_prefetch_size}")
+        print(f"Entity Match Threshold: {self.entity_match_threshold}")
+        print(f"Entity Match Workers: {self.entity_match_workers}")
+        print(f"Entity Aliases: {self.entity_aliases}")
 
         print("\n--- Labels and Units ---")
         print(f"X Label: {self.x_label}")
@@ -218,13 +386,16 @@ class Day02Ex03:
 
         print("\n--- Tracking ---")
         print(f"Tracked Element: {self.tracked_element}")
+        print(f"Tracked Entities: {len(self.tracked_codes)}")
 
         print("\n--- Data Frames ---")
-        dict_printer(self.data_frames, values_type="cust class")
+        self.data_frames.show()
 
         print("\n--- Color Map and Color Bar ---")
         print(f"Color Map Colors: {self.cmap_colors}")
-        print(f"Colored Extra Data: {self.colored_extra_data}")
+        print(f"Color Map: {self.cmap}")
+        print(f"Color Norm: {self.norm}")
+        print(f"Colored Dataset: {self.data_frames.role_name('color')}")
         print(f"Color Bar: {self.cbar}")
 
         print("\n--- Interactive Elements ---")
@@ -237,6 +408,7 @@ class Day02Ex03:
         print("\n--- Axes and Figures ---")
         print(f"Figure: {self.fig}")
         print(f"Axes: {self.axes}")
+        print(f"Blit Manager: {self.blit_manager}")
 
         print("\n=== SHOW Day02Ex03 object (END) ===\n")
 
@@ -244,23 +416,37 @@ class Day02Ex03:
         self,
         data_path: str,
         data_type: str,
-        short_name: str
+        short_name: str,
+        role: str | None = None,
+        match_entities: bool = False
     ) -> None:
         """
-        Adds a data path to the data_frames dictionary.
+        Adds a dataset to the `data_frames` registry, under the name
+        `data_type`: any number of datasets can be added, each one only
+        constraining the merged entities (see `DatasetRegistry`)
+        unless it is given a role.
+
+        The file is not read yet: all the datasets are loaded
+        concurrently at cleaning time (see `load_data_frames`).
 
         Args:
             data_path (str):
                 Path to the dataset file.
             data_type (str):
-                Type of the data (e.g., "data_x", "data_y").
+                Name of the dataset (e.g., "data_x", "co2_emissions").
             short_name (str):
                 Shortened name for the dataset.
+            role (str | None):
+                The role of the dataset: "x", "y", "size" or "color"
+                (see `set_dataset_role`), if any.
+            match_entities (bool):
+                True to match its entity names against the "x" dataset
+                ones at cleaning time (see `clean_matched_dataset`).
 
         Raises:
             ValueError:
                 If any argument is not a valid string or
-                `data_path` is too short.
+                `data_path` is too short, or if `role` is unknown.
         """
 
         if (
@@ -273,10 +459,16 @@ class Day02Ex03:
             )
             and len(data_path) >= 3
         ):
-            self.data_frames[data_type] = DataFrame(
+            self.data_frames.add(
                 data_type,
-                data_path,
-                short_name
+                DataFrame(
+                    data_type,
+                    data_path,
+                    short_name,
+                    deferred=True
+                ),
+                role=role,
+                match_entities=match_entities
             )
         else:
             raise ValueError(
@@ -312,7 +504,8 @@ class Day02Ex03:
         self.add_data_path(
             data_x_path,
             "data_x",
-            short_name
+            short_name,
+            role="x"
         )
         self.x_label = x_label
         self.x_unit = x_unit
@@ -342,7 +535,8 @@ class Day02Ex03:
         self.add_data_path(
             data_y_path,
             "data_y",
-            short_name
+            short_name,
+            role="y"
         )
         self.y_label = y_label
         self.y_unit = y_unit
@@ -370,7 +564,8 @@ class Day02Ex03:
         self.add_data_path(
             data_point_size_path,
             "data_point_size",
-            short_name
+            short_name,
+            role="size"
         )
 
     @typeguard.typechecked
@@ -381,7 +576,8 @@ class Day02Ex03:
     ) -> None:
         """
         Adds an additional dataset related to
-        the X-axis for coloring or metadata.
+        the X-axis for coloring or metadata: it colors the points,
+        and its entity names are matched against the `data_x` ones.
 
         Args:
             extra_data_x_path (str):
@@ -393,7 +589,9 @@ class Day02Ex03:
         self.add_data_path(
             extra_data_x_path,
             "extra_data_x",
-            short_name
+            short_name,
+            role="color",
+            match_entities=True
         )
 
     @typeguard.typechecked
@@ -419,6 +617,29 @@ class Day02Ex03:
             short_name
         )
 
+    @typeguard.typechecked
+    def set_dataset_role(
+        self,
+        role: str,
+        data_type: str
+    ) -> None:
+        """
+        Gives a role to a dataset added before, by name, taking it
+        from the dataset which had it: "x" and "y" (the axes), "size"
+        (the point sizes) or "color" (the point colors, from 0 to 100).
+
+        Args:
+            role (str):
+                The role.
+            data_type (str):
+                The name of the dataset (see `add_data_path`).
+
+        Raises:
+            ValueError: If the role or the dataset is unknown.
+        """
+
+        self.data_frames.assign_role(role, data_type)
+
     @typeguard.typechecked
     def add_title(
         self,
@@ -475,6 +696,28 @@ class Day02Ex03:
 
         self.common_column = common_column
 
+    @typeguard.typechecked
+    def add_entity_alias(
+        self,
+        name: str,
+        entity: str | None
+    ) -> None:
+        """
+        Pins the `data_x` entity matched with an extra dataset entity name,
+        instead of the fuzzy matching result (see `clean_matched_dataset`).
+
+        The override is persisted in the entity alias store.
+
+        Args:
+            name (str):
+                The entity name in the extra dataset (e.g., "Korea, Rep.").
+            entity (str | None):
+                The `data_x` entity name (e.g., "South Korea"),
+                or None to drop this entity from the extra dataset.
+        """
+
+        self.entity_aliases[name] = entity
+
     @typeguard.typechecked
     def set_autoplay_at_start(
         self,
@@ -490,258 +733,1380 @@ class Day02Ex03:
 
         self.first_running = autoplay_at_start
 
-    def clean_data_x(self) -> None:
+    @typeguard.typechecked
+    def set_lazy_precompute(
+        self,
+        capacity: int = 32,
+        prefetch_size: int = 3
+    ) -> None:
         """
-        Cleans the DataFrame associated with `data_x`.
+        Enables the lazy precompute mode, to be set before `precompute_data`.
 
-        - Sorts the DataFrame by the `common_column`.
-        - Resets the index to ensure a clean sequential order.
-        - Marks the DataFrame as cleaned.
+        Only the correlation coefficients and p-values (right-side graphs)
+        are computed up front; the full TimeDiv of each time division is
+        materialized when `update` asks for it, and kept in a bounded
+        LRU cache (see `TimeDivCache`).
+        It cuts both the time to the first window
+        and the resident memory for long time ranges.
+
+        Args:
+            capacity (int):
+                The maximum number of TimeDiv objects kept in memory.
+            prefetch_size (int):
+                How many time divisions are materialized ahead,
+                in the animation direction, after each frame.
 
         Raises:
-            ValueError: If `data_x` is not properly initialized.
+            ValueError:
+                If `capacity` is not greater than `prefetch_size`,
+                or if `prefetch_size` is negative.
         """
 
-        df = self.data_frames['data_x']
-        if df is not None:
-            df.data_frame.sort_values(
-                by=self.common_column
-                ).reset_index(drop=True)
-            df.data_cleaned = True
+        if prefetch_size < 0 or capacity <= prefetch_size:
+            raise ValueError(
+                f"capacity ({capacity}) must be greater than "
+                f"prefetch_size ({prefetch_size}), which must be positive."
+            )
 
-    def clean_data_y(self) -> None:
+        self.timediv_cache_capacity = capacity
+        self.timediv_prefetch_size = prefetch_size
+
+    @typeguard.typechecked
+    def set_precompute_cache(
+        self,
+        enabled: bool = True
+    ) -> None:
         """
-        Cleans the DataFrame associated with `data_y`.
+        Enables or disables the on-disk cache of the precompute outputs
+        (disabled by default, see `save_precomputed_results`).
 
-        - Sorts the DataFrame by the `common_column`.
-        - Resets the index to ensure a clean sequential order.
-        - Marks the DataFrame as cleaned.
+        An artifact is stored per configuration (datasets, time range,
+        roles, ...) and never evicted: clear the `.cache` directory
+        of the data when it grows too large.
+
+        Args:
+            enabled (bool):
+                False to always recompute, and never store, the outputs.
+        """
+
+        self.use_precompute_cache = enabled
+
+    @typeguard.typechecked
+    def set_parallel_precompute(
+        self,
+        workers: int | None = None,
+        chunk_size: int = 16
+    ) -> None:
+        """
+        Enables the parallel precompute mode, to be set before
+        `precompute_data`: the regressions of the time divisions are
+        spread, by chunks, across a pool of worker processes
+        (see `parallel_regressions`).
+
+        Args:
+            workers (int | None):
+                The number of worker processes.
+                Defaults to the number of CPUs.
+            chunk_size (int):
+                The number of time divisions per task.
 
         Raises:
-            ValueError: If `data_y` is not properly initialized.
+            ValueError:
+                If `workers` or `chunk_size` is not strictly positive.
         """
 
-        df = self.data_frames['data_y']
-        if df is not None:
-            df.data_frame.sort_values(
-                by=self.common_column
-                ).reset_index(drop=True)
-            df.data_cleaned = True
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or chunk_size < 1:
+            raise ValueError(
+                f"workers ({workers}) and chunk_size ({chunk_size}) "
+                f"must be strictly positive."
+            )
+
+        self.precompute_workers = workers
+        self.precompute_chunk_size = chunk_size
+
+    @typeguard.typechecked
+    def set_sparse_storage(
+        self,
+        fill_ratio: float = SPARSE_FILL_RATIO
+    ) -> None:
+        """
+        Configures the automatic sparse storage of the mostly-missing
+        wide datasets (e.g., a Gini coefficient), to be set before
+        `precompute_data`: a dataset whose share of non-missing values
+        is below `fill_ratio` keeps its observations only
+        (see `DataFrame.sparsify_cube`). The results are the same.
+
+        Args:
+            fill_ratio (float):
+                The fill ratio threshold, between 0 and 1
+                (0 to store every dataset dense).
+
+        Raises:
+            ValueError: If `fill_ratio` is not between 0 and 1.
+        """
+
+        if not 0 <= fill_ratio <= 1:
+            raise ValueError(
+                f"fill_ratio ({fill_ratio}) must be between 0 and 1."
+            )
+
+        self.sparse_fill_ratio = fill_ratio
+
+    @typeguard.typechecked
+    def set_render_mode(
+        self,
+        mode: str = "retained"
+    ) -> None:
+        """
+        Sets how the scatter graphs are rendered at each slider tick,
+        to be set before `build_mpl_window`:
+        - "redraw" (default): both scatter axes are cleared, all their
+        artists rebuilt (points, regression line, legend, labels,
+        formatters, watermark), then both axes are redrawn as a whole.
+        - "retained": these artists are built once, then only their data
+        is updated (offsets, sizes, colors, regression line, title),
+        and only they are redrawn.
+        In both modes, when the backend supports it, the rest of the figure
+        (correlation graphs curves, colorbar, ...) is a cached background
+        the changing artists are blitted over (see `build_blit_manager`);
+        otherwise, the whole figure is redrawn.
+
+        Args:
+            mode (str): The render mode (see `RENDER_MODES`).
+
+        Raises:
+            ValueError: If `mode` is not one of `RENDER_MODES`.
+        """
 
-    def clean_data_point_size(self) -> None:
+        if mode not in RENDER_MODES:
+            raise ValueError(
+                f"'{mode}' is not a render mode "
+                f"({', '.join(RENDER_MODES)})."
+            )
+
+        self.render_mode = mode
+
+    @typeguard.typechecked
+    def set_view_limits(
+        self,
+        scope: str = "global"
+    ) -> None:
+        """
+        Sets which limits, precomputed by `precompute_data`
+        (see `compute_view_limits`), the scatter graphs are drawn with,
+        instead of autoscaling them at each slider tick:
+        - "global" (default): the limits of all the time divisions
+        together, the same for every frame, so that the axes never move
+        during the animation (and the retained render mode can blit
+        every frame, see `set_render_mode`).
+        - "division": the limits of each time division, as an autoscale
+        would set them.
+
+        Args:
+            scope (str): The limits scope (see `VIEW_LIMITS_SCOPES`).
+
+        Raises:
+            ValueError: If `scope` is not one of `VIEW_LIMITS_SCOPES`.
+        """
+
+        if scope not in VIEW_LIMITS_SCOPES:
+            raise ValueError(
+                f"'{scope}' is not a view limits scope "
+                f"({', '.join(VIEW_LIMITS_SCOPES)})."
+            )
+
+        self.view_limits_scope = scope
+
+    @typeguard.typechecked
+    def set_concurrent_loading(
+        self,
+        workers: int | None = None,
+        process_workers: int | None = None
+    ) -> None:
+        """
+        Configures the concurrent loading of the datasets
+        (see `load_data_frames`).
+
+        Args:
+            workers (int | None):
+                The number of loading threads.
+                Defaults to one per dataset.
+            process_workers (int | None):
+                The number of worker processes parsing the datasets
+                which are not cached yet (the parsing-heavy ones).
+                Defaults to None: every dataset is loaded in a thread.
+
+        Raises:
+            ValueError:
+                If `workers` or `process_workers` is not strictly positive.
+        """
+
+        for value in (workers, process_workers):
+            if value is not None and value < 1:
+                raise ValueError(
+                    f"workers ({workers}) and process_workers "
+                    f"({process_workers}) must be strictly positive."
+                )
+
+        self.loading_workers = workers
+        self.loading_process_workers = process_workers
+
+    @typeguard.typechecked
+    def set_chunked_loading(
+        self,
+        chunk_size: int | None = 100_000
+    ) -> None:
+        """
+        Enables the streaming of the datasets not cached yet, by chunks
+        of rows (see `utils.read_csv_chunked`): each chunk is converted
+        straight to its numeric form, which bounds the peak memory
+        of very large indicator files.
+
+        Args:
+            chunk_size (int | None):
+                The number of rows per chunk, or None to read
+                each file at once (the default mode).
+
+        Raises:
+            ValueError: If `chunk_size` is not strictly positive.
+        """
+
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(
+                f"chunk_size ({chunk_size}) must be strictly positive."
+            )
+
+        self.load_chunk_size = chunk_size
+
+    @typeguard.typechecked
+    def set_parallel_entity_matching(
+        self,
+        workers: int | None = None,
+        chunk_size: int = 64,
+        progress: bool = True
+    ) -> None:
+        """
+        Enables the parallel entity matching mode, to be set before
+        `clean_data_frames`: the extra dataset entity names neither found
+        in the alias store nor matched exactly are fuzzy matched by chunks,
+        across a pool of worker processes (see `EntityMatcher.match_all`).
+        The matches are the same as in the serial mode.
+
+        Args:
+            workers (int | None):
+                The number of worker processes.
+                Defaults to the number of CPUs.
+            chunk_size (int):
+                The number of entity names per task.
+            progress (bool):
+                True to print the matching progress and stage timings.
+
+        Raises:
+            ValueError:
+                If `workers` or `chunk_size` is not strictly positive.
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or chunk_size < 1:
+            raise ValueError(
+                f"workers ({workers}) and chunk_size ({chunk_size}) "
+                f"must be strictly positive."
+            )
+
+        self.entity_match_workers = workers
+        self.entity_match_chunk_size = chunk_size
+        self.entity_match_progress = progress
+
+    def load_data_frames(self) -> None:
+        """
+        Loads, concurrently, every dataset whose loading was deferred.
+
+        - Only the columns used are loaded: the common column
+        (or the World Bank entity column) and the time divisions
+        of `timediv_range` (see `DataFrame.select_columns`).
+        - The files are read (and parsed, or reloaded from their
+        on-disk cache) by a thread pool, by chunks of rows if
+        `load_chunk_size` is set (see `set_chunked_loading`).
+        - If `loading_process_workers` is set, the files without a valid
+        cache entry are parsed by a process pool instead.
+        - All the loading errors are collected, and raised together
+        once every dataset has been processed.
+
+        Raises:
+            DataFrameLoadingException:
+                If any dataset failed to load, with the error
+                of each one, by `data_type`.
         """
-        Cleans the DataFrame associated with `data_point_size`.
 
-        - Sorts the DataFrame by the `common_column`.
+        pending = [
+            df for df in self.data_frames.values()
+            if df is not None and df.data_frame is None
+        ]
+        if not pending:
+            return
+
+        label_columns = None
+        if self.common_column is not None:
+            label_columns = [self.common_column, WORLD_BANK_ENTITY_COLUMN]
+
+        errors = {}
+        with ThreadPoolExecutor(
+            max_workers=self.loading_workers or len(pending)
+        ) as threads, (
+            ProcessPoolExecutor(max_workers=self.loading_process_workers)
+            if self.loading_process_workers is not None
+            else nullcontext()
+        ) as processes:
+            futures = {}
+            for df in pending:
+                df.select_columns(label_columns, self.timediv_range)
+                executor = threads
+                try:
+                    if processes is not None and not is_dataset_cached(
+                        df.file_path,
+                        df.column_selection()
+                    ):
+                        executor = processes
+                except OSError:
+                    pass
+                futures[df.data_type] = (
+                    df,
+                    executor.submit(
+                        load,
+                        df.file_path,
+                        label_columns=df.label_columns,
+                        timediv_range=df.timediv_range,
+                        chunk_size=self.load_chunk_size
+                    )
+                )
+
+            for data_type, (df, future) in futures.items():
+                try:
+                    df.data_frame = future.result()
+                except Exception as error:
+                    errors[data_type] = error
+
+        if errors:
+            raise DataFrame.DataFrameLoadingException(errors)
+
+    def clean_sorted_dataset(self, data_type: str) -> None:
+        """
+        Cleans a dataset whose entity names are the reference ones
+        (e.g., `data_x`, `data_y` and `data_point_size`).
+
+        - Sorts the DataFrame by the `common_column`
+        (stable sort: duplicated entities keep their order).
         - Resets the index to ensure a clean sequential order.
         - Marks the DataFrame as cleaned.
 
-        Raises:
-            ValueError: If `data_point_size` is not properly initialized.
+        Args:
+            data_type (str): The name of the dataset.
         """
 
-        df = self.data_frames['data_point_size']
+        df = self.data_frames[data_type]
         if df is not None:
-            df.data_frame.sort_values(
-                by=self.common_column
-                ).reset_index(drop=True)
+            df.sort_rows(self.common_column)
             df.data_cleaned = True
 
-    def clean_extra_data_x(self) -> None:
+    def clean_matched_dataset(self, data_type: str) -> None:
         """
-        Cleans the DataFrame associated with `extra_data_x`.
+        Cleans a dataset whose entity names have to be matched against
+        the "x" dataset ones (e.g., `extra_data_x`, a World Bank dataset).
 
         - Removes irrelevant columns such as
         'Country Code', 'Indicator Name',
         'Indicator Code', and 'Unnamed: 68'.
         - Renames the 'Country Name' column to match `common_column`.
-        - Matches country names in `extra_data_x` with those in `data_x`,
-        using fuzzy matching to align similar names.
-        - Drops rows with unmatched or duplicate entries in `common_column`.
+        - Matches country names in the dataset with those of the "x"
+        dataset: through the persistent alias store first (see
+        `EntityAliasStore`, including the `add_entity_alias` overrides),
+        then, for the names never seen before, through `EntityMatcher`
+        (exact matching on normalized names, then fuzzy matching of the
+        leftovers against their closest candidates only).
+        - Drops rows with unmatched or duplicate entries in `common_column`
+        (for a long layout dataset, keeps every observation of the first
+        source name matched to each entity).
         - Sorts the DataFrame by `common_column`.
         - Marks the DataFrame as cleaned.
 
+        Args:
+            data_type (str): The name of the dataset.
+
         Raises:
-            ValueError: If `extra_data_x` is not properly initialized.
+            ValueError: If the "x" dataset is missing,
+            or if an `add_entity_alias` entity is not one of its entities.
 
         Notes:
-            - A match is considered valid if the similarity score is >= 80.
-        """
-
-        if self.data_frames['extra_data_x'] is not None:
-            df = self.data_frames['extra_data_x'].data_frame
-            df = df.drop(
-                columns=[
-                    "Country Code",
-                    "Indicator Name",
-                    "Indicator Code",
-                    "Unnamed: 68"
-                ],
-                errors="ignore"
-            )
-            df = df.rename(
-                columns={"Country Name": self.common_column}
-            )
-
-            data_y_countries = self.data_frames[
-                'data_x'
-                ].data_frame[self.common_column].unique()
+            - A match is considered valid if the similarity score is
+            >= `entity_match_threshold` (80).
+        """
 
-            def match_country_name(country: str) -> int | None:
-                """
-                Returns the first score >= 80 found during the
-                fuzzywuzzy process.extractOne.
+        dataset = self.data_frames[data_type]
+        if dataset is None:
+            return
 
-                This function calculates a match score between
-                an entity name (from the extra_data_x df)
-                and every entity names in data_y.
-                """
+        reference = self.data_frames.by_role("x")
+        if reference is None:
+            raise ValueError("Essential DataFrame of role 'x' is missing.")
 
-                match, score = process.extractOne(country, data_y_countries)
-                return match if score >= 80 else None
+        df = dataset.data_frame.drop(
+            columns=[
+                "Country Code",
+                "Indicator Name",
+                "Indicator Code",
+                "Unnamed: 68"
+            ],
+            errors="ignore"
+        )
+        df = df.rename(
+            columns={WORLD_BANK_ENTITY_COLUMN: self.common_column}
+        )
 
-            df[self.common_column] = df[self.common_column].apply(
-                match_country_name
+        # source file order: fuzzy matching ties go to the first target
+        targets = reference.source_order_values(self.common_column)
+        store = EntityAliasStore(
+            reference.file_path,
+            targets.unique(),
+            self.entity_match_threshold
+        )
+        for name, entity in self.entity_aliases.items():
+            store.add_override(name, entity)
+
+        source_names = df[self.common_column]
+        df[self.common_column] = store.resolve(
+            os.path.basename(dataset.file_path),
+            df[self.common_column],
+            lambda names: EntityMatcher(
+                targets,
+                threshold=self.entity_match_threshold
+            ).match_all(
+                names,
+                workers=self.entity_match_workers,
+                chunk_size=self.entity_match_chunk_size,
+                progress=self.entity_match_progress
             )
-
-            df = df.dropna(subset=[self.common_column])
+        )
+        store.save()
+        self.entity_alias_store_path = store.file_path
+
+        df = df.dropna(subset=[self.common_column])
+        if dataset.is_long_layout():
+            # every observation of the first name matched to an entity
+            source_names = source_names.loc[df.index]
+            first_names = source_names.groupby(
+                df[self.common_column],
+                sort=False
+            ).transform("first")
+            df = df[(source_names == first_names).to_numpy()]
+            dataset.data_frame = df
+            dataset.sort_rows(self.common_column)
+        else:
             df = df.drop_duplicates(
                 subset=[self.common_column],
                 keep="first"
             )
             df = df.sort_values(
                 by=self.common_column).reset_index(drop=True)
+            dataset.data_frame = df
 
-            self.data_frames['extra_data_x'].data_frame = df
-            self.data_frames['extra_data_x'].data_cleaned = True
+        dataset.data_cleaned = True
 
-    def clean_extra_data_y(self) -> None:
+    def clean_data_frames(self) -> None:
         """
-        Marks the DataFrame associated with `extra_data_y` as cleaned.
+        Cleans all the datasets of the `data_frames` registry.
 
-        - Simply sets the `data_cleaned` attribute to True, as no
-        specific cleaning steps are defined for this DataFrame so far.
+        - First loads the datasets, concurrently (`load_data_frames`).
+        - Cleans the datasets whose entity names are the reference ones
+        (`clean_sorted_dataset`), then those whose entity names have
+        to be matched (`clean_matched_dataset`).
+        - Then establishes the shared entity index (`build_entity_index`).
 
         Raises:
-            ValueError: If `extra_data_y` is not properly initialized.
+            ValueError:
+                If any DataFrame is missing or improperly initialized.
+            DataFrameLoadingException:
+                If any dataset failed to load.
         """
 
-        if self.data_frames['extra_data_y'] is not None:
-            self.data_frames['extra_data_y'].data_cleaned = True
+        self.load_data_frames()
+        for data_type in self.data_frames:
+            if data_type not in self.data_frames.matched_names:
+                self.clean_sorted_dataset(data_type)
+        for data_type in self.data_frames.matched_names:
+            self.clean_matched_dataset(data_type)
+        self.build_entity_index()
 
-    def clean_data_frames(self) -> None:
+    def build_entity_index(self) -> None:
+        """
+        Establishes the canonical entity dictionary shared by all the
+        datasets: the sorted unique entities (e.g., countries) of all the
+        datasets, however many. The position of an entity in this index
+        is its integer code (see `DataFrame.align_to_entities`), used
+        instead of its name by the merges, the tracker and the hover
+        annotations.
+
+        Raises:
+            ValueError: If the "x", "y" or "size" dataset is missing.
+        """
+
+        self.data_frames.essential_names()
+
+        entities = pd.concat([
+            df.data_frame[self.common_column]
+            for df in self.data_frames.values()
+            if df is not None
+        ]).dropna()
+
+        self.entity_index = pd.Index(entities.unique()).sort_values()
+        self.build_tracker_index()
+        self.resolve_tracked_element()
+
+    def build_tracker_index(self) -> None:
+        """
+        Builds, once, the prefix search index of the tracker over the
+        entity dictionary: the lowercase entity names, sorted
+        (`tracker_names`), and their entity codes (`tracker_codes`).
+        """
+
+        names = self.entity_index.astype(str).str.lower().to_numpy(dtype=str)
+        order = np.argsort(names, kind="stable")
+
+        self.tracker_names = names[order]
+        self.tracker_codes = order.astype(np.int32)
+
+    def resolve_tracked_element(self) -> None:
+        """
+        Resolves, once, the tracked element into the codes of the entities
+        it names, in `tracked_codes` (and `tracked_mask`): it is split on
+        commas, and each part matches the entities whose name starts with
+        it (case insensitive), found by binary search in the tracker index
+        (see `build_tracker_index`), or, if none does, the entities whose
+        name contains it (case insensitive), found by a scan of the index.
+        The highlighting of a frame is then a mere gather of
+        `tracked_mask` by the entity codes of its points.
+        """
+
+        if self.entity_index is None:
+            return
+
+        codes = [np.empty(0, dtype=np.int32)]
+        for prefix in self.tracked_element.lower().split(","):
+            prefix = prefix.strip()
+            if not prefix:
+                continue
+            start, stop = np.searchsorted(
+                self.tracker_names,
+                [prefix, prefix + "\U0010ffff"]
+            )
+            if start == stop:
+                found = np.char.find(self.tracker_names, prefix) >= 0
+                codes.append(self.tracker_codes[found])
+            else:
+                codes.append(self.tracker_codes[start:stop])
+
+        self.tracked_codes = np.unique(np.concatenate(codes))
+        self.tracked_mask = np.zeros(len(self.entity_index), dtype=bool)
+        self.tracked_mask[self.tracked_codes] = True
+
+    def get_first_last_column_names(self) -> None:
+        """
+        Retrieves and stores the first and
+        last column names for each DataFrame.
+
+        - Iterates over all DataFrames in `data_frames`.
+        - Checks if each DataFrame has been cleaned before proceeding.
+        - Calls the `get_first_last_column_names` method for each DataFrame.
+
+        Raises:
+            DataFrameNotCleanedException: If any DataFrame is not cleaned
+            before this operation.
+        """
+
+        for key, data_frame in self.data_frames.items():
+            if data_frame is None:
+                continue
+            if not data_frame.data_cleaned:
+                raise data_frame.DataFrameNotCleanedException(
+                    f"The DataFrame '{key}' has not been cleaned."
+                )
+            data_frame.get_first_last_column_names()
+
+    def build_numeric_cubes(self) -> None:
+        """
+        Converts each cleaned DataFrame into its dense numeric
+        (entity × time division) cube, a single time before precomputing,
+        and aligns it on the shared entity index.
+        The mostly-missing datasets are stored sparse instead
+        (see `set_sparse_storage`).
+
+        Raises:
+            DataFrameNotCleanedException: If any DataFrame is not cleaned
+            before this operation.
+        """
+
+        for data_frame in self.data_frames.values():
+            if data_frame is not None:
+                data_frame.build_numeric_cube(
+                    self.common_column,
+                    sparse_fill_ratio=self.sparse_fill_ratio
+                )
+                data_frame.align_to_entities(self.entity_index)
+
+    def aligned_timediv_extraction(
+        self,
+        timediv: int,
+    ) -> AlignedData:
         """
-        Cleans all associated DataFrames in the `data_frames` attribute.
+        Extracts the values of a given time division across all DataFrames,
+        on the shared entity index (views, no copy): one value per entity
+        for a wide DataFrame, and its observations with their entity codes
+        for a long (sparse) one (see `DataFrame.aligned_timediv_data`).
 
-        - Sequentially calls individual cleaning methods:
-            - `clean_data_x`
-            - `clean_data_y`
-            - `clean_data_point_size`
-            - `clean_extra_data_x`
-            - `clean_extra_data_y`
+        Args:
+            timediv (int):
+                The time division for which data should be extracted.
+
+        Returns:
+            AlignedData:
+                For each entry in `data_frames`, by name, in merged column
+                order (see `DatasetRegistry.ordered_names`): its column
+                name, its values, its entity presence mask and the entity
+                codes of its values (None for a wide DataFrame),
+                or None if the DataFrame does not contain
+                this time division.
+        """
+
+        res = dict()
+        for key in self.data_frames.ordered_names():
+            df = self.data_frames[key]
+            data = df.aligned_timediv_data(timediv)
+            res[key] = (
+                None if data is None
+                else (df.data_name, data[0], df.entity_present, data[1])
+            )
+
+        return res
+
+    def precompute_data(self):
+        """
+        Precomputes and stores data for all time divisions.
+
+        Calculates linear regressions for both logarithmic and linear scales
+        of every time division at once (see `batch_linear_regressions`),
+        or reloads them from the precompute cache, when enabled
+        (see `load_precomputed_results`) if this configuration
+        has already been computed.
+        Fills attributes for correlation coefficients and p-values over time,
+        and the axis limits of the scatter graphs
+        (see `compute_view_limits`).
+        Only these series of one value per time division are kept: the merge
+        of each time division (kept entities, merged data) is
+        built when its TimeDiv is materialized (see `materialize_timediv`).
+        Unless the lazy mode is enabled (see `set_lazy_precompute`),
+        the TimeDiv of every time division is materialized here.
+        In lazy mode, `precomputed_data` is a bounded LRU cache
+        which materializes each TimeDiv only when it is requested.
 
         Raises:
             ValueError:
-                If any DataFrame is missing or improperly initialized.
+                If the data is not properly cleaned or initialized.
+        """
+
+        self.get_first_last_column_names()
+        self.build_numeric_cubes()
+        self.timediv_presence = self.data_frames.joined_presence(
+            list(self.timediv_range)
+        )
+
+        if not (
+            self.use_precompute_cache
+            and self.load_precomputed_results()
+        ):
+            self.batch_linear_regressions()
+            if self.use_precompute_cache:
+                self.save_precomputed_results()
+
+        self.compute_view_limits()
+
+        if self.timediv_cache_capacity is None:
+            self.precomputed_data = {
+                div: self.materialize_timediv(div)
+                for div in self.timediv_range
+            }
+        else:
+            self.precomputed_data = TimeDivCache(
+                self.materialize_timediv,
+                self.timediv_range,
+                capacity=self.timediv_cache_capacity,
+                prefetch_size=self.timediv_prefetch_size
+            )
+
+    def batch_linear_regressions(self) -> None:
+        """
+        Computes the logarithmic and linear regressions
+        of every time division at once.
+
+        - Reads the entity presence of every dataset, joined once
+        (`timediv_presence`), so that the merge of each time division
+        only reads the "x", "y" and "size" datasets,
+        however many datasets are registered.
+        - Runs `regress_timediv_chunk` on the whole time division range,
+        or, if the parallel mode is enabled (see `set_parallel_precompute`),
+        on chunks of it spread across a process pool.
+        - Stores the coefficients in `regression_results`,
+        and fills `corr_log`, `pvalue_log`, `corr_lin` and `pvalue_lin`.
+        - Stores the bounds of the points of each time division
+        in `point_bounds`.
+        The kept entities of the time divisions are only used for the
+        regressions: their merged rows are not kept
+        (see `materialize_timediv`).
+        """
+
+        datasets = {
+            key: (
+                self.data_frames[key].data_name,
+                self.data_frames[key].aligned_storage(),
+                self.data_frames[key].entity_present,
+                self.data_frames[key].timediv_positions
+            )
+            for key in self.data_frames.essential_names()
+        }
+
+        if self.precompute_workers is None:
+            self.regression_results = self.regress_timediv_chunk(
+                datasets,
+                list(self.timediv_range),
+                self.timediv_presence
+            )
+        else:
+            self.regression_results = self.parallel_regressions(
+                datasets,
+                self.timediv_presence
+            )
+
+        self.point_bounds = self.regression_results.pop("bounds")
+
+        self.set_correlation_series()
+
+    @staticmethod
+    def pad_limits(
+        low: float,
+        high: float,
+        margin: float,
+        log: bool = False
+    ) -> tuple[float, float]:
         """
+        Pads data limits by a margin of their extent, as a matplotlib
+        autoscale does (in log space for a log axis).
 
-        self.clean_data_x()
-        self.clean_data_y()
-        self.clean_data_point_size()
-        self.clean_extra_data_x()
-        self.clean_extra_data_y()
+        Args:
+            low (float): The lower data limit.
+            high (float): The upper data limit.
+            margin (float): The margin, as a fraction of the extent.
+            log (bool): Whether the axis is log-scaled.
+
+        Returns:
+            tuple[float, float]: The padded limits.
+        """
+
+        if log:
+            low, high = np.log10(low), np.log10(high)
+        low, high = mtransforms.nonsingular(low, high, expander=margin)
+        delta = (high - low) * margin
+        low, high = low - delta, high + delta
+        if log:
+            return 10 ** low, 10 ** high
+
+        return low, high
+
+    @staticmethod
+    def timediv_point_bounds(
+        data_x: np.ndarray,
+        data_y: np.ndarray,
+        mask: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """
+        Reduces (time division × entity) matrices of the x and y values
+        to the data bounds of the merged points of each time division,
+        without any loop over the time divisions.
+
+        Args:
+            data_x (np.ndarray): The x values.
+            data_y (np.ndarray): The y values.
+            mask (np.ndarray): The validity mask of each time division.
+
+        Returns:
+            dict[str, np.ndarray]:
+                For "extent", the x extent (min, max) of the points of each
+                time division (that of its regression lines), NaN if none
+                is finite, and for "log" and "lin", the bounds
+                (x min, x max, y min, y max) of its points which can be
+                drawn on that x scale, NaN if there are none.
+        """
+
+        bounds = {
+            "extent": np.stack((
+                np.min(data_x, axis=1, initial=np.inf, where=mask),
+                np.max(data_x, axis=1, initial=-np.inf, where=mask)
+            ), axis=1)
+        }
+        bounds["extent"][~(mask & np.isfinite(data_x)).any(axis=1)] = np.nan
+
+        valid = mask & np.isfinite(data_x) & np.isfinite(data_y)
+        for scale, scale_valid in (
+            ("log", valid & (data_x > 0)),
+            ("lin", valid)
+        ):
+            bounds[scale] = np.stack((
+                np.min(data_x, axis=1, initial=np.inf, where=scale_valid),
+                np.max(data_x, axis=1, initial=-np.inf, where=scale_valid),
+                np.min(data_y, axis=1, initial=np.inf, where=scale_valid),
+                np.max(data_y, axis=1, initial=-np.inf, where=scale_valid)
+            ), axis=1)
+            bounds[scale][~scale_valid.any(axis=1)] = np.nan
+
+        return bounds
+
+    def compute_view_limits(self) -> None:
+        """
+        Precomputes the axis limits of the scatter graphs, for the log and
+        lin views (see `set_view_limits`): those of each time division,
+        on its points and its regression line, and those of all the time
+        divisions together, padded by the default axes margins.
+
+        Only arrays of one value per time division are read: the bounds
+        of the points (`point_bounds`, reduced with the regressions) and
+        the regression coefficients. No TimeDiv is materialized and no
+        data is read again, so the lazy mode does not pay an extra pass
+        over the time divisions. A time division without any point
+        gets NaN limits (the axes then keep their previous limits).
+        """
+
+        margins = (
+            plt.rcParams["axes.xmargin"],
+            plt.rcParams["axes.ymargin"]
+        )
+        x_extent = self.point_bounds["extent"]
+        bounds = {}
+
+        for log, scale in ((True, "log"), (False, "lin")):
+            slope, intercept = self.regression_results[scale][:2]
+            # the regression line ends, as sampled by `LinReg.line`
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if log:
+                    line_x = 10 ** np.log10(x_extent)
+                    line_y = (
+                        slope[:, None] * np.log10(line_x) + intercept[:, None]
+                    )
+                else:
+                    line_x = x_extent
+                    line_y = slope[:, None] * line_x + intercept[:, None]
+            valid = np.isfinite(line_x) & np.isfinite(line_y)
+            if log:
+                valid &= line_x > 0
+
+            line_bounds = np.stack((
+                np.min(line_x, axis=1, initial=np.inf, where=valid),
+                np.max(line_x, axis=1, initial=-np.inf, where=valid),
+                np.min(line_y, axis=1, initial=np.inf, where=valid),
+                np.max(line_y, axis=1, initial=-np.inf, where=valid)
+            ), axis=1)
+            line_bounds[~valid.any(axis=1)] = np.nan
+
+            point_bounds = self.point_bounds[scale]
+            bounds[scale] = np.stack((
+                np.fmin(point_bounds[:, 0], line_bounds[:, 0]),
+                np.fmax(point_bounds[:, 1], line_bounds[:, 1]),
+                np.fmin(point_bounds[:, 2], line_bounds[:, 2]),
+                np.fmax(point_bounds[:, 3], line_bounds[:, 3])
+            ), axis=1)
+
+        self.view_limits = {}
+        self.view_limits_global = {}
+        for scale, scale_bounds in bounds.items():
+            log = scale == "log"
+            limits = np.full_like(scale_bounds, np.nan)
+            for i, (x_min, x_max, y_min, y_max) in enumerate(scale_bounds):
+                if np.isfinite(x_min):
+                    limits[i] = (
+                        *self.pad_limits(x_min, x_max, margins[0], log),
+                        *self.pad_limits(y_min, y_max, margins[1])
+                    )
+            self.view_limits[scale] = limits
+
+            global_limits = np.full(4, np.nan)
+            if np.isfinite(scale_bounds[:, 0]).any():
+                global_limits = np.array((
+                    *self.pad_limits(
+                        np.nanmin(scale_bounds[:, 0]),
+                        np.nanmax(scale_bounds[:, 1]),
+                        margins[0],
+                        log
+                    ),
+                    *self.pad_limits(
+                        np.nanmin(scale_bounds[:, 2]),
+                        np.nanmax(scale_bounds[:, 3]),
+                        margins[1]
+                    )
+                ))
+            self.view_limits_global[scale] = global_limits
+
+    def set_correlation_series(self) -> None:
+        """
+        Fills `corr_log`, `pvalue_log`, `corr_lin` and `pvalue_lin`
+        from `regression_results`.
+        """
+
+        _, _, self.corr_log, self.pvalue_log, _, _ = (
+            self.regression_results["log"]
+        )
+        _, _, self.corr_lin, self.pvalue_lin, _, _ = (
+            self.regression_results["lin"]
+        )
+
+    @staticmethod
+    def regress_timediv_chunk(
+        datasets: dict[str, tuple],
+        divs: list[int],
+        presence: tuple[np.ndarray, dict[int, int]]
+    ) -> dict[str, tuple[np.ndarray, ...]]:
+        """
+        Computes the logarithmic and linear regressions
+        of a chunk of time divisions.
+
+        - Computes the kept entities of each time division
+        (`TimeDiv.valid_rows`) from the joined presence of all the
+        datasets and the values (or observations, for a long layout)
+        of the "x", "y" and "size" ones only.
+        - Stacks the x and y values of these entities into
+        (time division × entity) matrices, masked with them.
+        - Runs `batch_linregress` once per x transform (log10 and none)
+        instead of one `scipy.stats.linregress` call per division.
+        - Reduces the same matrices to the data bounds of the points
+        of each time division (see `timediv_point_bounds`).
+
+        Args:
+            datasets (dict[str, tuple]):
+                For each of the "x", "y" and "size" datasets, by name,
+                in that order: its column name, its aligned storage
+                arrays (see `DataFrame.aligned_storage`, wide or long
+                layout), its entity presence mask and its time division
+                to position index.
+            divs (list[int]):
+                The time divisions of the chunk.
+            presence (tuple[np.ndarray, dict[int, int]]):
+                The joined entity presence of all the datasets
+                (see `DatasetRegistry.joined_presence`).
+
+        Returns:
+            dict[str, tuple[np.ndarray, ...]]:
+                For "log" and "lin", the `batch_linregress` results,
+                one value per time division of `divs`,
+                and for "bounds", the `timediv_point_bounds`
+                of the time divisions.
+        """
+
+        essentials = list(datasets)
+        masks, div_coverages = presence
+        nb_entities = masks.shape[1]
+        shape = (len(divs), nb_entities)
+        data_x = np.full(shape, np.nan)
+        data_y = np.full(shape, np.nan)
+        mask = np.zeros(shape, dtype=bool)
+
+        for i, div in enumerate(divs):
+            aligned_data = {}
+            for key, (name, storage, present, positions) in datasets.items():
+                if div not in positions:
+                    aligned_data[key] = None
+                    continue
+                values, codes = DataFrame.storage_timediv_data(
+                    storage,
+                    positions[div]
+                )
+                aligned_data[key] = (name, values, present, codes)
+
+            rows = TimeDiv.valid_rows(
+                nb_entities,
+                aligned_data,
+                essentials,
+                masks[div_coverages[div]]
+            )
+            mask[i, rows] = True
+            for matrix, key in ((data_x, essentials[0]),
+                                (data_y, essentials[1])):
+                _, values, _, codes = aligned_data[key]
+                matrix[i, rows] = TimeDiv.gather_values(values, codes, rows)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            data_x_log = np.log10(data_x)
+
+        return {
+            "log": batch_linregress(data_x_log, data_y, mask),
+            "lin": batch_linregress(data_x, data_y, mask),
+            "bounds": Day02Ex03.timediv_point_bounds(data_x, data_y, mask),
+        }
+
+    @staticmethod
+    def regress_shared_timediv_chunk(
+        shared_datasets: dict[str, tuple],
+        divs: list[int],
+        presence: tuple[np.ndarray, dict[int, int]]
+    ) -> dict[str, tuple[np.ndarray, ...]]:
+        """
+        Worker process side of `parallel_regressions`:
+        maps the shared memory arrays, then runs `regress_timediv_chunk`.
+
+        Args:
+            shared_datasets (dict[str, tuple]):
+                As the `datasets` of `regress_timediv_chunk`, with
+                the `share_array` descriptors instead of the arrays.
+            divs (list[int]):
+                The time divisions of the chunk.
+            presence (tuple[np.ndarray, dict[int, int]]):
+                As in `regress_timediv_chunk`.
+
+        Returns:
+            dict[str, tuple[np.ndarray, ...]]:
+                As `regress_timediv_chunk`.
+        """
+
+        blocks = []
+        datasets = {}
+        storage = present = None
+        for key, dataset in shared_datasets.items():
+            name, storage_descriptors, present_descriptor, positions = (
+                dataset
+            )
+            storage = []
+            for descriptor in storage_descriptors:
+                shm, array = attach_array(descriptor)
+                blocks.append(shm)
+                storage.append(array)
+            present_shm, present = attach_array(present_descriptor)
+            blocks.append(present_shm)
+            datasets[key] = (name, tuple(storage), present, positions)
+
+        try:
+            return Day02Ex03.regress_timediv_chunk(datasets, divs, presence)
+        finally:
+            # The views must be released before closing their blocks.
+            datasets.clear()
+            storage = present = array = None
+            for shm in blocks:
+                shm.close()
+
+    def parallel_regressions(
+        self,
+        datasets: dict[str, tuple],
+        presence: tuple[np.ndarray, dict[int, int]]
+    ) -> dict[str, tuple[np.ndarray, ...]]:
+        """
+        Spreads `regress_timediv_chunk` across a process pool,
+        by chunks of `precompute_chunk_size` time divisions.
+
+        - The aligned storage arrays and presence masks are copied once
+        into shared memory, instead of being pickled for each chunk
+        (the joined presence masks, a handful of rows, are pickled).
+        - The chunk results are gathered in time division order,
+        so the series stay aligned with `timediv_range`.
+
+        Args:
+            datasets (dict[str, tuple]):
+                As in `regress_timediv_chunk`.
+            presence (tuple[np.ndarray, dict[int, int]]):
+                As in `regress_timediv_chunk`.
+
+        Returns:
+            dict[str, tuple[np.ndarray, ...]]:
+                As `regress_timediv_chunk`, for the whole range.
+        """
+
+        divs = list(self.timediv_range)
+        chunks = [
+            divs[i:i + self.precompute_chunk_size]
+            for i in range(0, len(divs), self.precompute_chunk_size)
+        ]
+
+        blocks = []
+        shared_datasets = {}
+        try:
+            for key, dataset in datasets.items():
+                name, storage, present, positions = dataset
+                storage_descriptors = []
+                for array in storage:
+                    shm, descriptor = share_array(array)
+                    blocks.append(shm)
+                    storage_descriptors.append(descriptor)
+                present_shm, present_descriptor = share_array(present)
+                blocks.append(present_shm)
+                shared_datasets[key] = (
+                    name,
+                    tuple(storage_descriptors),
+                    present_descriptor,
+                    positions
+                )
+
+            with ProcessPoolExecutor(
+                max_workers=self.precompute_workers
+            ) as executor:
+                chunk_results = list(executor.map(
+                    Day02Ex03.regress_shared_timediv_chunk,
+                    [shared_datasets] * len(chunks),
+                    chunks,
+                    [presence] * len(chunks)
+                ))
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+        results = {
+            scale: tuple(
+                np.concatenate([result[scale][i] for result in chunk_results])
+                for i in range(6)
+            )
+            for scale in ("log", "lin")
+        }
+        results["bounds"] = {
+            key: np.concatenate(
+                [result["bounds"][key] for result in chunk_results]
+            )
+            for key in chunk_results[0]["bounds"]
+        }
+
+        return results
+
+    def precompute_cache_sources(self) -> str:
+        """
+        Returns the identifier of the sources of the precompute artifact:
+        the path of every input dataset file, by name.
+        A new artifact supersedes the older ones of the same sources
+        (see `utils.prune_precompute_entries`).
+
+        Returns:
+            str: The hexadecimal identifier.
+        """
+
+        sources = {
+            key: None if df is None else os.path.abspath(df.file_path)
+            for key, df in self.data_frames.items()
+        }
+
+        return hashlib.blake2b(
+            json.dumps(sources, sort_keys=True).encode(),
+            digest_size=16
+        ).hexdigest()
+
+    def precompute_cache_key(self) -> str:
+        """
+        Returns the key identifying the current precompute configuration:
+        the sources (see `precompute_cache_sources`), the content hash
+        and name of every input dataset, the dataset roles,
+        the common column, the time division range
+        and the entity matching parameters.
+
+        The content hashes are those of the dataset cache entries
+        (see `utils.dataset_content_hash`): no dataset is read again.
+        The cleaned entities are fully determined by the dataset contents
+        and the entity matching, itself determined by its threshold,
+        the manual overrides and the content of the alias store (a small
+        file): they are not hashed.
+
+        Returns:
+            str: The hexadecimal key.
+        """
+
+        alias_store_path = self.entity_alias_store_path
+        configuration = {
+            "version": PRECOMPUTE_CACHE_VERSION,
+            "sources": self.precompute_cache_sources(),
+            "datasets": {
+                key: None if df is None else [
+                    dataset_content_hash(
+                        df.file_path,
+                        df.column_selection()
+                    ),
+                    df.data_name,
+                ]
+                for key, df in self.data_frames.items()
+            },
+            "roles": self.data_frames.roles,
+            "common_column": self.common_column,
+            "timediv_range": [
+                self.timediv_range.start,
+                self.timediv_range.stop
+            ],
+            "entity_match_threshold": self.entity_match_threshold,
+            "entity_aliases": self.entity_aliases,
+            "alias_store": None
+            if alias_store_path is None
+            or not os.path.isfile(alias_store_path)
+            else file_digest(alias_store_path),
+        }
+
+        return hashlib.blake2b(
+            json.dumps(configuration, sort_keys=True).encode(),
+            digest_size=16
+        ).hexdigest()
+
+    def precompute_cache_dir(self) -> str:
+        """
+        Returns the cache directory of the current precompute configuration
+        (in the `.cache` directory next to the "x" dataset file).
+        """
+
+        return precompute_entry_dir(
+            self.data_frames.by_role("x").file_path,
+            self.precompute_cache_key()
+        )
+
+    def save_precomputed_results(self) -> None:
+        """
+        Stores the outputs of `batch_linear_regressions` in a versioned
+        on-disk artifact (see `utils.write_array_entry`):
+        the bounds of the points of every time division (`point_bounds`)
+        and the regression coefficients of both scales,
+        including the correlation coefficient and p-value series.
+        The artifacts it supersedes are then removed
+        (see `utils.prune_precompute_entries`).
+
+        The merged data of the time divisions is not stored: like the
+        regressions' inputs, it is rebuilt from the aligned datasets
+        (themselves reloaded from the dataset cache) when a TimeDiv is
+        materialized (see `materialize_timediv`), as a selection of
+        already aligned rows, for the displayed time divisions only.
+        Storing it would write every time division in full to spare
+        little more than that selection.
+
+        Failing to write the artifact is not an error:
+        it will simply be computed again on the next run.
+        """
+
+        arrays = {}
+        for scale, results in self.regression_results.items():
+            for field, values in zip(REGRESSION_FIELDS, results):
+                arrays[f"{scale}_{field}"] = values
+        for key, bounds in self.point_bounds.items():
+            arrays[f"bounds_{key}"] = bounds
+
+        anchor_path = self.data_frames.by_role("x").file_path
+        key = self.precompute_cache_key()
+        sources = self.precompute_cache_sources()
+        try:
+            write_array_entry(
+                precompute_entry_dir(anchor_path, key),
+                arrays,
+                {
+                    "precompute_version": PRECOMPUTE_CACHE_VERSION,
+                    "sources": sources,
+                }
+            )
+        except OSError as error:
+            print(f"Warning: precompute cache not written: {error}")
+            return
+
+        prune_precompute_entries(anchor_path, key, sources)
+
+    def load_precomputed_results(self) -> bool:
+        """
+        Reloads, memory-mapped, the artifact written by
+        `save_precomputed_results` for the current configuration.
 
-    def get_first_last_column_names(self) -> None:
+        Returns:
+            bool: True if the artifact has been found and reloaded.
         """
-        Retrieves and stores the first and
-        last column names for each DataFrame.
 
-        - Iterates over all DataFrames in `data_frames`.
-        - Checks if each DataFrame has been cleaned before proceeding.
-        - Calls the `get_first_last_column_names` method for each DataFrame.
+        entry = read_array_entry(self.precompute_cache_dir(), mmap_mode="r")
+        if entry is None:
+            return False
+        arrays, _ = entry
 
-        Raises:
-            DataFrameNotCleanedException: If any DataFrame is not cleaned
-            before this operation.
-        """
+        self.regression_results = {
+            scale: tuple(
+                arrays[f"{scale}_{field}"] for field in REGRESSION_FIELDS
+            )
+            for scale in ("log", "lin")
+        }
+        self.point_bounds = {
+            key: arrays[f"bounds_{key}"] for key in ("extent", "log", "lin")
+        }
+        self.set_correlation_series()
 
-        for key, data_frame in self.data_frames.items():
-            if data_frame is None:
-                continue
-            if not data_frame.data_cleaned:
-                raise data_frame.DataFrameNotCleanedException(
-                    f"The DataFrame '{key}' has not been cleaned."
-                )
-            data_frame.get_first_last_column_names()
+        return True
 
-    def subsets_timediv_extraction(
+    def materialize_timediv(
         self,
-        timediv: int,
-    ) -> list[pd.DataFrame]:
+        div: int
+    ) -> TimeDiv:
         """
-        Extracts subsets of data for a given
-        time division across all DataFrames.
+        Builds the full TimeDiv of a time division:
+        its merged data, from its kept entities (see `TimeDiv.valid_rows`,
+        with the joined presence of `timediv_presence`), its ready-to-plot
+        point sizes and its regression objects, from the coefficients
+        already computed by `batch_linear_regressions`
+        (or reloaded from the precompute cache).
 
         Args:
-            timediv (int):
-                The time division for which data should be extracted.
+            div (int): The time division.
 
         Returns:
-            list[pd.DataFrame]:
-                A list of DataFrames, one for each entry in `data_frames`.
-                If a DataFrame is `None`,
-                its corresponding subset will also be `None`.
-        """
-
-        res = list()
-        for df in self.data_frames.values():
-            if df is not None:
-                res.append(
-                    df.subset_timediv_extraction(
-                        timediv,
-                        self.common_column
-                    )
-                )
-            else:
-                res.append(None)
+            TimeDiv: The ready-to-plot TimeDiv of `div`.
+        """
 
-        return res
+        i = self.timediv_range.index(div)
 
-    def precompute_data(self):
-        """
-        Precomputes and stores data for all time divisions.
+        timediv = TimeDiv(
+            self.common_column,
+            div,
+            essentials=self.data_frames.essential_names()
+        )
+        aligned_data = self.aligned_timediv_extraction(div)
+        masks, div_coverages = self.timediv_presence
+        timediv.set_merged_rows(
+            self.entity_index,
+            aligned_data,
+            TimeDiv.valid_rows(
+                len(self.entity_index),
+                aligned_data,
+                timediv.essentials,
+                masks[div_coverages[div]]
+            )
+        )
+        timediv.point_sizes = timediv.merged_data[
+            self.data_frames.by_role("size").data_name
+            ].to_numpy() / self.data_point_size_divider
+        for log, scale in ((True, "log"), (False, "lin")):
+            lin_reg = LinReg(
+                *(values[i] for values in self.regression_results[scale]),
+                log=log
+            )
+            if log:
+                timediv.lin_reg_log = lin_reg
+            else:
+                timediv.lin_reg_lin = lin_reg
 
-        Extracts subsets for each time division.
-        Merges the subsets into a single DataFrame for each division.
-        Calculates linear regressions for both logarithmic and linear scales.
-        Fills attributes for correlation coefficients and p-values over time.
+        return timediv
 
-        Raises:
-            ValueError:
-                If the data is not properly cleaned or initialized.
+    def get_timediv(
+        self,
+        div: int
+    ) -> TimeDiv:
         """
+        Returns the TimeDiv of a time division,
+        whether it was precomputed eagerly or lazily.
 
-        self.get_first_last_column_names()
-
-        for div in self.timediv_range:
-            timediv = TimeDiv(
-                self.subsets_timediv_extraction(div),
-                self.common_column,
-                div
-            )
-            timediv.merge()
-            timediv.linear_regressions()
+        Args:
+            div (int): The time division.
 
-            self.precomputed_data[div] = timediv
-            self.corr_log.append(timediv.lin_reg_log.corr)
-            self.pvalue_log.append(timediv.lin_reg_log.pvalue)
-            self.corr_lin.append(timediv.lin_reg_lin.corr)
-            self.pvalue_lin.append(timediv.lin_reg_lin.pvalue)
+        Returns:
+            TimeDiv: The TimeDiv of `div`.
+        """
 
-        self.corr_log = np.array(self.corr_log)
-        self.pvalue_log = np.array(self.pvalue_log)
-        self.corr_lin = np.array(self.corr_lin)
-        self.pvalue_lin = np.array(self.pvalue_lin)
+        return self.precomputed_data[div]
 
     def get_text_sizes(
         self,
@@ -839,10 +2204,37 @@ class Day02Ex03:
             wspace=0.2
         )
 
+    def build_color_mapping(
+        self,
+        name: str = "cmap_name"
+    ) -> None:
+        """
+        Builds, once, the colormap and the normalization of the points
+        colors (see `get_points_color`) and of the colorbar.
+
+        Args:
+            name (str): The name of the colormap.
+
+        Notes:
+            - The values are normalized from 0 to 100.
+            - Missing values (NaN) are mapped to gray.
+        """
+
+        vmin: float = 0
+        vmax: float = 100
+        nb_divs: int = 100
+        gray = (0.5, 0.5, 0.5, 1.0)
+        self.cmap = LinearSegmentedColormap.from_list(
+            name=name,
+            colors=self.cmap_colors,
+            N=nb_divs
+        ).with_extremes(bad=gray)
+        self.norm = Normalize(vmin=vmin, vmax=vmax)
+
     def build_colorbar(
         self,
         ax: Axes,
-        extra_data: DataFrame,
+        extra_data: DataFrame | None,
     ) -> None:
         """
         Adds a colorbar to the specified axis based on extra data.
@@ -850,16 +2242,19 @@ class Day02Ex03:
         Args:
             ax (Axes):
                 The axis to which the colorbar will be added.
-            extra_data (DataFrame):
-                The data to use for determining color scaling.
+            extra_data (DataFrame | None):
+                The data to use for determining color scaling
+                (None: no dataset has the "color" role, no colorbar).
 
         Notes:
-            - The colorbar is based on a linear segmented colormap.
+            - The colorbar is based on a linear segmented colormap,
+            the one of the points colors (see `build_color_mapping`).
             - The default range for values is 0 to 100.
         """
 
-        vmin: float = 0
-        vmax: float = 100
+        if extra_data is None:
+            return
+
         orientation: str = "vertical"
         label_position: str = "right"
         ticks_position: str = "left"
@@ -867,14 +2262,8 @@ class Day02Ex03:
         fraction: float = 0.02
         aspect: int = 50
         labelpad: int = 1
-        nb_divs: int = 100
-        cmap = LinearSegmentedColormap.from_list(
-            name=extra_data.data_name,
-            colors=self.cmap_colors,
-            N=nb_divs
-        )
-        norm = Normalize(vmin=vmin, vmax=vmax)
-        sm = ScalarMappable(cmap=cmap, norm=norm)
+        self.build_color_mapping(extra_data.data_name)
+        sm = ScalarMappable(cmap=self.cmap, norm=self.norm)
         sm.set_array([])
         self.cbar = self.fig.colorbar(
             sm,
@@ -894,46 +2283,40 @@ class Day02Ex03:
     def get_points_color(
         self,
         data: pd.DataFrame
-    ) -> list[str]:
+    ) -> np.ndarray:
         """
-        Determines the colors for scatter plot points based on extra data.
+        Determines the colors for scatter plot points based on
+        the dataset of the "color" role, for all the points at once
+        (with the colormap built once, see `build_color_mapping`).
 
         Args:
             data (pd.DataFrame):
                 The data for which colors need to be assigned.
 
         Returns:
-            list[str]: A list of RGBA tuples for each data point.
-            Points without extra data are assigned a default blue color.
-        """
-
-        extra_data_colored_name = self.data_frames[
-            self.colored_extra_data].data_name
-        if extra_data_colored_name in data.columns:
-            colors = self.cmap_colors
-            gray = (0.5, 0.5, 0.5, 1.0)
-            cmap = LinearSegmentedColormap.from_list(
-                "cmap_name",
-                colors,
-                N=100
-            )
-            colored_extra_data_values = data[extra_data_colored_name]
-            norm = Normalize(vmin=0, vmax=100)
-            colors = [
-                cmap(norm(g)) if not np.isnan(g) else gray
-                for g in colored_extra_data_values
-            ]
+            np.ndarray: The RGBA color of each data point (point × 4).
+            Points without extra data (NaN) are assigned gray,
+            and all the points blue if there is no "color" role data.
+        """
 
-        else:
-            colors = ['blue'] * len(data)
+        colored_data = self.data_frames.by_role("color")
+        if colored_data is None or colored_data.data_name not in data.columns:
+            return np.broadcast_to(to_rgba("blue"), (len(data), 4))
 
-        return colors
+        if self.cmap is None:
+            self.build_color_mapping(colored_data.data_name)
+
+        return self.cmap(
+            self.norm(data[colored_data.data_name].to_numpy(dtype=float))
+        )
 
     def plot_scatter(
         self,
         ax: Axes,
         data: pd.DataFrame,
-        points_color: list[str],
+        points_color: np.ndarray,
+        entity_codes: np.ndarray,
+        point_sizes: np.ndarray
     ) -> mplcollec.PathCollection:
         """
         Plots a scatter graph with optional
@@ -944,8 +2327,13 @@ class Day02Ex03:
                 The axis on which to plot the scatter graph.
             data (pd.DataFrame):
                 The data to plot.
-            points_color (list[str]):
-                The color of each point.
+            points_color (np.ndarray):
+                The RGBA color of each point.
+            entity_codes (np.ndarray):
+                The entity code of each point.
+            point_sizes (np.ndarray):
+                The ready-to-plot size of each point
+                (see `materialize_timediv`).
 
         Returns:
             mplcollec.PathCollection:
@@ -956,39 +2344,84 @@ class Day02Ex03:
             - Highlights the tracked element in cyan if specified.
         """
 
-        pt_size_s_name = self.data_frames["data_point_size"].short_name
+        data_x = self.data_frames.by_role("x")
+        data_y = self.data_frames.by_role("y")
+        data_point_size = self.data_frames.by_role("size")
+        pt_size_s_name = data_point_size.short_name
+        x = data[data_x.data_name].to_numpy()
+        y = data[data_y.data_name].to_numpy()
         scatter = ax.scatter(
-            data[self.data_frames["data_x"].data_name].values,
-            data[self.data_frames["data_y"].data_name].values,
-            s=data[
-                self.data_frames["data_point_size"].data_name
-                ].values / self.data_point_size_divider,
+            x,
+            y,
+            s=point_sizes,
             c=points_color,
             alpha=0.7,
             label=f"{self.common_column.title()} ({pt_size_s_name}-sized)"
         )
 
-        if self.tracked_element:
-            highlighted = data[
-                data[self.common_column].str.contains(
-                    self.tracked_element,
-                    case=False,
-                    na=False
-                )
-            ]
-            if not highlighted.empty:
+        if self.tracked_codes.size:
+            highlighted = self.tracked_mask[entity_codes]
+            if highlighted.any():
                 ax.scatter(
-                    highlighted[self.data_frames["data_x"].data_name],
-                    highlighted[self.data_frames["data_y"].data_name],
-                    s=highlighted[
-                        self.data_frames["data_point_size"].data_name
-                        ] / self.data_point_size_divider,
+                    x[highlighted],
+                    y[highlighted],
+                    s=point_sizes[highlighted],
                     color='cyan',
                     label=f"Tracked: {self.tracked_element}",
                     edgecolor='black'
                 )
         return scatter
 
+    def regression_line(
+        self,
+        timediv: TimeDiv,
+        is_log_scale: bool
+    ) -> tuple[np.ndarray, np.ndarray, str]:
+        """
+        Computes the regression line of a time division and its label.
+
+        Args:
+            timediv (TimeDiv):
+                The time division containing regression data.
+            is_log_scale (bool):
+                Whether the regression is log-scaled.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, str]:
+                The x and y values of the line, and its label
+                (with its correlation coefficient).
+
+        Notes:
+            - Only its two ends are evaluated (`LinReg.line`), at the
+            x extent of the data: the line is straight on its own scale.
+            - Any end for which either x or y is not finite is excluded
+            to avoid rendering issues in matplotlib.
+        """
+
+        x = timediv.merged_data[
+            self.data_frames.by_role("x").data_name].to_numpy()
+        regression = (
+            timediv.lin_reg_log
+            if is_log_scale
+            else timediv.lin_reg_lin
+        )
+
+        x_cleaned, y_cleaned = np.array([]), np.array([])
+        if np.isfinite(x).any():
+            x_line, y_line = regression.line(np.nanmin(x), np.nanmax(x))
+            valid_points = np.isfinite(x_line) & np.isfinite(y_line)
+            x_cleaned = x_line[valid_points]
+            y_cleaned = y_line[valid_points]
+
+        reg_line_type = 'log-linear' if is_log_scale else 'linear'
+
+        return (
+            x_cleaned,
+            y_cleaned,
+            f"Regression Line ({reg_line_type})"
+            f" - Corr: {regression.corr:.2f}"
+        )
+
     def plot_regressline(
             self,
             timediv: TimeDiv,
@@ -1011,38 +2444,20 @@ class Day02Ex03:
 
         Notes:
             - The regression line is dashed and
-            annotated with its correlation coefficient.
-            - Points with NaN values are filtered out before plotting.
-            - The regression line is plotted only for data points where both
-            the x-values and the predicted y-values are finite.
-            - Any point for which either x or y is NaN is excluded to ensure
-            proper alignment and avoid rendering issues in matplotlib.
+            annotated with its correlation coefficient
+            (see `regression_line`).
         """
 
-        x = np.sort(
-                timediv.merged_data[self.data_frames["data_x"].data_name])
-        regression = (
-            timediv.lin_reg_log
-            if is_log_scale
-            else timediv.lin_reg_lin
+        x_cleaned, y_cleaned, label = self.regression_line(
+            timediv,
+            is_log_scale
         )
-        y = regression.predicted
-
-        valid_x = ~np.isnan(x)
-        valid_y = ~np.isnan(y)
-        valid_points = valid_x & valid_y
-
-        x_cleaned = x[valid_points]
-        y_cleaned = y[valid_points]
-
-        reg_line_type = 'log-linear' if is_log_scale else 'linear'
         ax.plot(
             x_cleaned,
             y_cleaned,
             color=color,
             linestyle='--',
-            label=f"Regression Line ({reg_line_type})"
-                  f" - Corr: {regression.corr:.2f}"
+            label=label
         )
 
     def set_graph_meta_data(
@@ -1102,7 +2517,8 @@ class Day02Ex03:
         self,
         ax_name: str,
         scatter: PathCollection,
-        data: pd.DataFrame
+        data: pd.DataFrame | None = None,
+        entity_codes: np.ndarray | None = None
     ) -> None:
         """
         Adds interactivity with a cursor to a scatter plot.
@@ -1112,8 +2528,13 @@ class Day02Ex03:
                 Name of the axis.
             scatter (PathCollection):
                 The scatter plot collection.
-            data (pd.DataFrame):
-                The data corresponding to the scatter plot.
+            data (pd.DataFrame | None):
+                The data corresponding to the scatter plot
+                (None: the data of `displayed_timediv`, for a scatter plot
+                updated at each slider tick, see `build_retained_artists`).
+            entity_codes (np.ndarray | None):
+                The entity code of each point
+                (None: those of `displayed_timediv`).
 
         Notes:
             - Annotations display detailed information for each point.
@@ -1150,7 +2571,8 @@ class Day02Ex03:
             Functionality:
                 - Retrieves the index and data of the selected point.
                 - Formats and displays an annotation with relevant details:
-                x-value, y-value, point size, and extra data (if available).
+                x-value, y-value, point size, and the value of every
+                other dataset (N/A if not available).
                 - Styles the annotation box for clarity.
                 - Ensures robust handling of missing or invalid data.
 
@@ -1162,34 +2584,43 @@ class Day02Ex03:
             """
 
             idx = sel.index
+            frame_data, frame_codes = data, entity_codes
+            if frame_data is None:
+                frame_data = self.displayed_timediv.merged_data
+                frame_codes = self.displayed_timediv.merged_rows
 
             try:
-                row = data.iloc[idx]
-                data_x_name = self.data_frames["data_x"].data_name
-                data_y_name = self.data_frames["data_y"].data_name
-                data_point_size_name = self.data_frames[
-                    "data_point_size"].data_name
-                extra_data_x_text = 'N/A'
-                extra_data_x_name = self.data_frames[
-                    "extra_data_x"].data_name
-
-                if (
-                    extra_data_x_name in row.index
-                    and pd.notna(row[extra_data_x_name])
-                ):
-                    extra_data_x_text = f"{row[extra_data_x_name]:.2f}"
+                row = frame_data.iloc[idx]
+                data_x, data_y, data_point_size = (
+                    self.data_frames.by_role(role)
+                    for role in ("x", "y", "size")
+                )
+                extra_lines = []
+                for key in self.data_frames.ordered_names()[3:]:
+                    extra_data = self.data_frames[key]
+                    extra_data_text = 'N/A'
+                    if (
+                        extra_data.data_name in row.index
+                        and pd.notna(row[extra_data.data_name])
+                    ):
+                        extra_data_text = (
+                            f"{row[extra_data.data_name]:.2f}"
+                        )
+                    extra_lines.append(
+                        f"\n{extra_data.short_name}: {extra_data_text}"
+                    )
 
                 sel.annotation.set(
                     text=(
-                        f"{row[self.common_column]}\n"
-                        f"{self.data_frames['data_x'].short_name}: "
-                        f"{put_kmb_suffix(row[data_x_name])} {self.x_unit}\n"
-                        f"{self.data_frames['data_y'].short_name}: "
-                        f"{row[data_y_name]:.1f} {self.y_unit}\n"
-                        f"{self.data_frames['data_point_size'].short_name}: "
-                        f"{put_kmb_suffix(row[data_point_size_name])}\n"
-                        f"{self.data_frames['extra_data_x'].short_name}: "
-                        f"{extra_data_x_text}"
+                        f"{self.entity_index[frame_codes[idx]]}\n"
+                        f"{data_x.short_name}: "
+                        f"{put_kmb_suffix(row[data_x.data_name])} "
+                        f"{self.x_unit}\n"
+                        f"{data_y.short_name}: "
+                        f"{row[data_y.data_name]:.1f} {self.y_unit}\n"
+                        f"{data_point_size.short_name}: "
+                        f"{put_kmb_suffix(row[data_point_size.data_name])}"
+                        + "".join(extra_lines)
                     ),
                     fontsize=10,
                     fontweight="bold"
@@ -1231,7 +2662,10 @@ class Day02Ex03:
         scatter = self.plot_scatter(
             ax,
             data,
-            points_color)
+            points_color,
+            timediv.merged_rows,
+            timediv.point_sizes
+        )
         self.plot_regressline(
             timediv,
             is_log_scale,
@@ -1244,37 +2678,318 @@ class Day02Ex03:
             ax=ax,
             color=color,
         )
+        self.apply_view_limits(ax_name, timediv.div)
 
         self.manage_cursor(
             ax_name,
             scatter,
-            data
+            data,
+            timediv.merged_rows
         )
 
-    def update_color_point_from_extra_data(
+    def build_scatter_artists(
+        self,
+        timediv: TimeDiv,
+        ax_name: str,
+        is_log_scale: bool,
+        color: str
+    ) -> dict[str, Artist]:
+        """
+        Builds, once, the artists of a scatter graph of the retained
+        render mode, without data (see `update_scatter_artists`).
+
+        Args:
+            timediv (TimeDiv): The first time division to plot.
+            ax_name (str): The name of the axis ("log" or "lin").
+            is_log_scale (bool): Whether the graph uses a log scale.
+            color (str): The highlight color for the regression line.
+
+        Returns:
+            dict[str, Artist]:
+                The points ("scatter"), the tracked points ("tracked"),
+                the regression line ("regline") and the title ("title").
+        """
+
+        ax = self.axes[ax_name]
+        pt_size_s_name = self.data_frames.by_role("size").short_name
+        artists = {
+            "scatter": ax.scatter(
+                [],
+                [],
+                alpha=0.7,
+                label=f"{self.common_column.title()} "
+                      f"({pt_size_s_name}-sized)"
+            ),
+            "tracked": ax.scatter(
+                [],
+                [],
+                color='cyan',
+                edgecolor='black',
+                label="_tracked"
+            ),
+            "regline": ax.plot([], [], color=color, linestyle='--')[0],
+            "title": ax.title,
+        }
+        self.set_graph_meta_data(
+            timediv,
+            is_log_scale=is_log_scale,
+            ax=ax,
+            color=color,
+        )
+        self.manage_cursor(ax_name, artists["scatter"])
+
+        return artists
+
+    def build_retained_artists(
+        self,
+        timediv: TimeDiv
+    ) -> None:
+        """
+        Builds, once, the artists of both scatter graphs of the retained
+        render mode and, if blitting is enabled (see `build_blit_manager`),
+        animates them and their legends: the scatter axes themselves
+        (ticks, labels, ...) are then part of the cached background.
+
+        Args:
+            timediv (TimeDiv): The first time division to plot.
+        """
+
+        self.scatter_artists = {
+            "log": self.build_scatter_artists(timediv, "log", True, "red"),
+            "lin": self.build_scatter_artists(timediv, "lin", False, "green"),
+        }
+
+        if self.blit_manager is None:
+            return
+
+        for ax_name, artists in self.scatter_artists.items():
+            self.blit_manager.watch_axes(self.axes[ax_name])
+            for artist in artists.values():
+                self.blit_manager.add_artist(artist)
+            self.blit_manager.add_artist(self.axes[ax_name].get_legend())
+
+    def refresh_legend(
+        self,
+        ax_name: str
+    ) -> None:
+        """
+        Updates the legend texts of a scatter graph of the retained render
+        mode, or rebuilds the legend if its entries changed (e.g., the
+        tracked element appeared or disappeared).
+
+        Args:
+            ax_name (str): The name of the axis ("log" or "lin").
+        """
+
+        ax = self.axes[ax_name]
+        labels = ax.get_legend_handles_labels()[1]
+        legend = ax.get_legend()
+        if legend is not None and len(legend.get_texts()) == len(labels):
+            for text, label in zip(legend.get_texts(), labels):
+                text.set_text(label)
+            return
+
+        if legend is not None and self.blit_manager is not None:
+            self.blit_manager.remove_artist(legend)
+        legend = ax.legend(loc="best")
+        if self.blit_manager is not None:
+            self.blit_manager.add_artist(legend)
+
+    def apply_view_limits(
+        self,
+        ax_name: str,
+        div: int
+    ) -> None:
+        """
+        Sets the precomputed limits of a scatter graph for a time division
+        (see `set_view_limits`), which turns its autoscaling off.
+
+        Args:
+            ax_name (str): The name of the axis ("log" or "lin").
+            div (int): The time division.
+        """
+
+        if self.view_limits_scope == "global":
+            limits = self.view_limits_global[ax_name]
+        else:
+            limits = self.view_limits[ax_name][self.timediv_range.index(div)]
+        if not np.isfinite(limits).all():
+            return
+
+        ax = self.axes[ax_name]
+        ax.set_xlim(limits[0], limits[1])
+        ax.set_ylim(limits[2], limits[3])
+
+    def update_scatter_artists(
+        self,
+        timediv: TimeDiv,
+        ax_name: str,
+        is_log_scale: bool,
+        points_color: np.ndarray
+    ) -> None:
+        """
+        Updates the data of the artists of a scatter graph of the retained
+        render mode: point offsets, sizes and colors, tracked points,
+        regression line, title, legend texts and view limits.
+
+        Args:
+            timediv (TimeDiv): The time division to plot.
+            ax_name (str): The name of the axis ("log" or "lin").
+            is_log_scale (bool): Whether the graph uses a log scale.
+            points_color (np.ndarray): The RGBA color of each point.
+        """
+
+        artists = self.scatter_artists[ax_name]
+        data = timediv.merged_data
+        x = data[self.data_frames.by_role("x").data_name].to_numpy()
+        y = data[self.data_frames.by_role("y").data_name].to_numpy()
+        sizes = timediv.point_sizes
+
+        artists["scatter"].set_offsets(np.column_stack((x, y)))
+        artists["scatter"].set_sizes(sizes)
+        artists["scatter"].set_facecolors(points_color)
+
+        tracked = np.zeros(len(data), dtype=bool)
+        if self.tracked_codes.size:
+            tracked = self.tracked_mask[timediv.merged_rows]
+        artists["tracked"].set_offsets(
+            np.column_stack((x[tracked], y[tracked]))
+        )
+        artists["tracked"].set_sizes(sizes[tracked])
+        artists["tracked"].set_label(
+            f"Tracked: {self.tracked_element}"
+            if tracked.any()
+            else "_tracked"
+        )
+
+        x_line, y_line, label = self.regression_line(timediv, is_log_scale)
+        artists["regline"].set_data(x_line, y_line)
+        artists["regline"].set_label(label)
+
+        if is_log_scale:
+            artists["title"].set_text(f"{self.title} in {timediv.div}")
+
+        self.refresh_legend(ax_name)
+        self.apply_view_limits(ax_name, timediv.div)
+
+    def update_retained_artists(
         self,
         timediv: TimeDiv
     ) -> None:
+        """
+        Updates both scatter graphs of the retained render mode
+        (built at the first call), then redraws them: by blitting if
+        possible (see `BlitManager.update`), else the whole figure.
+
+        Args:
+            timediv (TimeDiv): The time division to plot.
+        """
+
+        if not self.scatter_artists:
+            self.build_retained_artists(timediv)
+
+        points_color = self.get_points_color(timediv.merged_data)
+        self.update_scatter_artists(timediv, "log", True, points_color)
+        self.update_scatter_artists(timediv, "lin", False, points_color)
+
+        colorbar_changed = self.update_color_point_from_extra_data(timediv)
+
+        self.update_corr_graphs()
+
+        if self.blit_manager is not None:
+            self.blit_manager.update(full=colorbar_changed)
+        else:
+            self.fig.canvas.draw_idle()
+
+    def update_color_point_from_extra_data(
+        self,
+        timediv: TimeDiv
+    ) -> bool:
         """
         Updates the visibility of the colorbar
-        based on the presence of extra data.
+        based on the presence of the "color" role data.
 
         Args:
             timediv (TimeDiv):
                 The current time division data.
 
+        Returns:
+            bool: True if the colorbar visibility changed.
+
         Notes:
             - Hides or shows the colorbar dynamically
             depending on whether extra data is available.
         """
 
-        extra_data_x_name = self.data_frames["extra_data_x"].data_name
-        if extra_data_x_name in timediv.merged_data.columns:
-            if not self.cbar.ax.get_visible():
-                self.cbar.ax.set_visible(True)
-        else:
-            if self.cbar.ax.get_visible():
-                self.cbar.ax.set_visible(False)
+        if self.cbar is None:
+            return False
+
+        colored_data = self.data_frames.by_role("color")
+        visible = (
+            colored_data is not None
+            and colored_data.data_name in timediv.merged_data.columns
+        )
+        if self.cbar.ax.get_visible() == visible:
+            return False
+
+        self.cbar.ax.set_visible(visible)
+        return True
+
+    def build_corr_vlines(self) -> None:
+        """
+        Builds, once, the vertical line marking the current time division
+        on each correlation graph (see `update_corr_graphs`).
+        """
+
+        self.corr_vlines = {
+            corr_name: corr_ax.axvline(
+                x=self.slider.val,
+                color="orange",
+                linestyle="--",
+                linewidth=0.8
+            )
+            for corr_name, corr_ax in self.axes.items()
+            if "corr" in corr_name
+        }
+
+    def build_blit_manager(self) -> None:
+        """
+        Builds, once, the blitting of the artists changing at each slider
+        tick, in both render modes, if the backend supports it
+        (see `BlitManager`): the correlation graphs curves stay in the
+        cached background, and only their vertical lines
+        (see `update_corr_graphs`) and the slider are redrawn over it,
+        with, in the redraw render mode, both scatter axes as a whole
+        (cleared and replotted at each tick), or, in the retained one,
+        their artists only (see `build_retained_artists`).
+        """
+
+        if not self.fig.canvas.supports_blit:
+            return
+
+        if not self.corr_vlines:
+            self.build_corr_vlines()
+
+        self.blit_manager = BlitManager(
+            self.fig.canvas,
+            watched_axes=[vline.axes for vline in self.corr_vlines.values()]
+        )
+        for vline in self.corr_vlines.values():
+            self.blit_manager.add_artist(vline)
+
+        if self.slider is not None:
+            slider_ax = self.slider.ax
+            for artist in (
+                *slider_ax.patches,
+                *slider_ax.lines,
+                *slider_ax.texts
+            ):
+                self.blit_manager.add_artist(artist)
+            self.slider.drawon = False
+
+        if self.render_mode == "redraw":
+            for ax_name in ("log", "lin"):
+                self.blit_manager.add_artist(self.axes[ax_name])
 
     def update_corr_graphs(self) -> None:
         """
@@ -1282,27 +2997,19 @@ class Day02Ex03:
         indicating the current slider value.
 
         Notes:
-            - Removes any existing vertical lines before adding a new one.
+            - The vertical line of each graph is built once
+            (see `build_corr_vlines`), then only moved.
             - The vertical line highlights the selected year on the graph.
+            - The correlation curves are part of the cached background:
+            only the lines are blitted (see `build_blit_manager`).
         """
 
-        for corr_name, corr_ax in self.axes.items():
-            if "corr" in corr_name:
-                selected_x = self.slider.val
-
-                if hasattr(self, f"{corr_name}_vline"):
-                    getattr(self, f"{corr_name}_vline").remove()
+        if not self.corr_vlines:
+            self.build_corr_vlines()
 
-                setattr(
-                    self,
-                    f"{corr_name}_vline",
-                    corr_ax.axvline(
-                        x=selected_x,
-                        color="orange",
-                        linestyle="--",
-                        linewidth=0.8
-                    )
-                )
+        selected_x = self.slider.val
+        for vline in self.corr_vlines.values():
+            vline.set_xdata([selected_x, selected_x])
 
     def update(
         self,
@@ -1317,18 +3024,41 @@ class Day02Ex03:
                 The current value of the slider. Defaults to None.
 
         Notes:
-            - Replots scatter graphs with updated data.
+            - Replots scatter graphs with updated data
+            (or only updates their data, see `set_render_mode`).
             - Updates regression lines and correlation graphs.
             - Adjusts colorbar visibility and correlation graph indicators.
         """
 
-        self.axes["log"].cla()
-        self.axes["lin"].cla()
-
         if slider_val is None:
             slider_val = int(self.slider.val)
 
-        timediv = self.precomputed_data[slider_val]
+        timediv = self.get_timediv(slider_val)
+        self.displayed_timediv = timediv
+
+        if self.render_mode == "retained":
+            self.update_retained_artists(timediv)
+        else:
+            self.redraw_scatter_graphs(timediv)
+
+        if isinstance(self.precomputed_data, TimeDivCache):
+            self.precomputed_data.prefetch(slider_val)
+
+    def redraw_scatter_graphs(
+        self,
+        timediv: TimeDiv
+    ) -> None:
+        """
+        Clears both scatter axes, replots them from scratch
+        and redraws them (redraw render mode): by blitting if possible
+        (see `build_blit_manager`), else with the whole figure.
+
+        Args:
+            timediv (TimeDiv): The time division to plot.
+        """
+
+        self.axes["log"].cla()
+        self.axes["lin"].cla()
 
         self.plot(
             timediv=timediv,
@@ -1345,11 +3075,14 @@ class Day02Ex03:
             color="green"
         )
 
-        self.update_color_point_from_extra_data(timediv)
+        colorbar_changed = self.update_color_point_from_extra_data(timediv)
 
         self.update_corr_graphs()
 
-        plt.draw()
+        if self.blit_manager is not None:
+            self.blit_manager.update(full=colorbar_changed)
+        else:
+            plt.draw()
 
     def update_slider_title(
         self,
@@ -1369,7 +3102,8 @@ class Day02Ex03:
         self.slider_title_text.set_text(
             f"{self.timediv_type.title()}: {int(val)}"
         )
-        self.fig.canvas.draw_idle()
+        if self.blit_manager is None:
+            self.fig.canvas.draw_idle()
 
     def build_slider(
         self,
@@ -1424,6 +3158,9 @@ class Day02Ex03:
             (`self.running_mode` is True), the method does nothing.
             - The animation iterates over frames
             starting from the current slider value.
+            - The frames are driven by a timer of the canvas: each of them
+            is drawn by `update`, by blitting if possible
+            (a `FuncAnimation` would redraw the whole figure after it).
         """
 
         if self.running_mode and not self.first_running:
@@ -1431,14 +3168,15 @@ class Day02Ex03:
 
         self.first_running = False
         self.running_mode = True
-        self.anim = FuncAnimation(
-            self.fig,
-            self.update_slider,
-            frames=range(self.slider.val, self.timediv_range.stop),
-            repeat=True,
-            interval=self.interval_between_two_frames,
+        frames = itertools.cycle(
+            range(int(self.slider.val), self.timediv_range.stop)
+        )
+        next(frames)  # the current frame is already drawn
+        self.anim = self.fig.canvas.new_timer(
+            interval=self.interval_between_two_frames
         )
-        plt.draw()
+        self.anim.add_callback(lambda: self.update_slider(next(frames)))
+        self.anim.start()
 
     def stop_animation(
         self,
@@ -1458,7 +3196,7 @@ class Day02Ex03:
             return
         self.running_mode = False
         if self.anim is not None:
-            self.anim.pause()
+            self.anim.stop()
 
     def update_slider(self, frame):
         """
@@ -1567,14 +3305,20 @@ class Day02Ex03:
 
         Args:
             text (str):
-                The name of the element to track.
+                The name of the element to track, or several
+                comma-separated ones; each one also matches the names
+                it starts (e.g., "nor, united" for Norway, United States,
+                United Kingdom, ...). Case insensitive.
 
         Notes:
+            - Resolves the tracked entities once
+            (see `resolve_tracked_element`).
             - Updates the main plots to reflect the tracked element.
             - Resets and re-applies cursors to the right-side graphs.
         """
 
         self.tracked_element = text.strip()
+        self.resolve_tracked_element()
         self.update()
         self.set_right_side_graphs_cursors()
 
@@ -1747,7 +3491,7 @@ class Day02Ex03:
 
         self.build_colorbar(
             ax=self.axes["log"],
-            extra_data=self.data_frames['extra_data_x']
+            extra_data=self.data_frames.by_role("color")
         )
 
         self.build_slider(
@@ -1758,10 +3502,12 @@ class Day02Ex03:
         self.set_and_plot_right_side_graph("log")
         self.set_and_plot_corr_diff()
         self.set_and_plot_right_side_graph("lin")
+        self.build_corr_vlines()
+        self.build_blit_manager()
 
         self.fig.canvas.manager.set_window_title(
-            f"{self.data_frames['data_x'].short_name} VS "
-            f"{self.data_frames['data_y'].short_name} for each "
+            f"{self.data_frames.by_role('x').short_name} VS "
+            f"{self.data_frames.by_role('y').short_name} for each "
             f"{self.timediv_type} between "
             f"{self.timediv_range.start} and "
             f"{self.timediv_range.stop - 1}"
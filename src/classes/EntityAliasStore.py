@@ -0,0 +1,232 @@
+import hashlib
+import json
+from typing import Callable
+
+from utils import alias_store_path, read_json, write_json
+
+
+class EntityAliasStore:
+    """
+    Persistent table of the entity name aliases resolved by an
+    `EntityMatcher`, for one reference entity list (e.g., the countries
+    of `data_x`) and one matching threshold.
+
+    The aliases are stored by source dataset (e.g., "Gini_coefficient.csv"),
+    each alias mapping a source entity name to its reference entity name,
+    or to None when no match was found. A name already resolved for
+    another source dataset is reused as is: fuzzy matching only runs
+    for the names never seen before.
+
+    Manual overrides take precedence over every resolved alias,
+    so that a bad match can be pinned (or discarded, with None).
+    They are stored in the same file, and can be edited there.
+
+    Attributes:
+        aliases (dict[str, dict[str, str | None]]):
+            The resolved aliases, by source dataset.
+        file_path (str):
+            The path of the JSON alias store.
+        modified (bool):
+            True if the store has changes not saved yet.
+        overrides (dict[str, str | None]):
+            The manual overrides, by source entity name.
+        targets (frozenset[str]):
+            The reference entity names.
+    """
+
+    def __init__(
+        self,
+        anchor_path: str,
+        targets,
+        threshold: int
+    ):
+        """
+        Initializes an EntityAliasStore object,
+        and loads the aliases already stored for these targets.
+
+        Parameters:
+            anchor_path (str):
+                The path of the reference dataset file
+                (the store lies in the `.cache` directory next to it).
+            targets (Iterable[str]):
+                The reference entity names.
+            threshold (int):
+                The fuzzy matching threshold the aliases are resolved with.
+        """
+
+        self.targets: frozenset[str] = frozenset(targets)
+        self.file_path: str = alias_store_path(
+            anchor_path,
+            self.store_key(self.targets, threshold)
+        )
+        self.modified: bool = False
+
+        content = read_json(self.file_path) or {}
+        self.aliases: dict[str, dict[str, str | None]] = content.get(
+            "aliases", {}
+        )
+        self.overrides: dict[str, str | None] = content.get("overrides", {})
+
+    def show(self) -> None:
+        """The class show method for a EntityAliasStore class object"""
+
+        print("\n=== SHOW EntityAliasStore class object (START) ===")
+
+        print(f"File Path: {self.file_path}")
+        print(f"Number of Targets: {len(self.targets)}")
+        for source, aliases in self.aliases.items():
+            print(f"Aliases of {source}: {len(aliases)}")
+        print(f"Overrides: {self.overrides}")
+        print(f"Modified: {self.modified}")
+
+        print("\n=== SHOW EntityAliasStore class object (END) ===")
+
+    @staticmethod
+    def store_key(
+        targets: frozenset[str],
+        threshold: int
+    ) -> str:
+        """
+        Returns the key identifying a reference entity list
+        and a matching threshold.
+
+        Parameters:
+            targets (frozenset[str]): The reference entity names.
+            threshold (int): The fuzzy matching threshold.
+
+        Returns:
+            str: The hexadecimal key.
+        """
+
+        return hashlib.blake2b(
+            json.dumps([sorted(targets), threshold]).encode(),
+            digest_size=16
+        ).hexdigest()
+
+    def add_override(
+        self,
+        name: str,
+        entity: str | None
+    ) -> None:
+        """
+        Pins the reference entity of a source entity name.
+
+        Parameters:
+            name (str): The source entity name.
+            entity (str | None):
+                The reference entity name, or None to leave `name` unmatched.
+
+        Raises:
+            ValueError: If `entity` is not one of the reference names.
+        """
+
+        if entity is not None and entity not in self.targets:
+            raise ValueError(
+                f"'{entity}' is not one of the reference entity names."
+            )
+
+        if self.overrides.get(name, ...) != entity:
+            self.overrides[name] = entity
+            self.modified = True
+
+    def lookup(
+        self,
+        source: str,
+        name: str
+    ) -> tuple[bool, str | None]:
+        """
+        Looks a source entity name up: in the overrides first,
+        then in the aliases of `source`, then in those of the other
+        source datasets.
+
+        Parameters:
+            source (str): The source dataset.
+            name (str): The source entity name.
+
+        Returns:
+            tuple[bool, str | None]:
+                Whether the name is known, and its reference entity name.
+        """
+
+        for aliases in [
+            self.overrides,
+            self.aliases.get(source, {}),
+            *(self.aliases[other] for other in sorted(self.aliases))
+        ]:
+            if name in aliases:
+                entity = aliases[name]
+                # ignores entries edited by hand with an unknown entity
+                if entity is None or entity in self.targets:
+                    return True, entity
+
+        return False, None
+
+    def resolve(
+        self,
+        source: str,
+        names,
+        match_names: Callable[[list[str]], list[str | None]]
+    ) -> list[str | None]:
+        """
+        Resolves the entity names of a source dataset, fuzzy matching
+        only the unknown ones, and records them in the store.
+
+        Parameters:
+            source (str): The source dataset.
+            names (Iterable[str]): The source entity names.
+            match_names (Callable[[list[str]], list[str | None]]):
+                Matches a list of names (e.g., `EntityMatcher.match_all`),
+                only called with the unknown ones, if any.
+
+        Returns:
+            list[str | None]:
+                The reference entity names, in `names` order.
+        """
+
+        names = list(names)
+        resolved = {}
+        unknown = []
+        for name in dict.fromkeys(names):
+            known, entity = self.lookup(source, name)
+            if known:
+                resolved[name] = entity
+            elif isinstance(name, str):
+                unknown.append(name)
+
+        if unknown:
+            matches = match_names(unknown)
+            resolved.update(zip(unknown, matches))
+
+        source_aliases = self.aliases.setdefault(source, {})
+        for name, entity in resolved.items():
+            if (
+                isinstance(name, str)
+                and name not in self.overrides
+                and source_aliases.get(name, ...) != entity
+            ):
+                source_aliases[name] = entity
+                self.modified = True
+
+        return [resolved.get(name) for name in names]
+
+    def save(self) -> None:
+        """
+        Writes the store, if it has been modified.
+
+        Failing to write it is not an error:
+        the aliases will simply be resolved again on the next run.
+        """
+
+        if not self.modified:
+            return
+
+        try:
+            write_json(
+                self.file_path,
+                {"aliases": self.aliases, "overrides": self.overrides}
+            )
+        except OSError as error:
+            print(f"Warning: entity alias store not written: {error}")
+            return
+
+        self.modified = False
@@ -0,0 +1,356 @@
+import re
+import time
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from fuzzywuzzy import process
+
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+_WHITESPACES = re.compile(r"\s+")
+
+# The matcher of a worker process of `EntityMatcher.match_all`
+_worker_matcher = None
+
+
+class EntityMatcher:
+    """
+    Matches entity names (e.g., country names) coming from
+    an extra dataset against the entity names of a reference dataset.
+
+    The matching is done in two stages:
+    1. **Exact matching** on normalized names (casefolded,
+    diacritics and punctuation removed), through a dictionary lookup.
+    2. **Fuzzy matching** of the leftovers only: the reference names
+    sharing the most character n-grams with the name are selected
+    through an inverted n-gram index, and only those candidates are
+    scored with fuzzywuzzy `process.extractOne`.
+
+    Attributes:
+        max_candidates (int):
+            The maximum number of reference names
+            scored by the fuzzy matching of one name.
+        ngram_index (dict[str, list[int]]):
+            For each n-gram, the positions in `targets`
+            of the reference names containing it.
+        ngram_size (int):
+            The size of the character n-grams.
+        normalized_index (dict[str, str]):
+            The first reference name of each normalized name.
+        targets (list[str]):
+            The reference entity names, unique, in their original order.
+        threshold (int):
+            Minimum fuzzy matching score for a match to be valid.
+        timings (dict[str, float]):
+            The duration (in seconds) of the index building and of the
+            matching stages of the last `match_all` call.
+    """
+
+    def __init__(
+        self,
+        targets,
+        threshold: int = 80,
+        ngram_size: int = 3,
+        max_candidates: int = 20
+    ):
+        """
+        Initializes an EntityMatcher object and builds its indexes.
+
+        Parameters:
+            targets (Iterable[str]):
+                The reference entity names.
+            threshold (int):
+                Minimum fuzzy matching score for a match to be valid.
+            ngram_size (int):
+                The size of the character n-grams.
+            max_candidates (int):
+                The maximum number of reference names
+                scored by the fuzzy matching of one name.
+        """
+
+        start = time.perf_counter()
+        self.max_candidates: int = max_candidates
+        self.ngram_size: int = ngram_size
+        self.targets: list[str] = list(dict.fromkeys(targets))
+        self.threshold: int = threshold
+
+        self.normalized_index: dict[str, str] = {}
+        self.ngram_index: dict[str, list[int]] = {}
+        for position, target in enumerate(self.targets):
+            normalized = self.normalize(target)
+            self.normalized_index.setdefault(normalized, target)
+            for ngram in self.ngrams(normalized, ngram_size):
+                self.ngram_index.setdefault(ngram, []).append(position)
+        self.timings: dict[str, float] = {
+            "index": time.perf_counter() - start
+        }
+
+    def show(self) -> None:
+        """The class show method for a EntityMatcher class object"""
+
+        print("\n=== SHOW EntityMatcher class object (START) ===")
+
+        print(f"Number of Targets: {len(self.targets)}")
+        print(f"Threshold: {self.threshold}")
+        print(f"N-gram Size: {self.ngram_size}")
+        print(f"N-gram Index Size: {len(self.ngram_index)}")
+        print(f"Max Candidates: {self.max_candidates}")
+
+        print("\n=== SHOW EntityMatcher class object (END) ===")
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """
+        Normalizes an entity name for the exact matching stage:
+        diacritics removed, casefolded, punctuation removed
+        and whitespaces collapsed.
+
+        Parameters:
+            name (str): The entity name.
+
+        Returns:
+            str: The normalized name
+            (e.g., "Côte d'Ivoire" -> "cote d ivoire").
+        """
+
+        name = unicodedata.normalize("NFKD", str(name))
+        name = "".join(
+            char for char in name if not unicodedata.combining(char)
+        )
+        name = _PUNCTUATION.sub(" ", name.casefold())
+
+        return _WHITESPACES.sub(" ", name).strip()
+
+    @staticmethod
+    def ngrams(normalized: str, size: int) -> set[str]:
+        """
+        Returns the character n-grams of a normalized name,
+        padded with a space so that its start and end get their own n-grams.
+
+        Parameters:
+            normalized (str): The normalized entity name.
+            size (int): The size of the n-grams.
+
+        Returns:
+            set[str]: The n-grams.
+        """
+
+        padded = f" {normalized} "
+        return {
+            padded[i:i + size]
+            for i in range(max(len(padded) - size + 1, 1))
+        }
+
+    def candidates(self, normalized: str) -> list[str]:
+        """
+        Selects the reference names to be scored for a name:
+        the `max_candidates` ones sharing the most n-grams with it.
+
+        Parameters:
+            normalized (str): The normalized entity name.
+
+        Returns:
+            list[str]:
+                The candidates, in their `targets` order (so that ties
+                are resolved as a full `process.extractOne` would).
+        """
+
+        counts = Counter()
+        for ngram in self.ngrams(normalized, self.ngram_size):
+            counts.update(self.ngram_index.get(ngram, ()))
+
+        best = sorted(counts, key=lambda pos: (-counts[pos], pos))
+        return [
+            self.targets[position]
+            for position in sorted(best[:self.max_candidates])
+        ]
+
+    def match_exact(self, name: str) -> tuple[bool, str | None]:
+        """
+        Exact matching stage of an entity name, on its normalized form.
+
+        Parameters:
+            name (str): The entity name.
+
+        Returns:
+            tuple[bool, str | None]:
+                Whether the name is settled by this stage
+                (matched, or impossible to match), and its match.
+        """
+
+        if not isinstance(name, str):
+            return True, None
+
+        normalized = self.normalize(name)
+        if not normalized:
+            return True, None
+
+        match = self.normalized_index.get(normalized)
+        return match is not None, match
+
+    def match_fuzzy(self, name: str) -> str | None:
+        """
+        Fuzzy matching stage of an entity name,
+        scored against its candidates only.
+
+        Parameters:
+            name (str): The entity name.
+
+        Returns:
+            str | None:
+                The matched reference name, or None if no match
+                reaches `threshold`.
+        """
+
+        candidates = self.candidates(self.normalize(name))
+        if not candidates:
+            return None
+
+        match, score = process.extractOne(name, candidates)
+        return match if score >= self.threshold else None
+
+    def match(self, name: str) -> str | None:
+        """
+        Matches an entity name against the reference names.
+
+        Parameters:
+            name (str): The entity name.
+
+        Returns:
+            str | None:
+                The matched reference name, or None if no match
+                reaches `threshold`.
+        """
+
+        settled, match = self.match_exact(name)
+        return match if settled else self.match_fuzzy(name)
+
+    def match_all(
+        self,
+        names,
+        workers: int | None = None,
+        chunk_size: int = 64,
+        progress: bool = False
+    ) -> list[str | None]:
+        """
+        Matches a sequence of entity names, each distinct name only once.
+
+        The exact matching stage runs in this process. The fuzzy matching
+        stage can be spread, by chunks of names, across a process pool:
+        the matcher (and its indexes) is sent once to each worker.
+        Each name is matched independently of the others,
+        so the results do not depend on the number of workers.
+
+        The duration of each stage is stored in `timings`.
+
+        Parameters:
+            names (Iterable[str]): The entity names.
+            workers (int | None):
+                The number of worker processes of the fuzzy matching
+                stage (None: it runs in this process).
+            chunk_size (int):
+                The number of names per worker task.
+            progress (bool):
+                True to print the progress and the duration of each stage.
+
+        Returns:
+            list[str | None]: The matched reference names, in `names` order.
+        """
+
+        names = list(names)
+        start = time.perf_counter()
+
+        matches: dict[str, str | None] = {}
+        leftovers = []
+        for name in dict.fromkeys(names):
+            settled, match = self.match_exact(name)
+            if settled:
+                matches[name] = match
+            else:
+                leftovers.append(name)
+        self.timings["exact"] = time.perf_counter() - start
+        if progress:
+            print(
+                f"Entity matching: {len(matches)} exact matches, "
+                f"{len(leftovers)} names left for fuzzy matching "
+                f"({self.timings['exact']:.2f}s)"
+            )
+
+        start = time.perf_counter()
+        chunks = [
+            leftovers[i:i + chunk_size]
+            for i in range(0, len(leftovers), chunk_size)
+        ]
+        if workers is None or workers < 2 or len(chunks) < 2:
+            chunk_results = map(self.match_fuzzy_chunk, chunks)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=EntityMatcher.init_worker,
+                initargs=(self,)
+            )
+            chunk_results = executor.map(
+                EntityMatcher.match_worker_chunk,
+                chunks
+            )
+
+        try:
+            done = 0
+            for chunk, chunk_matches in zip(chunks, chunk_results):
+                matches.update(zip(chunk, chunk_matches))
+                done += len(chunk)
+                if progress:
+                    print(
+                        f"Entity matching: {done}/{len(leftovers)} "
+                        f"fuzzy matched "
+                        f"({time.perf_counter() - start:.2f}s)"
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self.timings["fuzzy"] = time.perf_counter() - start
+
+        if progress:
+            print(
+                "Entity matching timings: "
+                + ", ".join(
+                    f"{stage} {duration:.2f}s"
+                    for stage, duration in self.timings.items()
+                )
+            )
+
+        return [matches[name] for name in names]
+
+    def match_fuzzy_chunk(self, names: list[str]) -> list[str | None]:
+        """Fuzzy matches a chunk of names (see `match_fuzzy`)."""
+
+        return [self.match_fuzzy(name) for name in names]
+
+    @staticmethod
+    def init_worker(matcher: "EntityMatcher") -> None:
+        """
+        Worker process initializer of `match_all`:
+        keeps the matcher received once from the parent process.
+
+        Parameters:
+            matcher (EntityMatcher): The matcher, indexes included.
+        """
+
+        global _worker_matcher
+        _worker_matcher = matcher
+
+    @staticmethod
+    def match_worker_chunk(names: list[str]) -> list[str | None]:
+        """
+        Worker process side of `match_all`: fuzzy matches a chunk of names
+        with the matcher received by `init_worker`.
+
+        Parameters:
+            names (list[str]): The names to match.
+
+        Returns:
+            list[str | None]: Their matches, in `names` order.
+        """
+
+        return _worker_matcher.match_fuzzy_chunk(names)
@@ -5,44 +5,137 @@ class LinReg:
     """
     Represents the results of a linear regression analysis.
 
+    Only the coefficients are stored: the predicted values are
+    evaluated on request, for the x values they are needed for
+    (e.g., the two ends of the regression line).
+
     Attributes:
         corr (float):
             The correlation coefficient of the regression.
-        predicted (np.ndarray):
-            The predicted values resulting from the regression.
+        intercept (float):
+            The intercept of the regression line.
+        log (bool):
+            True if the regression was computed on the base-10
+            logarithm of the x-axis values.
+        n (int):
+            The number of points of the regression.
         pvalue (float):
             The p-value indicating the significance of the correlation.
+        slope (float):
+            The slope of the regression line.
+        stderr (float):
+            The standard error of the slope.
     """
 
+    __slots__ = (
+        "corr",
+        "intercept",
+        "log",
+        "n",
+        "pvalue",
+        "slope",
+        "stderr",
+    )
+
     def __init__(self,
-                 predicted: np.ndarray,
+                 slope: float,
+                 intercept: float,
                  corr: float,
-                 pvalue: float):
+                 pvalue: float,
+                 stderr: float,
+                 n: int,
+                 log: bool = False):
         """
         Initializes a LinReg object with regression results.
 
         Parameters:
+            slope (float):
+                The slope of the regression line.
+            intercept (float):
+                The intercept of the regression line.
             corr (float):
                 The correlation coefficient of the regression.
-            predicted (np.ndarray):
-                The predicted values from the regression model.
             pvalue (float):
                 The p-value indicating the significance of the regression.
+            stderr (float):
+                The standard error of the slope.
+            n (int):
+                The number of points of the regression.
+            log (bool):
+                True if the regression was computed on the base-10
+                logarithm of the x-axis values.
         """
 
-        self.predicted: np.ndarray = predicted
-        self.corr: float = corr
-        self.pvalue: float = pvalue
+        self.slope: float = float(slope)
+        self.intercept: float = float(intercept)
+        self.corr: float = float(corr)
+        self.pvalue: float = float(pvalue)
+        self.stderr: float = float(stderr)
+        self.n: int = int(n)
+        self.log: bool = log
 
     def show(self) -> None:
         """The class show method for a LinReg class object"""
 
         print("\n=== SHOW LinReg class object (START) ===")
 
+        print(f"Log-transformed x: {self.log}")
+        print(f"Slope: {self.slope:.4e}")
+        print(f"Intercept: {self.intercept:.4e}")
+        print(f"Standard Error (slope): {self.stderr:.4e}")
+        print(f"Number of points (n): {self.n}")
         print(f"Correlation Coefficient (corr): {self.corr:.4f}")
         print(f"P-Value (pvalue): {self.pvalue:.4e}")
 
-        print("\nPredicted Values (predicted):")
-        print(self.predicted)
-
         print("\n=== SHOW LinReg class object (END) ===")
+
+    def predict(
+        self,
+        x: np.ndarray
+    ) -> np.ndarray:
+        """
+        Evaluates the regression line on the given x values.
+
+        Parameters:
+            x (np.ndarray):
+                The x-axis values (not log-transformed,
+                even if `log` is True).
+
+        Returns:
+            np.ndarray: The predicted y values.
+        """
+
+        x = np.asarray(x, dtype=np.float64)
+        if self.log:
+            x = np.log10(x)
+
+        return self.slope * x + self.intercept
+
+    def line(
+        self,
+        x_min: float,
+        x_max: float,
+        nb_points: int = 2
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Samples the regression line over an x extent.
+
+        Two points are enough to draw it on its own scale
+        (linear x for a linear regression, log x for a log one).
+
+        Parameters:
+            x_min (float): The lower bound of the extent.
+            x_max (float): The upper bound of the extent.
+            nb_points (int): The number of sample points.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]:
+                The sampled x values and their predicted y values.
+        """
+
+        if self.log:
+            x = np.logspace(np.log10(x_min), np.log10(x_max), nb_points)
+        else:
+            x = np.linspace(x_min, x_max, nb_points)
+
+        return x, self.predict(x)
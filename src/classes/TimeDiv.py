@@ -1,7 +1,18 @@
 from .LinReg import LinReg
 import numpy as np
 import pandas as pd
-from scipy.stats import linregress
+
+# The names of the datasets of the x, y and point size roles,
+# when none are given (the historical five dataset slots)
+DEFAULT_ESSENTIALS = ("data_x", "data_y", "data_point_size")
+# For each dataset of a time division, by name: its column name, its values,
+# its entity presence mask, and the entity code of each value (None: one
+# value per entity of the shared entity index); None if it has no data
+# for this time division (see `Day02Ex03.aligned_timediv_extraction`)
+AlignedData = dict[
+    str,
+    tuple[str, np.ndarray, np.ndarray, np.ndarray | None] | None
+]
 
 
 class TimeDiv:
@@ -13,52 +24,55 @@ class TimeDiv:
         common_column (str):
             The column common across all DataFrames,
             used for merging (e.g., 'country').
-        df_dict (dict[str, pd.DataFrame]):
-            Dictionary containing the individual DataFrames
-            for data_x, data_y, etc.
         div (int):
             The specific division of time
             (e.g., a year) this instance represents.
+        essentials (list[str]):
+            The names of the x, y and point size datasets, in that order.
         lin_reg_lin (LinReg | None):
             Linear regression results for the linear scale.
         lin_reg_log (LinReg | None):
             Linear regression results for the logarithmic scale.
         merged_data (pd.DataFrame | None):
             The merged DataFrame combining all relevant data.
+        merged_rows (np.ndarray | None):
+            The integer entity codes (positions on the shared
+            entity index) of the rows kept in `merged_data`
+            (see `set_merged_rows`).
+        point_sizes (np.ndarray | None):
+            The ready-to-plot size of each row of `merged_data`
+            (see `Day02Ex03.materialize_timediv`).
     """
 
     def __init__(
         self,
-        timediv_list: list[pd.DataFrame],
         common_column: str,
-        div: int
+        div: int,
+        essentials: list[str] | None = None
     ):
         """
-        Initializes a TimeDiv object.
+        Initializes a TimeDiv object, without any data: its rows are then
+        set by `set_merged_rows` (see `Day02Ex03.materialize_timediv`).
 
         Parameters:
-            timediv_list (list[pd.DataFrame]):
-                A list of DataFrames for data_x, data_y, data_point_size,
-                extra_data_x, and extra_data_y.
             common_column (str):
                 The column common to all DataFrames,
                 used for merging (e.g., 'country').
             div (int):
                 The specific division of time (e.g., a year)
                 this instance represents.
+            essentials (list[str] | None):
+                The names of the x, y and point size datasets,
+                in that order (defaults to `DEFAULT_ESSENTIALS`).
         """
 
-        self.df_dict: dict[str, pd.DataFrame] = {
-            "data_x": timediv_list[0],
-            "data_y": timediv_list[1],
-            "data_point_size": timediv_list[2],
-            "extra_data_x": timediv_list[3],
-            "extra_data_y": timediv_list[4]
-        }
+        self.essentials: list[str] = list(essentials or DEFAULT_ESSENTIALS)
         self.common_column: str = common_column
         self.div: int = div
 
         self.merged_data: pd.DataFrame | None = None
+        self.merged_rows: np.ndarray | None = None
+        self.point_sizes: np.ndarray | None = None
         self.lin_reg_log: LinReg | None = None
         self.lin_reg_lin: LinReg | None = None
 
@@ -74,14 +88,6 @@ class TimeDiv:
         print(f"Time Division: {self.div}")
         print(f"Common Column: {self.common_column}")
 
-        print("\n--- DataFrames Dictionary (df_dict) ---")
-        for key, df in self.df_dict.items():
-            print(f"{key}:")
-            if df is not None:
-                print(df.head(head_value))
-            else:
-                print("None")
-
         print("\n--- Merged Data ---")
         if self.merged_data is not None:
             print(self.merged_data.head(head_value))
@@ -103,86 +109,169 @@ class TimeDiv:
 
         print("\n=== SHOW TimeDiv class object (END) ===")
 
-    def merge(self) -> None:
+    @staticmethod
+    def valid_rows(
+        nb_entities: int,
+        aligned_data: AlignedData,
+        essentials: list[str] = DEFAULT_ESSENTIALS,
+        joined_presence: np.ndarray | None = None
+    ) -> np.ndarray:
         """
-        Crucial step for this program, then long detailed docstring:
-
-        Merges the DataFrames in `df_dict` into
-        a single unified DataFrame (`merged_data`),
-        retaining only rows with complete data across
-        all required DataFrames.
-
-        Steps:
-        1. **Validation**:
-            Ensures that essential DataFrames
-            (`data_x`, `data_y`, and `data_point_size`)
-            exist in `df_dict`.
-            Raises a `ValueError` if any of them is missing.
-
-        2. **Index Alignment**:
-            Temporarily sets the `common_column` as the index
-            for key DataFrames to align data rows consistently.
-
-        3. **Filtering**:
-            Creates a mask to identify rows where all
-            essential DataFrames contain valid (non-null) data,
-            and applies this mask to filter out incomplete rows.
-
-        4. **Data Merging**:
-            Iteratively merges `data_x` with
-            other DataFrames (`data_y`, `data_point_size`,
-            `extra_data_x`, `extra_data_y`) based on the `common_column`,
-            using an inner join to retain only
-            rows present in all included DataFrames.
-
-        5. **Final Output**:
-            Resets the index of the merged DataFrame for
-            a clean result, ready for analysis.
-
-        The resulting `merged_data` contains only rows with consistent,
-        valid entries across the relevant DataFrames,
-        ensuring high-quality data for further processing.
+        Computes which entities of the shared entity index
+        are kept in the merged data of a time division.
+
+        All the datasets share the same sorted entity index, established
+        once at cleaning time (see `Day02Ex03.build_entity_index`):
+        row i of every aligned array is the entity of code i.
+        An entity is kept if:
+        - it has a non-null value in the x, y and point size
+        datasets (see `essentials`),
+        - it has a row in every other available dataset
+        (as an inner join on the `common_column` would require).
+
+        If an essential dataset is given as observations (with their
+        entity codes, see `DataFrame.storage_timediv_data`), the candidate
+        entities are the intersection of the codes of the non-null
+        observations, which are then only checked against the other
+        datasets: nothing is computed over the whole entity index.
+        Otherwise, this is a boolean validity mask over it.
+
+        Args:
+            nb_entities (int):
+                The size of the shared entity index.
+            aligned_data (AlignedData):
+                The values of every dataset for this time division.
+            essentials (list[str]):
+                The names of the x, y and point size datasets.
+            joined_presence (np.ndarray | None):
+                The entity presence mask already joined across every
+                dataset covering this time division
+                (see `DatasetRegistry.joined_presence`): then only
+                the values of the `essentials` datasets are read.
+
+        Returns:
+            np.ndarray:
+                The sorted codes of the kept entities.
 
         Raises:
             ValueError:
-                If any of the required DataFrames
-                (`data_x`, `data_y`, `data_point_size`) is missing.
+                If any of the required datasets
+                (x, y and point size) is missing.
         """
 
-        for key in ['data_x', 'data_y', 'data_point_size']:
-            if self.df_dict[key] is None:
+        for key in essentials:
+            if aligned_data.get(key) is None:
                 raise ValueError(f"Essential DataFrame '{key}' is missing.")
 
-        for key in ['data_x', 'data_y', 'data_point_size']:
-            self.df_dict[key] = self.df_dict[key].set_index(self.common_column)
+        observed = [
+            codes[~np.isnan(values)]
+            for _, values, _, codes in map(aligned_data.get, essentials)
+            if codes is not None
+        ]
 
-        mask = (
-            ~self.df_dict['data_x'].iloc[:, 0].isna() &
-            ~self.df_dict['data_y'].iloc[:, 0].isna() &
-            ~self.df_dict['data_point_size'].iloc[:, 0].isna()
-        )
+        if not observed:
+            if joined_presence is not None:
+                mask = joined_presence.copy()
+            else:
+                mask = np.ones(nb_entities, dtype=bool)
+                for dataset in aligned_data.values():
+                    if dataset is not None:
+                        mask &= dataset[2]
+            for key in essentials:
+                mask &= ~np.isnan(aligned_data[key][1])
+            return np.flatnonzero(mask).astype(np.int32)
+
+        rows = observed[0]
+        for codes in observed[1:]:
+            rows = np.intersect1d(rows, codes, assume_unique=True)
+
+        if joined_presence is not None:
+            keep = joined_presence[rows]
+        else:
+            keep = np.ones(len(rows), dtype=bool)
+            for dataset in aligned_data.values():
+                if dataset is not None:
+                    keep &= dataset[2][rows]
+        for key in essentials:
+            _, values, _, codes = aligned_data[key]
+            if codes is None:
+                keep &= ~np.isnan(values[rows])
+
+        return rows[keep].astype(np.int32)
+
+    @staticmethod
+    def gather_values(
+        values: np.ndarray,
+        codes: np.ndarray | None,
+        rows: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the values of a dataset for some entities.
+
+        Args:
+            values (np.ndarray): The values of the dataset.
+            codes (np.ndarray | None):
+                The sorted entity code of each value
+                (None: one value per entity of the shared entity index).
+            rows (np.ndarray): The codes of the entities.
+
+        Returns:
+            np.ndarray:
+                One value per entity of `rows`
+                (NaN for the entities without an observation).
+        """
+
+        if codes is None:
+            return values[rows]
+
+        gathered = np.full(len(rows), np.nan, dtype=values.dtype)
+        if len(codes):
+            found = np.minimum(np.searchsorted(codes, rows), len(codes) - 1)
+            observed = codes[found] == rows
+            gathered[observed] = values[found[observed]]
+
+        return gathered
+
+    def set_merged_rows(
+        self,
+        entity_index: pd.Index,
+        aligned_data: AlignedData,
+        merged_rows: np.ndarray
+    ) -> None:
+        """
+        Builds `merged_data` from the entity codes of its rows,
+        the kept entities of this time division
+        (see `valid_rows` and `Day02Ex03.materialize_timediv`).
+
+        The `common_column` is a categorical column over the shared
+        entity index, built from the codes without copying any name.
+
+        Args:
+            entity_index (pd.Index):
+                The shared entity index (e.g., sorted country names).
+            aligned_data (AlignedData):
+                As in `valid_rows`.
+            merged_rows (np.ndarray):
+                The entity codes of the kept entities.
+        """
 
-        for key in ['data_x', 'data_y', 'data_point_size']:
-            self.df_dict[key] = self.df_dict[key].loc[
-                mask.reindex(self.df_dict[key].index, fill_value=False)
-            ].reset_index()
-
-        self.merged_data = self.df_dict['data_x']
-        for key in [
-            'data_y',
-            'data_point_size',
-            'extra_data_x',
-            'extra_data_y'
-        ]:
-            if self.df_dict[key] is not None:
-                self.merged_data = pd.merge(
-                    self.merged_data,
-                    self.df_dict[key],
-                    on=self.common_column,
-                    how='inner'
+        self.merged_rows = np.asarray(merged_rows)
+        columns = {
+            self.common_column: pd.Categorical.from_codes(
+                self.merged_rows,
+                categories=entity_index
+            )
+        }
+        for dataset in aligned_data.values():
+            if dataset is not None:
+                name, values, _, codes = dataset
+                columns[name] = self.gather_values(
+                    values,
+                    codes,
+                    self.merged_rows
                 )
 
-        self.merged_data.reset_index(drop=True, inplace=True)
+        self.merged_data = pd.DataFrame(columns, copy=False)
 
     def harmonize_for_regression(self) -> tuple[np.ndarray]:
         """
@@ -197,56 +286,16 @@ class TimeDiv:
         Raises:
             ValueError:
                 If `merged_data` is None,
-                meaning `merge` has not been called.
+                meaning `set_merged_rows` has not been called.
         """
 
         if self.merged_data is None:
             raise ValueError(
-                "Merged data is not available. Did you call `merge()`?"
+                "Merged data is not available. "
+                "Did you call `set_merged_rows()`?"
             )
 
         return (
             self.merged_data.iloc[:, 1].to_numpy(),
             self.merged_data.iloc[:, 2].to_numpy()
         )
-
-    def calculate_linregr(
-            self,
-            log: bool
-    ) -> LinReg:
-        """
-        Performs linear regression on x and y data,
-        with an optional logarithmic transformation on x.
-
-        Args:
-            log (bool):
-                If True, applies a base-10 logarithmic
-                transformation to x-axis values.
-
-        Returns:
-            LinReg:
-                The regression result,
-                including predicted values, correlation, and p-value.
-        """
-
-        data_x, data_y = self.harmonize_for_regression()
-
-        if log:
-            data_x = np.log10(data_x)
-
-        slope, intercept, corr, pvalue, _ = linregress(data_x, data_y)
-        data_x_sorted = np.sort(data_x)
-        predicted = slope * data_x_sorted + intercept
-
-        return LinReg(predicted, corr, pvalue)
-
-    def linear_regressions(self) -> None:
-        """
-        Computes and stores both logarithmic and
-        linear regressions for the data.
-
-        Saves the results in `lin_reg_log` and `lin_reg_lin`.
-        """
-
-        self.lin_reg_log = self.calculate_linregr(log=True)
-        self.lin_reg_lin = self.calculate_linregr(log=False)
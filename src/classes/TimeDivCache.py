@@ -0,0 +1,172 @@
+from collections import OrderedDict
+from typing import Callable
+
+from .TimeDiv import TimeDiv
+
+
+class TimeDivCache:
+    """
+    Bounded LRU cache of TimeDiv objects, materialized on demand.
+
+    It is used in place of the `Day02Ex03.precomputed_data` dictionary
+    when the lazy precompute mode is enabled: a TimeDiv is only built
+    (merged data and regression objects) when it is first requested,
+    and the least recently used ones are dropped beyond `capacity`.
+
+    Attributes:
+        capacity (int):
+            The maximum number of TimeDiv objects kept in memory.
+        direction (int):
+            1 if the time divisions are requested in increasing order
+            (e.g., during the animation), -1 otherwise.
+        last_div (int | None):
+            The last requested time division.
+        loader (Callable[[int], TimeDiv]):
+            The function building the TimeDiv of a time division.
+        prefetch_size (int):
+            How many time divisions ahead (in `direction`)
+            `prefetch` materializes.
+        timediv_range (range):
+            The time divisions which can be requested.
+        timedivs (OrderedDict[int, TimeDiv]):
+            The cached TimeDiv objects, from least to most recently used.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[int], TimeDiv],
+        timediv_range: range,
+        capacity: int,
+        prefetch_size: int
+    ):
+        """
+        Initializes an empty TimeDivCache object.
+
+        Parameters:
+            loader (Callable[[int], TimeDiv]):
+                The function building the TimeDiv of a time division.
+            timediv_range (range):
+                The time divisions which can be requested.
+            capacity (int):
+                The maximum number of TimeDiv objects kept in memory.
+            prefetch_size (int):
+                How many time divisions ahead `prefetch` materializes.
+
+        Raises:
+            ValueError:
+                If `capacity` is not greater than `prefetch_size`,
+                or if `prefetch_size` is negative.
+        """
+
+        if prefetch_size < 0 or capacity <= prefetch_size:
+            raise ValueError(
+                f"capacity ({capacity}) must be greater than "
+                f"prefetch_size ({prefetch_size}), which must be positive."
+            )
+
+        self.capacity: int = capacity
+        self.direction: int = 1
+        self.last_div: int | None = None
+        self.loader: Callable[[int], TimeDiv] = loader
+        self.prefetch_size: int = prefetch_size
+        self.timediv_range: range = timediv_range
+        self.timedivs: OrderedDict[int, TimeDiv] = OrderedDict()
+
+    def show(self) -> None:
+        """The class show method for a TimeDivCache class object"""
+
+        print("\n=== SHOW TimeDivCache class object (START) ===")
+
+        print(f"Capacity: {self.capacity}")
+        print(f"Prefetch Size: {self.prefetch_size}")
+        print(f"Time Division Range: {self.timediv_range}")
+        print(f"Direction: {self.direction}")
+        print(f"Cached Time Divisions: {list(self.timedivs)}")
+
+        print("\n=== SHOW TimeDivCache class object (END) ===")
+
+    def __contains__(self, div: int) -> bool:
+        """Returns True if the TimeDiv of `div` is currently cached."""
+
+        return div in self.timedivs
+
+    def __len__(self) -> int:
+        """Returns the number of TimeDiv objects currently cached."""
+
+        return len(self.timedivs)
+
+    def __getitem__(self, div: int) -> TimeDiv:
+        """
+        Returns the TimeDiv of a time division,
+        materializing it first if it is not cached.
+
+        Also records the direction in which
+        the time divisions are being requested.
+
+        Parameters:
+            div (int): The requested time division.
+
+        Returns:
+            TimeDiv: The TimeDiv of `div`.
+
+        Raises:
+            KeyError: If `div` is not in `timediv_range`.
+        """
+
+        if div not in self.timediv_range:
+            raise KeyError(div)
+
+        if self.last_div is not None and div != self.last_div:
+            self.direction = 1 if div > self.last_div else -1
+        self.last_div = div
+
+        return self.load(div)
+
+    def load(self, div: int) -> TimeDiv:
+        """
+        Returns the TimeDiv of a time division, from the cache if possible,
+        and marks it as the most recently used one.
+
+        Parameters:
+            div (int): The time division.
+
+        Returns:
+            TimeDiv: The TimeDiv of `div`.
+        """
+
+        if div in self.timedivs:
+            self.timedivs.move_to_end(div)
+            return self.timedivs[div]
+
+        timediv = self.loader(div)
+        self.timedivs[div] = timediv
+        while len(self.timedivs) > self.capacity:
+            self.timedivs.popitem(last=False)
+
+        return timediv
+
+    def prefetch(self, div: int | None = None) -> None:
+        """
+        Materializes the next `prefetch_size` time divisions
+        after `div`, in the current request direction,
+        so that the next frames of the animation are ready.
+
+        Parameters:
+            div (int | None):
+                The time division to start from.
+                Defaults to the last requested one.
+        """
+
+        if div is None:
+            div = self.last_div
+        if div is None:
+            return
+
+        for step in range(1, self.prefetch_size + 1):
+            next_div = div + step * self.direction
+            if next_div not in self.timediv_range:
+                break
+            self.load(next_div)
+
+        if div in self.timedivs:
+            self.timedivs.move_to_end(div)
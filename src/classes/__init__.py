@@ -1,7 +1,12 @@
+from .BlitManager import BlitManager  # noqa: F401
 from .DataFrame import DataFrame  # noqa: F401
+from .DatasetRegistry import DatasetRegistry  # noqa: F401
 from .Day02Ex03 import Day02Ex03  # noqa: F401
+from .EntityAliasStore import EntityAliasStore  # noqa: F401
+from .EntityMatcher import EntityMatcher  # noqa: F401
 from .LinReg import LinReg  # noqa: F401
 from .TimeDiv import TimeDiv  # noqa: F401
+from .TimeDivCache import TimeDivCache  # noqa: F401
 
 __all__ = [
     name
@@ -35,17 +35,47 @@ def main() -> None:
         - `unit`
         - specific parameter for add_data_point_size:
             `divider`; adjust it according to reach a proper point size.
+        Any number of other indicators can be added with `add_data_path`
+            (each one restricts the plotted entities to its own),
+            and the roles ("x", "y", "size", "color") reassigned
+            by dataset name with `set_dataset_role`.
         Set the title in the `add_title` method.
         Set the part of your data you want to study in
             the `add_timediv_range` method.
         Set the very important parameter `common_column`
             (necessary to merge the datasets)
             in the `add_common_column` method.
+        The datasets are loaded concurrently when cleaning them;
+            optionally, tune it (`set_concurrent_loading`), e.g. to parse
+            the datasets not cached yet in several processes.
+        Optionally, stream very large datasets by chunks of rows
+            (`set_chunked_loading`), to bound the loading memory.
+        Optionally, precompute the time divisions lazily
+            (`set_lazy_precompute`), which is faster to start
+            and lighter in memory for long time ranges.
+        Optionally, spread the regressions across several processes
+            (`set_parallel_precompute`), for very large datasets.
+        Optionally, store the precompute outputs on disk
+            (`set_precompute_cache`), to reload them on the next run.
+        Mostly-missing datasets are stored sparse, automatically;
+            optionally, tune the fill ratio threshold
+            (`set_sparse_storage`).
+        Optionally, spread the fuzzy matching of the extra dataset
+            entity names across several processes
+            (`set_parallel_entity_matching`), for very large entity lists.
+        Optionally, pin a bad extra dataset entity match
+            (`add_entity_alias`), it is remembered across runs.
         Set the animation parameters:
             - `auto_play` in the `set_autoplay_at_start` method
                 (`True` or `False`)
             - speed in the the `set_interval_between_two_frames` method
                 in milliseconds.
+            - optionally, the rendering (`set_render_mode`): "retained"
+                updates the data of the scatter graphs artists instead of
+                rebuilding them; in both modes, the changing artists are
+                blitted over the rest of the figure when the backend allows.
+            - optionally, the scatter graphs limits (`set_view_limits`):
+                fixed over the whole time range (default), or per frame.
     """
 
     try:
@@ -76,6 +106,15 @@ def main() -> None:
         #     "",
         #     short_name=""
         # )
+        # exo03.add_data_path(
+        #     "",
+        #     "co2_emissions",
+        #     short_name=""
+        # )
+        # exo03.set_dataset_role(
+        #     "color",
+        #     "co2_emissions"
+        # )
         exo03.add_title(
             "Life Expectancy"
             " VS "
@@ -89,10 +128,39 @@ def main() -> None:
             type="year",
         )
         exo03.add_common_column('country')
+        # exo03.set_concurrent_loading(
+        #     workers=None,
+        #     process_workers=4
+        # )
+        # exo03.set_chunked_loading(
+        #     chunk_size=100_000
+        # )
+        # exo03.set_lazy_precompute(
+        #     capacity=32,
+        #     prefetch_size=3
+        # )
+        # exo03.set_parallel_precompute(
+        #     workers=4,
+        #     chunk_size=16
+        # )
+        # exo03.set_precompute_cache(True)
+        # exo03.set_sparse_storage(
+        #     fill_ratio=0.25
+        # )
+        # exo03.set_parallel_entity_matching(
+        #     workers=4,
+        #     chunk_size=64
+        # )
+        # exo03.add_entity_alias(
+        #     "Korea, Rep.",
+        #     "South Korea"
+        # )
 
         exo03.clean_data_frames()
         exo03.precompute_data()
 
+        # exo03.set_render_mode("retained")
+        # exo03.set_view_limits("division")
         exo03.build_mpl_window()
         exo03.update()
         exo03.set_right_side_graphs_cursors()
@@ -11,6 +11,12 @@ Modules:
 - helpers: General-purpose utility functions.
 - conversions: Functions for data conversions.
 - get_data_name: A helper for extracting dataset names.
+- regression: Vectorized linear regressions.
+- load_csv: CSV loading (wide or long layout),
+  backed by the on-disk cache of data_cache.
+- data_cache: On-disk cache of the parsed datasets,
+  precompute outputs and entity aliases.
+- shared_arrays: numpy arrays shared with worker processes.
 
 Usage:
 from utils import debug, put_kmb_suffix
@@ -27,10 +33,26 @@ from .helpers import dict_printer, var_print_str  # noqa: F401
 from .conversions import (  # noqa: F401
     cust_suffixed_string_to_float,
     put_kmb_suffix,
+    suffixed_strings_to_float,
     tick_label_formatter
 )
 from .get_data_name import get_data_name  # noqa: F401
-from .load_csv import load  # noqa: F401
+from .data_cache import (  # noqa: F401
+    alias_store_path,
+    column_selection_key,
+    dataset_content_hash,
+    file_digest,
+    is_dataset_cached,
+    precompute_entry_dir,
+    prune_precompute_entries,
+    read_array_entry,
+    read_json,
+    write_array_entry,
+    write_json
+)
+from .load_csv import CSV_EXTENSIONS, is_long_layout, load  # noqa: F401
+from .regression import batch_linregress  # noqa: F401
+from .shared_arrays import attach_array, share_array  # noqa: F401
 
 __all__ = [
     name
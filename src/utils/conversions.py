@@ -1,6 +1,9 @@
 import numpy as np
+import pandas as pd
 from typing import Any
 
+SUFFIX_FACTORS = {'k': 1e3, 'M': 1e6, 'B': 1e9}
+
 
 def cust_suffixed_string_to_float(value) -> float:
     """
@@ -16,15 +19,79 @@ def cust_suffixed_string_to_float(value) -> float:
         or NaN if conversion fails.
     """
 
-    factors = {'k': 1e3, 'M': 1e6, 'B': 1e9}
     try:
-        if isinstance(value, str) and value[-1] in factors:
-            return float(value[:-1]) * factors[value[-1]]
+        if isinstance(value, str) and value[-1] in SUFFIX_FACTORS:
+            return float(value[:-1]) * SUFFIX_FACTORS[value[-1]]
         return float(value)
     except (ValueError, TypeError):
         return np.nan
 
 
+def suffixed_strings_to_float(values) -> np.ndarray:
+    """
+    Vectorized version of `cust_suffixed_string_to_float`:
+    converts a whole column or matrix of strings with custom suffixes
+    (k, M, B) to floats in one pass.
+
+    - Suffixes are located and stripped in place on a fixed-width
+    bytes copy of the data (no Python-level loop on the cells).
+    - The whole stripped array is then converted by numpy at once.
+    Only if some cells are invalid, those cells are identified
+    and converted one by one, to keep the exact per-cell semantics.
+
+    Parameters:
+        values (array-like):
+            A 1D or 2D collection (pd.Series, pd.DataFrame, np.ndarray...)
+            of strings and/or numeric values.
+
+    Returns:
+        np.ndarray:
+            A float64 array with the same shape as `values`,
+            with NaN for every cell which cannot be converted.
+    """
+
+    array = np.asarray(values)
+    if array.dtype.kind in "biuf":
+        return array.astype(np.float64)
+
+    try:
+        strings = np.array(array, dtype=bytes).ravel()
+        char_type = np.uint8
+    except UnicodeEncodeError:
+        strings = np.array(array, dtype=str).ravel()
+        char_type = np.uint32
+
+    width = strings.dtype.itemsize // np.dtype(char_type).itemsize
+    if width == 0:
+        return np.full(array.shape, np.nan)
+
+    codes = strings.view(char_type).reshape(len(strings), width)
+    lengths = np.strings.str_len(strings)
+    last_char_idx = np.maximum(lengths - 1, 0)
+    last_chars = codes[np.arange(len(strings)), last_char_idx]
+
+    factors = np.ones(len(strings))
+    for suffix, factor in SUFFIX_FACTORS.items():
+        is_suffixed = (last_chars == ord(suffix)) & (lengths > 0)
+        factors[is_suffixed] = factor
+        codes[is_suffixed, last_char_idx[is_suffixed]] = 0
+
+    try:
+        result = strings.astype(np.float64)
+    except ValueError:
+        result = pd.to_numeric(
+            strings.astype(object),
+            errors="coerce"
+        ).astype(np.float64)
+        for i in np.flatnonzero(np.isnan(result)):
+            try:
+                result[i] = float(strings[i])
+            except ValueError:
+                pass
+
+    return (result * factors).reshape(array.shape)
+
+
 def put_kmb_suffix(val: float) -> str:
     """
     Converts a numeric value to a string with
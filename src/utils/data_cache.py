@@ -0,0 +1,578 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+from pandas import DataFrame
+from pandas.api.types import is_float_dtype
+
+CACHE_DIR_NAME = ".cache"
+CACHE_VERSION = 4
+
+
+def precompute_entry_dir(
+    anchor_path: str,
+    key: str
+) -> str:
+    """
+    Returns the cache directory of a precompute artifact,
+    stored in the `.cache` directory next to `anchor_path`.
+
+    Parameters:
+        anchor_path (str): The path of one of the source files.
+        key (str): The key identifying the precompute configuration.
+
+    Returns:
+        str: The path of the cache entry directory.
+    """
+
+    return os.path.join(
+        os.path.dirname(os.path.abspath(anchor_path)),
+        CACHE_DIR_NAME,
+        f"precompute-{key}"
+    )
+
+
+def prune_precompute_entries(
+    anchor_path: str,
+    key: str,
+    sources: str
+) -> None:
+    """
+    Removes the precompute artifacts superseded by the one of `key`:
+    those written for the same `sources` (see
+    `Day02Ex03.precompute_cache_sources`) under another key, e.g. before
+    a source file changed, and those of another cache version
+    or without sources (written by an older version).
+    The artifacts of other sources are kept.
+
+    Failing to remove an artifact is not an error.
+
+    Parameters:
+        anchor_path (str): The path of one of the source files.
+        key (str): The key of the precompute artifact to keep.
+        sources (str): The sources identifier of this artifact.
+    """
+
+    cache_dir = os.path.dirname(precompute_entry_dir(anchor_path, key))
+    kept = os.path.basename(precompute_entry_dir(anchor_path, key))
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+
+    for name in names:
+        # skip the temporary directories of `write_array_entry`
+        if not name.startswith("precompute-") or name == kept or "." in name:
+            continue
+        entry_dir = os.path.join(cache_dir, name)
+        meta = read_meta(entry_dir)
+        if meta is None or meta.get("sources") in (None, sources):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+
+def column_selection_key(
+    label_columns: list[str] | None,
+    timediv_range: range | None
+) -> str | None:
+    """
+    Returns the key identifying a selection of the columns of a dataset
+    (see `utils.load`), so that each selection has its own cache entry.
+
+    Parameters:
+        label_columns (list[str] | None):
+            The selected non time division columns (None: all of them).
+        timediv_range (range | None):
+            The selected time divisions (None: all of them).
+
+    Returns:
+        str | None: The hexadecimal key, or None if nothing is pruned.
+    """
+
+    if label_columns is None and timediv_range is None:
+        return None
+
+    selection = {
+        "label_columns": label_columns,
+        "timediv_range": None if timediv_range is None else [
+            timediv_range.start,
+            timediv_range.stop,
+            timediv_range.step
+        ],
+    }
+
+    return hashlib.blake2b(
+        json.dumps(selection, sort_keys=True).encode(),
+        digest_size=8
+    ).hexdigest()
+
+
+def cache_entry_dir(
+    path: str,
+    selection: str | None = None
+) -> str:
+    """
+    Returns the cache directory dedicated to a source file.
+
+    The cache lies next to the source file (in a `.cache` directory),
+    and each entry is named after the file name and its absolute path,
+    so that two files with the same name never share an entry,
+    and after the column selection, if any.
+
+    Parameters:
+        path (str): The path of the source file.
+        selection (str | None):
+            The `column_selection_key` of the cached columns.
+
+    Returns:
+        str: The path of the cache entry directory.
+    """
+
+    abs_path = os.path.abspath(path)
+    path_key = hashlib.blake2b(
+        abs_path.encode(),
+        digest_size=8
+    ).hexdigest()
+
+    return os.path.join(
+        os.path.dirname(abs_path),
+        CACHE_DIR_NAME,
+        f"{os.path.basename(abs_path)}-{path_key}"
+        + ("" if selection is None else f"-{selection}")
+    )
+
+
+def file_digest(
+    path: str,
+    block_size: int = 1 << 20
+) -> str:
+    """
+    Computes the content hash of a file, reading it by blocks.
+
+    Parameters:
+        path (str): The path of the file.
+        block_size (int): The size (in bytes) of each block read.
+
+    Returns:
+        str: The hexadecimal blake2b digest of the file content.
+    """
+
+    digest = hashlib.blake2b()
+    with open(path, "rb") as file:
+        while block := file.read(block_size):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def file_signature(path: str) -> dict:
+    """
+    Returns the cheap identity of a file: its size and modification time.
+
+    Parameters:
+        path (str): The path of the file.
+
+    Returns:
+        dict: The `size` (bytes) and `mtime_ns` of the file.
+    """
+
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def alias_store_path(
+    anchor_path: str,
+    key: str
+) -> str:
+    """
+    Returns the path of an entity alias store,
+    stored in the `.cache` directory next to `anchor_path`.
+
+    Parameters:
+        anchor_path (str): The path of the reference dataset file.
+        key (str): The key identifying the reference entity list.
+
+    Returns:
+        str: The path of the JSON alias store.
+    """
+
+    return os.path.join(
+        os.path.dirname(os.path.abspath(anchor_path)),
+        CACHE_DIR_NAME,
+        f"aliases-{key}.json"
+    )
+
+
+def read_json(path: str) -> dict | None:
+    """
+    Reads a JSON cache file.
+
+    Parameters:
+        path (str): The path of the file.
+
+    Returns:
+        dict | None:
+            The file content, or None if there is no readable
+            file or if it was written by another cache version.
+    """
+
+    try:
+        with open(path) as file:
+            content = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(content, dict):
+        return None
+
+    return content if content.get("version") == CACHE_VERSION else None
+
+
+def write_json(
+    path: str,
+    content: dict
+) -> None:
+    """
+    Atomically writes a JSON cache file, tagged with the cache version.
+
+    Parameters:
+        path (str): The path of the file.
+        content (dict): The file content.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump({"version": CACHE_VERSION, **content}, file, indent=1)
+    os.replace(tmp_path, path)
+
+
+def read_meta(entry_dir: str) -> dict | None:
+    """
+    Reads the JSON sidecar of a cache entry.
+
+    Parameters:
+        entry_dir (str): The cache entry directory.
+
+    Returns:
+        dict | None:
+            The sidecar content, or None if there is no readable
+            sidecar or if it was written by another cache version.
+    """
+
+    return read_json(os.path.join(entry_dir, "meta.json"))
+
+
+def write_meta(
+    entry_dir: str,
+    meta: dict
+) -> None:
+    """
+    Atomically writes the JSON sidecar of a cache entry.
+
+    The sidecar is written last, so its presence
+    means that the whole entry is complete.
+
+    Parameters:
+        entry_dir (str): The cache entry directory.
+        meta (dict): The sidecar content.
+    """
+
+    write_json(os.path.join(entry_dir, "meta.json"), meta)
+
+
+def is_cache_valid(
+    path: str,
+    meta: dict,
+    entry_dir: str
+) -> bool:
+    """
+    Checks whether a cache entry still matches its source file.
+
+    The size and modification time are compared first.
+    If they changed (e.g. the file has been touched or copied),
+    the content hash decides, and a matching entry is revalidated
+    with the new file signature.
+
+    Parameters:
+        path (str): The path of the source file.
+        meta (dict): The sidecar of the cache entry.
+        entry_dir (str): The cache entry directory.
+
+    Returns:
+        bool: True if the cached data can be used instead of the file.
+    """
+
+    signature = file_signature(path)
+    if (
+        meta["size"] == signature["size"]
+        and meta["mtime_ns"] == signature["mtime_ns"]
+    ):
+        return True
+
+    if (
+        meta["size"] != signature["size"]
+        or meta["content_hash"] != file_digest(path)
+    ):
+        return False
+
+    write_meta(entry_dir, {**meta, **signature})
+    return True
+
+
+def read_array_entry(
+    entry_dir: str,
+    mmap_mode: str | None = None
+) -> tuple[dict[str, np.ndarray], dict] | None:
+    """
+    Loads every `.npy` array of a cache entry listed in its sidecar.
+
+    Parameters:
+        entry_dir (str): The cache entry directory.
+        mmap_mode (str | None):
+            'r' to memory-map the arrays instead of reading them.
+
+    Returns:
+        tuple[dict[str, np.ndarray], dict] | None:
+            The arrays by name and the sidecar content,
+            or None if the entry is missing or incomplete.
+    """
+
+    meta = read_meta(entry_dir)
+    if meta is None:
+        return None
+
+    try:
+        arrays = {
+            name: np.load(
+                os.path.join(entry_dir, f"{name}.npy"),
+                mmap_mode=mmap_mode
+            )
+            for name in meta["arrays"]
+        }
+    except (OSError, ValueError, KeyError):
+        return None
+
+    return arrays, meta
+
+
+def write_array_entry(
+    entry_dir: str,
+    arrays: dict[str, np.ndarray],
+    meta: dict
+) -> None:
+    """
+    Stores arrays as `.npy` files in a cache entry, plus its sidecar.
+
+    The entry is written in a temporary directory next to `entry_dir`,
+    then renamed into place: the arrays of an existing entry are never
+    overwritten under its sidecar, so a reader sees either the old
+    entry, the new one, or no entry at all.
+
+    Parameters:
+        entry_dir (str): The cache entry directory.
+        arrays (dict[str, np.ndarray]): The arrays to store, by name.
+        meta (dict): The sidecar content (the array names are added).
+
+    Raises:
+        OSError: If the entry cannot be written.
+    """
+
+    tmp_dir = f"{entry_dir}.tmp-{os.getpid()}"
+    old_dir = f"{entry_dir}.old-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    try:
+        os.makedirs(tmp_dir)
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), array)
+        write_meta(tmp_dir, {**meta, "arrays": list(arrays)})
+
+        # A directory cannot replace a non-empty one:
+        # the old entry is moved aside first
+        if os.path.isdir(entry_dir):
+            os.replace(entry_dir, old_dir)
+        os.replace(tmp_dir, entry_dir)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def dataset_content_hash(
+    path: str,
+    selection: str | None = None
+) -> str:
+    """
+    Returns the content hash of a source file, taken from its
+    still valid cache entry if possible, instead of reading it again.
+
+    Parameters:
+        path (str): The path of the source file.
+        selection (str | None):
+            The `column_selection_key` of the cached columns.
+
+    Returns:
+        str: The hexadecimal blake2b digest of the file content.
+    """
+
+    entry_dir = cache_entry_dir(path, selection)
+    meta = read_meta(entry_dir)
+    if meta is not None and is_cache_valid(path, meta, entry_dir):
+        return meta["content_hash"]
+
+    return file_digest(path)
+
+
+def is_dataset_cached(
+    path: str,
+    selection: str | None = None
+) -> bool:
+    """
+    Checks whether a source file has a valid cache entry,
+    i.e. whether loading it will skip the CSV parsing.
+
+    Parameters:
+        path (str): The path of the source file.
+        selection (str | None):
+            The `column_selection_key` of the cached columns.
+
+    Returns:
+        bool: True if the parsed dataset can be read from the cache.
+    """
+
+    entry_dir = cache_entry_dir(path, selection)
+    meta = read_meta(entry_dir)
+    return meta is not None and is_cache_valid(path, meta, entry_dir)
+
+
+def read_cached_dataset(
+    path: str,
+    selection: str | None = None
+) -> DataFrame | None:
+    """
+    Loads the parsed, numeric form of a dataset from its cache entry.
+
+    Parameters:
+        path (str): The path of the source file.
+        selection (str | None):
+            The `column_selection_key` of the cached columns.
+
+    Returns:
+        DataFrame | None:
+            The dataset, with numeric time division columns,
+            or None if there is no valid cache entry for this file.
+    """
+
+    entry_dir = cache_entry_dir(path, selection)
+    meta = read_meta(entry_dir)
+    if meta is None or not is_cache_valid(path, meta, entry_dir):
+        return None
+
+    entry = read_array_entry(entry_dir)
+    if entry is None:
+        return None
+    arrays, meta = entry
+
+    values = arrays["values"]
+    labels = np.where(
+        arrays["labels_missing"],
+        None,
+        arrays["labels"].astype(object)
+    )
+    columns = {
+        name: labels[:, i]
+        for i, name in enumerate(meta["label_columns"])
+    }
+    columns.update(
+        (name, arrays[f"native_labels_{i}"])
+        for i, name in enumerate(meta["native_label_columns"])
+    )
+    columns.update(
+        (name, values[:, i])
+        for i, name in enumerate(meta["numeric_columns"])
+    )
+
+    data = DataFrame(columns, copy=False)[meta["columns"]]
+    label_dtypes = {
+        name: dtype
+        for name, dtype in zip(meta["label_columns"], meta["label_dtypes"])
+        if dtype != "object"
+    }
+
+    return data.astype(label_dtypes) if label_dtypes else data
+
+
+def write_cached_dataset(
+    path: str,
+    data: DataFrame,
+    selection: str | None = None
+) -> None:
+    """
+    Stores the parsed, numeric form of a dataset in its cache entry:
+    - `values.npy`: the float64 columns (the time division ones,
+    or the time division and value ones of a long layout dataset),
+    - `native_labels_<i>.npy`: each other column of a numpy dtype
+    (integer, boolean, datetime, ...), as is,
+    - `labels.npy` and `labels_missing.npy`: the remaining columns,
+    as fixed-width unicode strings and their missing values mask,
+    - `meta.json`: the column names, the dtypes of the string-stored
+    columns (restored on reading, so a cached dataset has the dtypes
+    of a parsed one) and the source file identity
+    (path, size, modification time and content hash).
+
+    Failing to write the cache is not an error:
+    the dataset will simply be parsed again on the next run.
+
+    Parameters:
+        path (str): The path of the source file.
+        data (DataFrame): The dataset, with numeric time division columns.
+        selection (str | None):
+            The `column_selection_key` of the cached columns.
+    """
+
+    numeric_columns = [
+        column for column in data.columns
+        if str(column).isdigit() or is_float_dtype(data[column].dtype)
+    ]
+    native_label_columns = [
+        column for column in data.columns
+        if column not in numeric_columns
+        and isinstance(data[column].dtype, np.dtype)
+        and data[column].dtype != object
+    ]
+    label_columns = [
+        column for column in data.columns
+        if column not in numeric_columns
+        and column not in native_label_columns
+    ]
+    labels = data[label_columns]
+
+    try:
+        write_array_entry(
+            cache_entry_dir(path, selection),
+            {
+                "values": data[numeric_columns].to_numpy(dtype=np.float64),
+                "labels": labels.astype(str).to_numpy(dtype=str),
+                "labels_missing": labels.isna().to_numpy(),
+                **{
+                    f"native_labels_{i}": data[column].to_numpy()
+                    for i, column in enumerate(native_label_columns)
+                },
+            },
+            {
+                "source": os.path.abspath(path),
+                **file_signature(path),
+                "content_hash": file_digest(path),
+                "columns": list(data.columns),
+                "label_columns": label_columns,
+                "label_dtypes": [str(dtype) for dtype in labels.dtypes],
+                "native_label_columns": native_label_columns,
+                "numeric_columns": numeric_columns,
+            }
+        )
+    except OSError as error:
+        print(f"Warning: cache not written for {path}: {error}")
+
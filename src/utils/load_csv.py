@@ -1,23 +1,292 @@
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from .conversions import suffixed_strings_to_float
+from .data_cache import (column_selection_key, read_cached_dataset,
+                         write_cached_dataset)
 
-def load(path: str) -> DataFrame | None:
+
+# Decompressed on the fly by pandas (.zst requires the zstandard package)
+CSV_EXTENSIONS = (".csv", ".csv.gz", ".csv.bz2", ".csv.xz", ".csv.zst")
+
+
+def parse_timediv_columns(data: DataFrame) -> DataFrame:
+    """
+    Converts every time division column (named by a number, e.g. '1990')
+    of a freshly read dataset to float64, k/M/B suffixes included.
+
+    Args:
+        data (DataFrame): The dataset as read from the CSV.
+
+    Returns:
+        DataFrame: The same dataset, with numeric time division columns.
+    """
+
+    timediv_columns = [
+        column for column in data.columns
+        if str(column).isdigit()
+    ]
+    if not timediv_columns:
+        return data
+
+    parsed = DataFrame(
+        suffixed_strings_to_float(data[timediv_columns].to_numpy()),
+        columns=timediv_columns,
+        index=data.index
+    )
+
+    return pd.concat(
+        [data.drop(columns=timediv_columns), parsed],
+        axis=1
+    )[list(data.columns)]
+
+
+def is_long_layout(columns: list[str]) -> bool:
+    """
+    Tells whether a dataset is in the long layout, one observation
+    per row: (entity, time division, value) as its first three columns,
+    instead of the wide layout, one column per time division.
+
+    Args:
+        columns (list[str]): The column names.
+
+    Returns:
+        bool:
+            True if no column is named by a number (e.g. '1990')
+            and there are at least three columns.
+    """
+
+    return (
+        len(columns) >= 3
+        and not any(str(column).isdigit() for column in columns)
+    )
+
+
+def parse_long_columns(
+    data: DataFrame,
+    timediv_range: range | None = None
+) -> DataFrame:
+    """
+    Converts the time division and value columns of a freshly read
+    long layout dataset to float64 (k/M/B suffixes included), and drops
+    the observations outside `timediv_range` or without a time division.
+
+    Args:
+        data (DataFrame): The dataset as read from the CSV.
+        timediv_range (range | None):
+            The time divisions to keep (None: all of them).
+
+    Returns:
+        DataFrame:
+            The (entity, time division, value) columns of the dataset.
+    """
+
+    entity_column, time_column, value_column = data.columns[:3]
+    times = pd.to_numeric(data[time_column], errors="coerce").to_numpy(
+        dtype=np.float64
+    )
+    keep = np.isfinite(times) & (times == np.round(times))
+    if timediv_range is not None:
+        keep &= (
+            (times >= timediv_range.start)
+            & (times < timediv_range.stop)
+            & ((times - timediv_range.start) % timediv_range.step == 0)
+        )
+
+    return DataFrame(
+        {
+            entity_column: data[entity_column].to_numpy()[keep],
+            time_column: times[keep],
+            value_column: suffixed_strings_to_float(
+                data[value_column].to_numpy()[keep]
+            ),
+        },
+        copy=False
+    )
+
+
+def parse_dataset(
+    data: DataFrame,
+    timediv_range: range | None = None
+) -> DataFrame:
+    """
+    Converts a freshly read dataset (or chunk of it) to its numeric form,
+    whatever its layout (see `parse_timediv_columns`
+    and `parse_long_columns`).
+
+    Args:
+        data (DataFrame): The dataset as read from the CSV.
+        timediv_range (range | None):
+            For the long layout, the time divisions to keep
+            (the wide layout ones are selected when reading it).
+
+    Returns:
+        DataFrame: The dataset in its numeric form.
+    """
+
+    if is_long_layout(list(data.columns)):
+        return parse_long_columns(data, timediv_range)
+
+    return parse_timediv_columns(data)
+
+
+def read_csv_chunked(
+    path: str,
+    usecols: list[str] | None,
+    chunk_size: int,
+    timediv_range: range | None = None
+) -> DataFrame:
+    """
+    Streams a CSV file by chunks of rows, converting each chunk straight
+    into its numeric form (see `parse_dataset`), so that the raw
+    string form of at most `chunk_size` rows is held in memory at once.
+
+    Args:
+        path (str): The file path to the CSV.
+        usecols (list[str] | None): The columns to read (None: all).
+        chunk_size (int): The number of rows per chunk.
+        timediv_range (range | None): As in `parse_dataset`.
+
+    Returns:
+        DataFrame: The dataset in its numeric form.
+    """
+
+    columns = None
+    parts: dict[str, list[np.ndarray]] = {}
+    with pd.read_csv(path, usecols=usecols, chunksize=chunk_size) as reader:
+        for chunk in reader:
+            parsed = parse_dataset(chunk, timediv_range)
+            del chunk
+            if columns is None:
+                columns = list(parsed.columns)
+                parts = {column: [] for column in columns}
+            for column in columns:
+                parts[column].append(parsed[column].to_numpy())
+
+    if columns is None:
+        return parse_dataset(
+            pd.read_csv(path, usecols=usecols),
+            timediv_range
+        )
+
+    return DataFrame(
+        {column: np.concatenate(parts.pop(column)) for column in columns},
+        copy=False
+    )
+
+
+def select_columns(
+    columns: list[str],
+    label_columns: list[str] | None = None,
+    timediv_range: range | None = None
+) -> list[str]:
+    """
+    Selects, among the columns of a dataset, the ones to be read.
+
+    For a long layout dataset (see `is_long_layout`), these are its
+    (entity, time division, value) columns: its time divisions are
+    selected by row instead, when parsing it.
+
+    Args:
+        columns (list[str]): All the column names, in file order.
+        label_columns (list[str] | None):
+            The non time division columns to keep, if present
+            (None: all of them).
+        timediv_range (range | None):
+            The time divisions to keep (None: all of them).
+
+    Returns:
+        list[str]: The selected column names, in file order.
+    """
+
+    if is_long_layout(columns):
+        return list(columns[:3])
+
+    selected = []
+    for column in columns:
+        if str(column).isdigit():
+            if timediv_range is None or int(column) in timediv_range:
+                selected.append(column)
+        elif label_columns is None or column in label_columns:
+            selected.append(column)
+
+    return selected
+
+
+def load(
+    path: str,
+    use_cache: bool = True,
+    label_columns: list[str] | None = None,
+    timediv_range: range | None = None,
+    chunk_size: int | None = None
+) -> DataFrame | None:
     """
     Loads a CSV file, prints its dimensions,
     and returns its content as a DataFrame.
 
+    The time division columns (named by a number, e.g. '1990')
+    are returned already parsed to float (k/M/B suffixes included).
+    A long layout dataset, one (entity, time division, value)
+    observation per row (see `is_long_layout`), is returned
+    with float time division and value columns.
+    This parsed form is cached on disk (see `utils.data_cache`),
+    so that later loads of an unchanged file skip the CSV parsing.
+
+    The file may be compressed (see `CSV_EXTENSIONS`): it is then
+    decompressed as a stream while being parsed, never on disk, and
+    the cache makes the later loads skip the decompression too.
+
+    Only the columns selected by `label_columns` and `timediv_range`
+    are read, parsed and cached (see `select_columns`): the work and
+    the memory scale with the studied window, not with the file width.
+
     Args:
-        path (str): The file path to the CSV.
+        path (str): The file path to the CSV, possibly compressed.
+        use_cache (bool): False to ignore and not write the cache.
+        label_columns (list[str] | None):
+            The non time division columns to read, if present
+            (None: all of them).
+        timediv_range (range | None):
+            The time divisions to read (None: all of them).
+        chunk_size (int | None):
+            If set, the CSV is streamed by chunks of this number of rows
+            (see `read_csv_chunked`), which bounds the peak memory
+            of very large files. None reads it at once.
 
     Returns:
         DataFrame | None: The loaded dataset or None if an error occurred.
     """
 
-    if not path.endswith(".csv"):
-        raise ValueError("The file must be a CSV.")
+    if not path.endswith(CSV_EXTENSIONS):
+        raise ValueError(
+            f"The file must be a CSV ({', '.join(CSV_EXTENSIONS)})."
+        )
+
+    selection = column_selection_key(label_columns, timediv_range)
+    if use_cache:
+        data = read_cached_dataset(path, selection)
+        if data is not None:
+            return data
+
+    usecols = None
+    if selection is not None:
+        usecols = select_columns(
+            list(pd.read_csv(path, nrows=0).columns),
+            label_columns,
+            timediv_range
+        )
+
+    if chunk_size is None:
+        data = parse_dataset(
+            pd.read_csv(path, usecols=usecols),
+            timediv_range
+        )
+    else:
+        data = read_csv_chunked(path, usecols, chunk_size, timediv_range)
 
-    data = pd.read_csv(path)
+    if use_cache:
+        write_cached_dataset(path, data, selection)
 
     # print(f"Loading dataset of dimensions {data.shape}")
     # Deactivated for this exercise
@@ -0,0 +1,87 @@
+import numpy as np
+from scipy.stats import t as student_t
+
+# Same guard as scipy.stats.linregress against a division by zero
+# when the correlation coefficient is exactly -1 or 1.
+TINY = 1.0e-20
+
+
+def batch_linregress(
+    x: np.ndarray,
+    y: np.ndarray,
+    mask: np.ndarray | None = None
+) -> tuple[np.ndarray, ...]:
+    """
+    Computes one least-squares linear regression per row of `x` and `y`,
+    all of them in a single vectorized pass.
+
+    Every row gives the same numbers as `scipy.stats.linregress`
+    called on the masked cells of that row:
+    - r is clipped to [-1, 1], and is NaN (or 0.0) when x or y is constant,
+    - a row with exactly 2 points has a p-value of 0.0 (or 1.0 if
+    both y are equal) and a null standard error,
+    - rows with less than 2 points are filled with NaN.
+
+    Parameters:
+        x (np.ndarray):
+            2D array (rows × points) of independent values.
+        y (np.ndarray):
+            2D array of dependent values, same shape as `x`.
+        mask (np.ndarray | None):
+            2D boolean array, True where a point belongs to its row
+            regression. If None, every finite (x, y) pair is used.
+
+    Returns:
+        tuple[np.ndarray, ...]:
+            Six 1D arrays, one value per row:
+            slope, intercept, rvalue, pvalue, stderr and n.
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if mask is None:
+        mask = np.isfinite(x) & np.isfinite(y)
+
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+    n = mask.sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xmean = x.sum(axis=1) / n
+        ymean = y.sum(axis=1) / n
+        dx = np.where(mask, x - xmean[:, None], 0.0)
+        dy = np.where(mask, y - ymean[:, None], 0.0)
+
+        ssxm = (dx * dx).sum(axis=1) / n
+        ssym = (dy * dy).sum(axis=1) / n
+        ssxym = (dx * dy).sum(axis=1) / n
+
+        degenerate = (ssxm == 0.0) | (ssym == 0.0)
+        r = np.where(
+            degenerate,
+            np.where(ssxym == 0.0, np.nan, 0.0),
+            np.clip(ssxym / np.sqrt(ssxm * ssym), -1.0, 1.0)
+        )
+
+        slope = ssxym / ssxm
+        intercept = ymean - slope * xmean
+
+        df = n - 2.0
+        t_stat = r * np.sqrt(df / ((1.0 - r + TINY) * (1.0 + r + TINY)))
+        pvalue = 2.0 * student_t.sf(np.abs(t_stat), df)
+        stderr = np.sqrt((1.0 - r ** 2) * ssym / ssxm / df)
+
+    first = mask.argmax(axis=1)
+    second = mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1)
+    rows = np.arange(len(n))
+    two_points = n == 2
+    pvalue[two_points] = np.where(
+        y[rows, first] == y[rows, second], 1.0, 0.0
+    )[two_points]
+    stderr[two_points] = 0.0
+
+    too_few = n < 2
+    for array in (slope, intercept, r, pvalue, stderr):
+        array[too_few] = np.nan
+
+    return slope, intercept, r, pvalue, stderr, n
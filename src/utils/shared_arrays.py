@@ -0,0 +1,68 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+
+def share_array(
+    array: np.ndarray
+) -> tuple[SharedMemory, tuple]:
+    """
+    Copies an array into a new shared memory block,
+    so that worker processes can read it without any pickling.
+
+    The caller owns the block: it must `close()` and `unlink()` it
+    once the workers are done.
+
+    Args:
+        array (np.ndarray): The array to share.
+
+    Returns:
+        tuple[SharedMemory, tuple]:
+            The shared memory block, and the descriptor
+            (block name, shape, dtype, memory order)
+            to pass to `attach_array` in the workers.
+    """
+
+    order = "F" if array.flags.f_contiguous and array.ndim > 1 else "C"
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = np.ndarray(
+        array.shape,
+        dtype=array.dtype,
+        buffer=shm.buf,
+        order=order
+    )
+    shared[...] = array
+
+    return shm, (shm.name, array.shape, array.dtype.str, order)
+
+
+def attach_array(
+    descriptor: tuple
+) -> tuple[SharedMemory, np.ndarray]:
+    """
+    Maps, in a worker process, an array shared with `share_array`.
+
+    The worker must only `close()` the returned block (never unlink it),
+    and must not use the array afterwards.
+
+    Args:
+        descriptor (tuple): The descriptor returned by `share_array`.
+
+    Returns:
+        tuple[SharedMemory, np.ndarray]:
+            The attached shared memory block,
+            and a read-only array view on it.
+    """
+
+    name, shape, dtype, order = descriptor
+    shm = SharedMemory(name=name)
+
+    array = np.ndarray(
+        shape,
+        dtype=np.dtype(dtype),
+        buffer=shm.buf,
+        order=order
+    )
+    array.flags.writeable = False
+
+    return shm, array
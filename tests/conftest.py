@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The program is run from its sources (python3 src/main.py),
+# so are its tests
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+)
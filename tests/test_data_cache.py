@@ -0,0 +1,63 @@
+import os
+
+import numpy as np
+import pytest
+
+import utils.data_cache as data_cache
+from utils import (precompute_entry_dir, prune_precompute_entries,
+                   read_array_entry, write_array_entry)
+
+
+def test_rewritten_entry_replaces_the_old_one(tmp_path):
+    entry_dir = str(tmp_path / "entry")
+    write_array_entry(entry_dir, {"a": np.arange(3), "b": np.ones(2)}, {})
+    write_array_entry(entry_dir, {"a": np.arange(5)}, {"run": 2})
+
+    arrays, meta = read_array_entry(entry_dir)
+
+    assert meta["run"] == 2
+    assert list(arrays) == ["a"]
+    np.testing.assert_array_equal(arrays["a"], np.arange(5))
+    assert sorted(os.listdir(entry_dir)) == ["a.npy", "meta.json"]
+    assert os.listdir(tmp_path) == ["entry"]
+
+
+def test_failed_write_keeps_the_old_entry(tmp_path, monkeypatch):
+    entry_dir = str(tmp_path / "entry")
+    write_array_entry(entry_dir, {"a": np.arange(3)}, {"run": 1})
+
+    def failing_save(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(data_cache.np, "save", failing_save)
+    with pytest.raises(OSError):
+        write_array_entry(entry_dir, {"a": np.arange(5)}, {"run": 2})
+    monkeypatch.undo()
+
+    arrays, meta = read_array_entry(entry_dir)
+
+    assert meta["run"] == 1
+    np.testing.assert_array_equal(arrays["a"], np.arange(3))
+    assert os.listdir(tmp_path) == ["entry"]
+
+
+def test_prune_keeps_other_sources(tmp_path):
+    anchor_path = str(tmp_path / "data_x.csv")
+    for key, sources in (("old", "a"), ("new", "a"), ("other", "b")):
+        write_array_entry(
+            precompute_entry_dir(anchor_path, key),
+            {"a": np.arange(3)},
+            {"sources": sources}
+        )
+    write_array_entry(
+        precompute_entry_dir(anchor_path, "legacy"),
+        {"a": np.arange(3)},
+        {}
+    )
+
+    prune_precompute_entries(anchor_path, "new", "a")
+
+    assert sorted(os.listdir(tmp_path / ".cache")) == [
+        "precompute-new",
+        "precompute-other",
+    ]
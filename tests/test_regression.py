@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+from scipy.stats import linregress
+
+from utils import batch_linregress
+
+FIELDS = ("slope", "intercept", "rvalue", "pvalue", "stderr")
+
+
+def scipy_row(x: np.ndarray, y: np.ndarray) -> tuple[float, ...]:
+    """Returns the `scipy.stats.linregress` fields compared per row."""
+
+    result = linregress(x, y)
+
+    return tuple(float(getattr(result, field)) for field in FIELDS)
+
+
+def assert_rows_match_scipy(
+    x: np.ndarray,
+    y: np.ndarray,
+    mask: np.ndarray
+) -> None:
+    """Checks every row of `batch_linregress` with at least 2 points."""
+
+    results = batch_linregress(x, y, mask)
+
+    np.testing.assert_array_equal(results[5], mask.sum(axis=1))
+    for row in np.flatnonzero(mask.sum(axis=1) >= 2):
+        expected = scipy_row(x[row, mask[row]], y[row, mask[row]])
+        actual = tuple(float(values[row]) for values in results[:5])
+        np.testing.assert_allclose(
+            actual,
+            expected,
+            rtol=1e-9,
+            atol=1e-12,
+            equal_nan=True,
+            err_msg=f"row {row}"
+        )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_masked_batches(seed):
+    rng = np.random.default_rng(seed)
+    shape = (40, 25)
+    x = rng.lognormal(8.0, 1.5, shape)
+    y = 50.0 + 3.0 * np.log10(x) + rng.normal(0.0, 5.0, shape)
+    mask = rng.random(shape) < rng.uniform(0.1, 1.0, (shape[0], 1))
+
+    assert_rows_match_scipy(x, y, mask)
+    assert_rows_match_scipy(np.log10(x), y, mask)
+
+
+def test_two_points():
+    x = np.array([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0], [1.0, 2.0, 3.0]])
+    y = np.array([[4.0, 9.0, 0.0], [5.0, 0.0, 5.0], [0.0, 7.0, 1.0]])
+    mask = np.array([
+        [True, True, False],
+        [True, False, True],
+        [False, True, True],
+    ])
+
+    slope, _, _, pvalue, stderr, n = batch_linregress(x, y, mask)
+
+    np.testing.assert_array_equal(n, [2, 2, 2])
+    np.testing.assert_array_equal(pvalue, [0.0, 1.0, 0.0])
+    np.testing.assert_array_equal(stderr, [0.0, 0.0, 0.0])
+    np.testing.assert_allclose(slope, [5.0, 0.0, -6.0])
+    assert_rows_match_scipy(x, y, mask)
+
+
+@pytest.mark.parametrize("nb_points", [0, 1])
+def test_less_than_two_points(nb_points):
+    x = np.arange(12.0).reshape(3, 4)
+    y = x ** 2
+    mask = np.zeros(x.shape, dtype=bool)
+    mask[:, :nb_points] = True
+
+    results = batch_linregress(x, y, mask)
+
+    for values in results[:5]:
+        assert np.isnan(values).all()
+    np.testing.assert_array_equal(results[5], [nb_points] * 3)
+
+
+def test_empty_row_among_full_rows():
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=(3, 10))
+    y = 2.0 * x + rng.normal(size=(3, 10))
+    mask = np.ones(x.shape, dtype=bool)
+    mask[1] = False
+
+    results = batch_linregress(x, y, mask)
+
+    assert all(np.isnan(values[1]) for values in results[:5])
+    assert_rows_match_scipy(x, y, mask)
+
+
+def test_constant_x():
+    x = np.array([[3.0] * 5, [1.0, 2.0, 3.0, 4.0, 5.0]])
+    y = np.array([[1.0, 4.0, 2.0, 8.0, 5.0], [1.0, 4.0, 2.0, 8.0, 5.0]])
+    mask = np.ones(x.shape, dtype=bool)
+
+    slope, intercept, rvalue, pvalue, stderr, _ = batch_linregress(
+        x, y, mask
+    )
+
+    # scipy refuses a constant x, the batch leaves its row undefined
+    with pytest.raises(ValueError):
+        linregress(x[0], y[0])
+    for values in (slope, intercept, rvalue, pvalue, stderr):
+        assert np.isnan(values[0])
+    assert_rows_match_scipy(x[1:], y[1:], mask[1:])
+
+
+def test_constant_y():
+    x = np.array([[1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 3.0, 4.0]])
+    y = np.array([[7.0] * 4, [1.0, 3.0, 2.0, 5.0]])
+    mask = np.ones(x.shape, dtype=bool)
+
+    assert_rows_match_scipy(x, y, mask)
+
+
+def test_perfect_correlation():
+    x = np.array([[1.0, 2.0, 3.0, 4.0, 5.0], [1.0, 2.0, 3.0, 4.0, 5.0]])
+    y = np.array([2.0, -3.0])[:, None] * x + 1.0
+    mask = np.ones(x.shape, dtype=bool)
+
+    _, _, rvalue, _, _, _ = batch_linregress(x, y, mask)
+
+    np.testing.assert_array_equal(rvalue, [1.0, -1.0])
+    assert_rows_match_scipy(x, y, mask)
+
+
+def test_default_mask_skips_non_finite_pairs():
+    x = np.array([[1.0, 2.0, np.nan, 4.0, 5.0, 6.0]])
+    y = np.array([[2.0, 3.5, 1.0, np.inf, 9.0, 11.0]])
+
+    results = batch_linregress(x, y)
+
+    assert results[5][0] == 4
+    assert_rows_match_scipy(x, y, np.isfinite(x) & np.isfinite(y))
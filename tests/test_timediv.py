@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from classes import TimeDiv
+
+ESSENTIALS = ("data_x", "data_y", "data_point_size")
+NB_ENTITIES = 40
+
+
+def random_dense(
+    rng: np.random.Generator,
+    fill: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns random values (NaN when missing) and a presence mask."""
+
+    values = rng.normal(size=NB_ENTITIES)
+    values[rng.random(NB_ENTITIES) > fill] = np.nan
+    present = rng.random(NB_ENTITIES) < 0.9
+
+    return values, present
+
+
+def as_observations(
+    values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the non-missing values and their sorted entity codes."""
+
+    codes = np.flatnonzero(~np.isnan(values)).astype(np.int32)
+
+    return values[codes], codes
+
+
+def aligned_pair(seed: int, sparse: set[str]) -> tuple[dict, dict]:
+    """
+    Returns the same random time division data twice: every dataset
+    dense, then the datasets of `sparse` given as observations.
+    """
+
+    rng = np.random.default_rng(seed)
+    dense, mixed = {}, {}
+    for key, fill in zip(ESSENTIALS + ("extra",), (0.8, 0.7, 0.9, 0.2)):
+        values, present = random_dense(rng, fill)
+        dense[key] = (key, values, present, None)
+        if key in sparse:
+            observed, codes = as_observations(values)
+            mixed[key] = (key, observed, present, codes)
+        else:
+            mixed[key] = dense[key]
+
+    return dense, mixed
+
+
+def merged(aligned_data: dict, rows: np.ndarray) -> pd.DataFrame:
+    """Returns the merged data of a TimeDiv built from `rows`."""
+
+    timediv = TimeDiv("country", 2000, essentials=list(ESSENTIALS))
+    timediv.set_merged_rows(
+        pd.Index([f"c{code}" for code in range(NB_ENTITIES)]),
+        aligned_data,
+        rows
+    )
+
+    return timediv.merged_data
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize(
+    "sparse",
+    [{"extra"}, {"data_y"}, {"data_x", "data_point_size"},
+     set(ESSENTIALS) | {"extra"}]
+)
+@pytest.mark.parametrize("joined", [False, True])
+def test_sparse_merge_matches_dense(seed, sparse, joined):
+    dense, mixed = aligned_pair(seed, sparse)
+    joined_presence = None
+    if joined:
+        joined_presence = np.logical_and.reduce(
+            [dataset[2] for dataset in dense.values()]
+        )
+
+    expected = TimeDiv.valid_rows(
+        NB_ENTITIES, dense, ESSENTIALS, joined_presence
+    )
+    rows = TimeDiv.valid_rows(NB_ENTITIES, mixed, ESSENTIALS, joined_presence)
+
+    np.testing.assert_array_equal(rows, expected)
+    pd.testing.assert_frame_equal(
+        merged(mixed, rows),
+        merged(dense, expected)
+    )
+
+
+def test_gather_values_without_observations():
+    gathered = TimeDiv.gather_values(
+        np.array([], dtype=np.float32),
+        np.array([], dtype=np.int32),
+        np.array([1, 3])
+    )
+
+    assert gathered.dtype == np.float32
+    assert np.isnan(gathered).all()
+
+
+def test_valid_rows_requires_essentials():
+    dense, _ = aligned_pair(0, set())
+    dense["data_y"] = None
+
+    with pytest.raises(ValueError):
+        TimeDiv.valid_rows(NB_ENTITIES, dense, ESSENTIALS)